@@ -0,0 +1,536 @@
+"""
+Нагрузочные замеры бота. Запуск: python bench.py <сценарий> [опции]
+
+    db   — запросов к БД в секунду: пул соединений против соединения на каждый запрос
+    fsm  — память на 10 тыс. сессий заполнения документа: полный шаблон в сессии против doc_key
+    login — пропускная способность входа и задержка остальных апдейтов при хэшировании паролей
+    docx — документов в секунду: сборка через python-docx против готового каркаса пакета
+    docgen — все шаблоны каталога: задержки, пик памяти, размер файла, пропускная
+             способность на 1/4/N процессах; --save/--compare для базовой линии
+    webhook — приём апдейтов через webhook против локальной заглушки Bot API:
+              задержка подтверждения, время до ответа бота, проверка секрета
+
+Все сценарии работают с временной базой и не трогают jurist_bot.db.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import aiosqlite
+
+import db
+
+# ---------- db: пул соединений ----------
+class LegacyDB:
+    """Прежняя реализация db.py: новое соединение на каждый запрос."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    async def get_user(self, telegram_id: int):
+        async with aiosqlite.connect(self.path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute("SELECT * FROM users WHERE telegram_id = ?", (telegram_id,))
+            row = await cursor.fetchone()
+            return dict(row) if row else None
+
+    async def update_last_active(self, telegram_id: int):
+        async with aiosqlite.connect(self.path) as conn:
+            await conn.execute(
+                "UPDATE users SET last_active = CURRENT_TIMESTAMP WHERE telegram_id = ?",
+                (telegram_id,)
+            )
+            await conn.commit()
+
+    async def get_user_documents(self, telegram_id: int):
+        async with aiosqlite.connect(self.path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                "SELECT id, doc_name, created_at FROM documents WHERE telegram_id = ? ORDER BY created_at DESC",
+                (telegram_id,)
+            )
+            return [dict(row) for row in await cursor.fetchall()]
+
+async def _simulate_login(api, telegram_id: int, rounds: int) -> int:
+    """Повторяет запросы, которые делает вход в аккаунт и открытие «Мои документы»."""
+    for _ in range(rounds):
+        await api.get_user(telegram_id)            # check_password
+        await api.update_last_active(telegram_id)
+        await api.get_user(telegram_id)            # главное меню
+        await api.get_user_documents(telegram_id)
+    return rounds * 4
+
+async def _seed(path: str, users: int):
+    db.DB_PATH = path
+    await db.init_db()
+    for telegram_id in range(1, users + 1):
+        await db.create_user(telegram_id, "individual", f"User {telegram_id}", "user@example.com", "secret", "word")
+        await db.add_document(telegram_id, "sale_purchase", "Договор купли-продажи")
+    await db.close_db()
+
+async def _measure(api, users: int, rounds: int):
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_simulate_login(api, telegram_id, rounds) for telegram_id in range(1, users + 1)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+    queries = sum(r for r in results if isinstance(r, int))
+    errors = sum(1 for r in results if isinstance(r, Exception))
+    return queries / elapsed, errors
+
+async def bench_db(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.db")
+        await _seed(legacy_path, args.users)
+        # Прежняя база работала в журнальном режиме по умолчанию
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute("PRAGMA journal_mode = DELETE")
+        legacy_qps, legacy_errors = await _measure(LegacyDB(legacy_path), args.users, args.rounds)
+
+        pool_path = os.path.join(tmp, "pool.db")
+        await _seed(pool_path, args.users)
+        await db.init_db()
+        try:
+            pool_qps, pool_errors = await _measure(db, args.users, args.rounds)
+        finally:
+            await db.close_db()
+
+    print(f"Пользователей: {args.users}, повторов: {args.rounds}")
+    print(f"  соединение на запрос: {legacy_qps:10.0f} запросов/с (ошибок: {legacy_errors})")
+    print(f"  пул соединений:       {pool_qps:10.0f} запросов/с (ошибок: {pool_errors})")
+    print(f"  ускорение: x{pool_qps / legacy_qps:.1f}")
+
+# ---------- fsm: память сессий заполнения документа ----------
+def _rss_bytes() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+def _fill_session_data(layout: str, doc_info: tuple, answered: int) -> dict:
+    doc_key, doc_name, template_text, fields = doc_info
+    collected = {field["name"]: f"Ответ на поле {field['name']}" for field in fields[:answered]}
+    if layout == "full":
+        # Прежний формат: шаблон и поля копируются в каждую сессию
+        return {"doc_key": doc_key, "doc_name": doc_name, "template": template_text,
+                "fields": fields, "field_index": answered, "collected": collected}
+    return {"doc_key": doc_key, "field_index": answered, "collected": collected}
+
+async def _fill_sessions(path: str, layout: str, sessions: int, result):
+    from aiogram.fsm.storage.base import StorageKey
+    from catalog import DOCUMENTS_BY_KEY
+    from storage import SQLiteStorage
+
+    db.DB_PATH = path
+    await db.init_db()
+    storage = SQLiteStorage(cache_size=sessions)
+    docs = list(DOCUMENTS_BY_KEY.values())
+    before = _rss_bytes()
+    for user_id in range(1, sessions + 1):
+        doc_info = docs[user_id % len(docs)]
+        key = StorageKey(bot_id=1, chat_id=user_id, user_id=user_id)
+        await storage.set_state(key, "FillDocument:waiting_for_field")
+        await storage.set_data(key, _fill_session_data(layout, doc_info, len(doc_info[3]) // 2))
+    after = _rss_bytes()
+    await db.close_db()
+    result.put((after - before, os.path.getsize(path)))
+
+def _fill_sessions_process(path: str, layout: str, sessions: int, result):
+    asyncio.run(_fill_sessions(path, layout, sessions, result))
+
+async def bench_fsm(args):
+    # Каждый вариант в отдельном процессе, чтобы замеры RSS не влияли друг на друга
+    ctx = multiprocessing.get_context("spawn")
+    print(f"Сессий: {args.sessions}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout, title in (("full", "шаблон в сессии"), ("compact", "doc_key + курсор")):
+            result = ctx.Queue()
+            proc = ctx.Process(target=_fill_sessions_process,
+                               args=(os.path.join(tmp, f"{layout}.db"), layout, args.sessions, result))
+            proc.start()
+            rss, db_size = result.get()
+            proc.join()
+            print(f"  {title:18}: RSS +{rss / 2**20:7.1f} МБ, БД {db_size / 2**20:7.1f} МБ")
+
+# ---------- login: хэширование паролей ----------
+def _percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+async def _login_storm(verify, logins: int, salt: str, hash_value: str):
+    """Запускает logins входов одновременно и меряет задержку «обычных» апдейтов."""
+    lags = []
+    done = asyncio.Event()
+
+    async def update_probe():
+        # Имитация лёгкого апдейта другого пользователя: насколько он опаздывает
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - started - 0.005)
+
+    probes = [asyncio.create_task(update_probe()) for _ in range(20)]
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(verify("secret", salt, hash_value) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await asyncio.gather(*probes)
+    assert all(results)
+    return logins / elapsed, _percentile(lags, 0.99) * 1000
+
+async def bench_login(args):
+    import passwords
+
+    salt = os.urandom(16).hex()
+    legacy_hash = passwords._legacy_sha256("secret", salt)
+    scrypt_hash = passwords._scrypt("secret", salt, passwords.SCRYPT_N, passwords.SCRYPT_R, passwords.SCRYPT_P)
+
+    async def inline(password, salt, hash_value):
+        # Расчёт прямо в цикле событий, как делал прежний db.verify_password
+        return passwords._verify_sync(password, salt, hash_value)
+
+    print(f"Одновременных входов: {args.logins}, потоков хэширования: {passwords.HASH_WORKERS}")
+    for title, verify, hash_value in (
+        ("sha256 в цикле (было)", inline, legacy_hash),
+        ("scrypt в цикле", inline, scrypt_hash),
+        ("scrypt в пуле потоков", passwords.verify_password, scrypt_hash),
+    ):
+        rate, p99 = await _login_storm(verify, args.logins, salt, hash_value)
+        print(f"  {title:22}: {rate:8.1f} входов/с, p99 задержки апдейтов {p99:8.1f} мс")
+    passwords.shutdown()
+
+# ---------- docx: сборка документа ----------
+def legacy_generate_docx(template_text: str, data: dict):
+    """Прежняя сборка: подстановка через replace и объектная модель python-docx."""
+    from io import BytesIO
+    from docx import Document
+    from docx.shared import Pt
+
+    for key, value in data.items():
+        template_text = template_text.replace("{" + key + "}", value)
+    doc = Document()
+    for line in template_text.split('\n'):
+        if line.strip() == '':
+            doc.add_paragraph()
+        else:
+            p = doc.add_paragraph(line.strip())
+            for run in p.runs:
+                run.font.name = 'Times New Roman'
+                run.font.size = Pt(12)
+    file_stream = BytesIO()
+    doc.save(file_stream)
+    file_stream.seek(0)
+    return file_stream
+
+def _synthetic_values(fields: list, length: int = 40) -> dict:
+    filler = "Иванов Иван Иванович, г. Москва, ул. Ленина, д. 1 "
+    return {field["name"]: (filler * (length // len(filler) + 1))[:length] for field in fields}
+
+def _docs_per_second(generate, jobs: list, seconds: float) -> float:
+    done = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for args in jobs:
+            generate(*args).getvalue()
+        done += len(jobs)
+    return done / (time.perf_counter() - started)
+
+async def bench_docx(args):
+    import docgen
+    from catalog import DOCUMENTS_BY_KEY
+
+    legacy_jobs = [(text, _synthetic_values(fields)) for _, _, text, fields in DOCUMENTS_BY_KEY.values()]
+    fast_jobs = [(doc_key, values) for doc_key, (_, values) in zip(DOCUMENTS_BY_KEY, legacy_jobs)]
+    legacy = _docs_per_second(legacy_generate_docx, legacy_jobs, args.seconds)
+    fast = _docs_per_second(docgen.generate_document, fast_jobs, args.seconds)
+    print(f"Шаблонов: {len(legacy_jobs)}, по {args.seconds} с на вариант")
+    print(f"  python-docx:     {legacy:8.1f} документов/с")
+    print(f"  каркас пакета:   {fast:8.1f} документов/с")
+    print(f"  ускорение: x{fast / legacy:.1f}")
+
+# ---------- docgen: набор замеров по всему каталогу ----------
+# Профили значений полей: обычные ответы пользователей и намеренно неудобные
+# (длинные, со спецсимволами XML, фигурными скобками, управляющими символами)
+_REALISTIC_WORDS = ("Иванов", "Иван", "Иванович", "г.", "Москва", "ул.", "Ленина", "д.", "15",
+                    "ООО", "«Ромашка»", "ИНН", "7701234567", "01.02.2024", "100 000", "рублей")
+_ADVERSARIAL_CHUNKS = ("<w:p>", "&amp;", "\"'", "{city}", "{{", "}", "\t", "\n\n", "\x01\x0b",
+                       "😀", "Ё" * 40, " " * 20, "\r\n")
+
+def _profile_values(fields: list, profile: str, seed: int) -> dict:
+    rng = random.Random(seed)
+    values = {}
+    for field in fields:
+        if profile == "realistic":
+            values[field["name"]] = " ".join(rng.choice(_REALISTIC_WORDS) for _ in range(rng.randint(1, 8)))
+        else:
+            values[field["name"]] = "".join(rng.choice(_ADVERSARIAL_CHUNKS) for _ in range(rng.randint(100, 300)))
+    return values
+
+DOCGEN_PROFILES = ("realistic", "adversarial")
+
+def _render_size(doc_key: str, values: dict) -> int:
+    # Выполняется в процессах пула при замере пропускной способности
+    import docgen
+    return len(docgen.generate_document(doc_key, values).getvalue())
+
+def _measure_template(docgen, doc_key: str, values: dict, iterations: int) -> dict:
+    size = len(docgen.generate_document(doc_key, values).getvalue())     # прогрев
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        docgen.generate_document(doc_key, values).getvalue()
+        latencies.append(time.perf_counter() - started)
+    # Пик памяти — отдельным прогоном: tracemalloc замедляет сборку и исказил бы задержки
+    tracemalloc.start()
+    docgen.generate_document(doc_key, values).getvalue()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "p50_ms": _percentile(latencies, 0.5) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "peak_kib": peak / 1024,
+        "size_bytes": size,
+    }
+
+def _throughput(workers: int, jobs: list, seconds: float) -> float:
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=ctx) as executor:
+        list(executor.map(_render_size, *zip(*jobs[:workers])))      # запуск процессов
+        done = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < seconds:
+            done += sum(1 for _ in executor.map(_render_size, *zip(*jobs), chunksize=8))
+        return done / (time.perf_counter() - started)
+
+_DOCGEN_METRICS = ("p50_ms", "p95_ms", "p99_ms", "peak_kib", "size_bytes")
+
+def _compare_docgen(baseline: dict, result: dict, tolerance: float) -> list:
+    """Список ухудшений больше tolerance (доля) относительно базовой линии."""
+    regressions = []
+    for doc_key, profiles in result["templates"].items():
+        for profile, metrics in profiles.items():
+            before = baseline.get("templates", {}).get(doc_key, {}).get(profile)
+            if not before:
+                continue
+            for metric in _DOCGEN_METRICS:
+                old, new = before.get(metric), metrics[metric]
+                if old and new > old * (1 + tolerance):
+                    regressions.append(f"{doc_key}/{profile} {metric}: {old:.2f} -> {new:.2f} (+{(new / old - 1) * 100:.0f}%)")
+    for workers, rate in result["throughput"].items():
+        old = baseline.get("throughput", {}).get(workers)
+        if old and rate < old * (1 - tolerance):
+            regressions.append(f"throughput x{workers}: {old:.0f} -> {rate:.0f} документов/с ({(rate / old - 1) * 100:.0f}%)")
+    return regressions
+
+async def bench_docgen(args):
+    import docgen
+    from catalog import DOCUMENTS_BY_KEY
+
+    result = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "iterations": args.iterations,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "templates": {},
+        "throughput": {},
+    }
+    jobs = []
+    print(f"Шаблонов: {len(DOCUMENTS_BY_KEY)}, повторов на шаблон: {args.iterations}")
+    print(f"  {'шаблон':32} {'профиль':12} {'p50 мс':>8} {'p95 мс':>8} {'p99 мс':>8} {'пик КиБ':>9} {'размер':>8}")
+    for seed, (doc_key, (_, _, _, fields)) in enumerate(DOCUMENTS_BY_KEY.items()):
+        result["templates"][doc_key] = {}
+        for profile in DOCGEN_PROFILES:
+            values = _profile_values(fields, profile, seed)
+            metrics = _measure_template(docgen, doc_key, values, args.iterations)
+            result["templates"][doc_key][profile] = metrics
+            if profile == "realistic":
+                jobs.append((doc_key, values))
+            print(f"  {doc_key:32} {profile:12} {metrics['p50_ms']:8.2f} {metrics['p95_ms']:8.2f} "
+                  f"{metrics['p99_ms']:8.2f} {metrics['peak_kib']:9.1f} {metrics['size_bytes']:8}")
+
+    for workers in sorted({1, 4, os.cpu_count() or 1}):
+        rate = _throughput(workers, jobs, args.seconds)
+        result["throughput"][str(workers)] = rate
+        print(f"  процессов {workers:2}: {rate:8.1f} документов/с")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"Базовая линия сохранена в {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = _compare_docgen(baseline, result, args.tolerance)
+        if regressions:
+            print(f"Ухудшения относительно {args.compare} (порог {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"Ухудшений относительно {args.compare} нет (порог {args.tolerance:.0%})")
+
+# ---------- webhook: приём апдейтов от начала до конца ----------
+class FakeBotAPI:
+    """Локальная заглушка Bot API: отвечает на любые методы и считает вызовы."""
+
+    _TRUE_METHODS = {"setwebhook", "deletewebhook", "answercallbackquery", "deletemessage"}
+
+    def __init__(self):
+        self.calls = {}
+        self.replies = asyncio.Event()
+        self.expected_replies = 0
+        self._message_id = 0
+
+    def _message(self, chat_id) -> dict:
+        self._message_id += 1
+        return {
+            "message_id": self._message_id, "date": int(time.time()),
+            "chat": {"id": int(chat_id or 1), "type": "private"},
+            "photo": [{"file_id": f"photo{self._message_id}", "file_unique_id": f"u{self._message_id}",
+                       "width": 1, "height": 1}],
+        }
+
+    async def handle(self, request):
+        from aiohttp import web
+
+        method = request.match_info["method"].lower()
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if method == "getme":
+            result = {"id": 1, "is_bot": True, "first_name": "bench"}
+        elif method in self._TRUE_METHODS:
+            result = True
+        else:
+            form = await request.post()
+            result = self._message(form.get("chat_id"))
+            if method in ("sendmessage", "sendphoto"):
+                if sum(self.calls.get(m, 0) for m in ("sendmessage", "sendphoto")) >= self.expected_replies:
+                    self.replies.set()
+        return web.json_response({"ok": True, "result": result})
+
+def _start_update(update_id: int, user_id: int) -> dict:
+    user = {"id": user_id, "is_bot": False, "first_name": f"User {user_id}"}
+    return {"update_id": update_id, "message": {
+        "message_id": update_id, "date": int(time.time()), "chat": {"id": user_id, "type": "private"},
+        "from": user, "text": "/start", "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+    }}
+
+async def bench_webhook(args):
+    import aiohttp
+    from aiohttp import web
+    from aiogram import Bot
+    from aiogram.client.session.aiohttp import AiohttpSession
+    from aiogram.client.telegram import TelegramAPIServer
+
+    import main
+    import media
+    import webhook
+
+    fake = FakeBotAPI()
+    fake.expected_replies = args.updates
+    fake_app = web.Application()
+    fake_app.router.add_route("POST", "/bot{token}/{method}", fake.handle)
+    fake_runner = web.AppRunner(fake_app)
+    await fake_runner.setup()
+    await web.TCPSite(fake_runner, "127.0.0.1", 8765).start()
+
+    secret = "bench-secret"
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_PATH = os.path.join(tmp, "webhook.db")
+        await db.init_db()
+        media.build_manifest()
+        bot = Bot("123456:bench", session=AiohttpSession(api=TelegramAPIServer.from_base("http://127.0.0.1:8765")))
+        app, handler = webhook.create_app(main.create_dispatcher(), bot, secret_token=secret,
+                                          max_concurrent=args.concurrency)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 8766).start()
+        url = f"http://127.0.0.1:8766{webhook.WEBHOOK_PATH}"
+        try:
+            async with aiohttp.ClientSession() as client:
+                async with client.post(url, json=_start_update(0, 1), headers={
+                    "X-Telegram-Bot-Api-Secret-Token": "wrong"}) as response:
+                    assert response.status == 401, response.status
+
+                acks = []
+
+                async def deliver(update_id):
+                    started = time.perf_counter()
+                    async with client.post(url, json=_start_update(update_id, 1000 + update_id),
+                                           headers={"X-Telegram-Bot-Api-Secret-Token": secret}) as response:
+                        assert response.status == 200, response.status
+                    acks.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(deliver(i) for i in range(1, args.updates + 1)))
+                acked = time.perf_counter() - started
+                await asyncio.wait_for(fake.replies.wait(), timeout=60)
+                processed = time.perf_counter() - started
+        finally:
+            await runner.cleanup()
+            await fake_runner.cleanup()
+            await db.close_db()
+
+    print(f"Апдейтов: {args.updates}, обработчиков одновременно: {args.concurrency}")
+    print(f"  подтверждение: p50 {_percentile(acks, 0.5) * 1000:6.1f} мс, p99 {_percentile(acks, 0.99) * 1000:6.1f} мс")
+    print(f"  все приняты за {acked:.2f} с, все ответы отправлены за {processed:.2f} с "
+          f"({args.updates / processed:.0f} апдейтов/с)")
+    print(f"  вызовы Bot API: {fake.calls}")
+    print(f"  webhook: {handler.stats()}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="scenario", required=True)
+
+    p = sub.add_parser("db", help="пул соединений против соединения на запрос")
+    p.add_argument("--users", type=int, default=500)
+    p.add_argument("--rounds", type=int, default=3)
+    p.set_defaults(func=bench_db)
+
+    p = sub.add_parser("fsm", help="память сессий заполнения документа")
+    p.add_argument("--sessions", type=int, default=10000)
+    p.set_defaults(func=bench_fsm)
+
+    p = sub.add_parser("login", help="хэширование паролей при массовом входе")
+    p.add_argument("--logins", type=int, default=200)
+    p.set_defaults(func=bench_login)
+
+    p = sub.add_parser("docx", help="скорость сборки .docx")
+    p.add_argument("--seconds", type=float, default=3.0)
+    p.set_defaults(func=bench_docx)
+
+    p = sub.add_parser("docgen", help="замеры сборки по всем шаблонам каталога")
+    p.add_argument("--iterations", type=int, default=50)
+    p.add_argument("--seconds", type=float, default=2.0, help="длительность замера пропускной способности")
+    p.add_argument("--save", metavar="FILE", help="сохранить результат как базовую линию (JSON)")
+    p.add_argument("--compare", metavar="FILE", help="сравнить с базовой линией")
+    p.add_argument("--tolerance", type=float, default=0.25, help="допустимое ухудшение, доля (0.25 = 25%%)")
+    p.set_defaults(func=bench_docgen)
+
+    p = sub.add_parser("webhook", help="webhook против локальной заглушки Bot API")
+    p.add_argument("--updates", type=int, default=500)
+    p.add_argument("--concurrency", type=int, default=100)
+    p.set_defaults(func=bench_webhook)
+
+    args = parser.parse_args()
+    asyncio.run(args.func(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Пакетная сборка документов: одна строка CSV/JSONL — один документ.
+Колонки (ключи JSON) совпадают с именами полей шаблона.
+
+    python bulk.py <doc_key> <файл.csv|файл.jsonl> [-o архив.zip] [--workers N]
+
+Тот же модуль использует бот (пакетное создание для юридических лиц).
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog import DOCUMENTS_BY_KEY
+
+# ---------- Разбор входного файла ----------
+BULK_MAX_ROWS = 1000
+BULK_MAX_FILE_BYTES = 5 * 2**20
+# Сколько документов собирается одновременно при записи архива (CLI)
+BULK_WINDOW = (os.cpu_count() or 1) * 2
+
+class BulkError(ValueError):
+    """Ошибка во входном файле; текст показывается пользователю."""
+
+def _csv_rows(lines):
+    # Разделитель определяем по заголовку: Excel в русской локали сохраняет «;»
+    header = next(lines, "")
+    delimiter = max(",;\t", key=header.count)
+    reader = csv.DictReader(_chain(header, lines), delimiter=delimiter)
+    for row in reader:
+        if None in row:
+            raise BulkError(f"строка {reader.line_num}: лишние значения без заголовка")
+        yield reader.line_num, row
+
+def _chain(first: str, lines):
+    yield first
+    yield from lines
+
+def _jsonl_rows(lines):
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise BulkError(f"строка {line_num}: некорректный JSON ({e.msg})") from None
+        if not isinstance(row, dict):
+            raise BulkError(f"строка {line_num}: ожидается объект JSON")
+        yield line_num, row
+
+def read_rows(lines, filename: str, doc_key: str, max_rows: int = BULK_MAX_ROWS):
+    """
+    Генератор словарей значений полей по строкам файла.
+    lines — итерируемый источник строк текста (открытый файл, StringIO);
+    max_rows=None снимает ограничение на число строк.
+    """
+    _, _, _, fields = DOCUMENTS_BY_KEY[doc_key]
+    field_names = [field["name"] for field in fields]
+    lines = iter(lines)
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".csv":
+        rows = _csv_rows(lines)
+    elif extension in (".jsonl", ".ndjson"):
+        rows = _jsonl_rows(lines)
+    else:
+        raise BulkError("поддерживаются файлы .csv и .jsonl")
+
+    count = 0
+    for line_num, row in rows:
+        unknown = [name for name in row if name not in field_names]
+        if unknown:
+            raise BulkError(f"строка {line_num}: неизвестные поля {', '.join(map(str, unknown))}")
+        values = {name: str(row.get(name) or "").strip() for name in field_names}
+        empty = [name for name, value in values.items() if not value]
+        if empty:
+            raise BulkError(f"строка {line_num}: не заполнены поля {', '.join(empty)}")
+        count += 1
+        if max_rows is not None and count > max_rows:
+            raise BulkError(f"не больше {max_rows} строк в одном файле")
+        yield values
+
+def parse_upload(data: bytes, filename: str, doc_key: str) -> list:
+    """Разбирает загруженный файл целиком, чтобы ошибки были видны до начала сборки."""
+    if len(data) > BULK_MAX_FILE_BYTES:
+        raise BulkError(f"файл больше {BULK_MAX_FILE_BYTES // 2**20} МБ")
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise BulkError("файл должен быть в кодировке UTF-8") from None
+    rows = list(read_rows(io.StringIO(text, newline=None), filename, doc_key))
+    if not rows:
+        raise BulkError("в файле нет строк с данными")
+    return rows
+
+def sample_csv(doc_key: str) -> bytes:
+    """CSV с заголовком из имён полей — заготовка для заполнения."""
+    _, _, _, fields = DOCUMENTS_BY_KEY[doc_key]
+    stream = io.StringIO()
+    csv.writer(stream, delimiter=";").writerow(field["name"] for field in fields)
+    return stream.getvalue().encode("utf-8-sig")
+
+# ---------- Запись архива ----------
+async def write_archive(rows, doc_key: str, fileobj, render, window: int = BULK_WINDOW,
+                        progress=None) -> int:
+    """
+    Собирает документы по строкам и пишет их в ZIP по мере готовности.
+    render(values) — корутина, возвращающая байты .docx. Одновременно в работе
+    не больше window документов, поэтому память не растёт с числом строк.
+    progress(written) — корутина, вызывается после каждого записанного документа.
+    Возвращает число записанных документов.
+    """
+    pending = deque()
+    written = 0
+    # .docx уже сжат, повторное сжатие только тратит процессор
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_STORED) as archive:
+        async def flush_one():
+            nonlocal written
+            index, task = pending.popleft()
+            archive.writestr(f"{doc_key}_{index:04d}.docx", await task)
+            written += 1
+            if progress is not None:
+                await progress(written)
+
+        try:
+            for index, values in enumerate(rows, 1):
+                pending.append((index, asyncio.ensure_future(render(values))))
+                if len(pending) >= window:
+                    await flush_one()
+            while pending:
+                await flush_one()
+        finally:
+            for _, task in pending:
+                task.cancel()
+    return written
+
+# ---------- Фоновая сборка в боте ----------
+# Пакет собирается в фоновой задаче: обработчик сразу возвращается, и очередь
+# апдейтов пользователя не стоит, пока идут сотни сборок. Ход сборки показывается
+# в отдельном сообщении с кнопкой отмены. Модули бота импортируются в функциях,
+# чтобы процессы-сборщики CLI их не загружали.
+BULK_PROGRESS_INTERVAL = 5          # секунд между обновлениями сообщения о ходе сборки
+
+_tasks = {}                          # telegram_id -> фоновая задача сборки
+
+async def _run_in_bot(bot, telegram_id: int, chat_id: int, doc_key: str, rows: list):
+    import tempfile
+
+    from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
+    from aiogram.types import FSInputFile
+
+    import docservice
+    import docstore
+    import keyboards
+
+    status = None
+    path = None
+    last_update = time.monotonic()
+
+    async def progress(written: int):
+        nonlocal last_update
+        if time.monotonic() - last_update < BULK_PROGRESS_INTERVAL:
+            return
+        last_update = time.monotonic()
+        try:
+            await bot.edit_message_text(f"⏳ Собрано {written} из {len(rows)}.", chat_id=chat_id,
+                                        message_id=status.message_id,
+                                        reply_markup=keyboards.get_bulk_cancel_keyboard())
+        except TelegramBadRequest as e:
+            logging.debug(f"Не удалось обновить ход пакетной сборки: {e}")
+
+    async def finish(text: str):
+        # Итог пишем в сообщение о ходе сборки, а если его не успели отправить — новым
+        try:
+            if status is None:
+                await bot.send_message(chat_id, text)
+            else:
+                await bot.edit_message_text(text, chat_id=chat_id, message_id=status.message_id)
+        except TelegramAPIError as e:
+            logging.debug(f"Не удалось сообщить об итоге пакетной сборки: {e}")
+
+    # Всё, что может упасть, — внутри try: иначе запись в _tasks не снимется
+    # и пользователь не сможет запустить новую сборку до перезапуска бота
+    try:
+        version = docstore.current_version(doc_key)
+        status = await bot.send_message(chat_id, f"⏳ Собираю документов: {len(rows)}.",
+                                        reply_markup=keyboards.get_bulk_cancel_keyboard())
+        fd, path = tempfile.mkstemp(suffix=".zip")
+        # Архив пишется на диск по мере сборки; одновременно собирается не больше
+        # DOCGEN_BACKGROUND_LIMIT документов пользователя
+        with os.fdopen(fd, "wb") as target:
+            count = await write_archive(
+                rows, doc_key, target,
+                lambda values: docstore.render(telegram_id, doc_key, version, values),
+                window=docservice.DOCGEN_BACKGROUND_LIMIT, progress=progress
+            )
+        await finish(f"✅ Собрано документов: {count}.")
+        await bot.send_document(chat_id, FSInputFile(path, filename=f"{doc_key}_{count}.zip"),
+                                caption=f"✅ Готово документов: {count}")
+    except asyncio.CancelledError:
+        await asyncio.shield(finish("❌ Пакетная сборка отменена."))
+        raise
+    except Exception as e:
+        logging.error(f"Ошибка пакетной сборки {doc_key} пользователя {telegram_id}: {e}")
+        await finish(f"❌ Ошибка при пакетной сборке: {e}")
+    finally:
+        if path is not None:
+            os.remove(path)
+        _tasks.pop(telegram_id, None)
+
+def start_bulk(bot, telegram_id: int, chat_id: int, doc_key: str, rows: list) -> bool:
+    """Запускает пакетную сборку в фоне; False, если у пользователя она уже идёт."""
+    if telegram_id in _tasks:
+        return False
+    _tasks[telegram_id] = asyncio.create_task(_run_in_bot(bot, telegram_id, chat_id, doc_key, rows))
+    return True
+
+def cancel_bulk(telegram_id: int) -> bool:
+    task = _tasks.get(telegram_id)
+    if task is None:
+        return False
+    task.cancel()
+    return True
+
+async def stop():
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+def _render_row(doc_key: str, values: dict) -> bytes:
+    # Выполняется в процессе-сборщике
+    import docgen
+    return docgen.generate_document(doc_key, values).getvalue()
+
+async def _run_cli(args):
+    loop = asyncio.get_running_loop()
+    executor = ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async def render(values):
+        return await loop.run_in_executor(executor, _render_row, args.doc_key, values)
+
+    started = time.perf_counter()
+    try:
+        with open(args.input, encoding="utf-8-sig", newline="") as source, open(args.output, "wb") as target:
+            rows = read_rows(source, args.input, args.doc_key, max_rows=None)
+            count = await write_archive(rows, args.doc_key, target, render, window=args.workers * 2)
+    finally:
+        executor.shutdown(cancel_futures=True)
+    print(f"{count} документов записано в {args.output} за {time.perf_counter() - started:.1f} с")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("doc_key", choices=sorted(DOCUMENTS_BY_KEY), metavar="doc_key")
+    parser.add_argument("input")
+    parser.add_argument("-o", "--output")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    args.output = args.output or os.path.splitext(args.input)[0] + ".zip"
+    try:
+        asyncio.run(_run_cli(args))
+    except BulkError as e:
+        os.remove(args.output)
+        sys.exit(f"Ошибка во входном файле: {e}")
+
+if __name__ == "__main__":
+    main()
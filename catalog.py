@@ -0,0 +1,268 @@
+"""
+Каталог шаблонов документов.
+
+    catalog/categories.json — категории (id -> название)
+    catalog/documents.jsonl — по документу на строку:
+        {"key", "category", "name", "template", "fields"}
+    catalog/index.json      — индекс: ключ -> категория, название, число полей,
+                              версия шаблона, смещение и длина строки в documents.jsonl
+    catalog/templates/      — правки без перезапуска: <doc_key>.json в том же формате,
+                              что строка documents.jsonl; заменяет или добавляет документ
+
+При старте читается только индекс; текст шаблона и поля документа разбираются
+из отображённого в память файла при первом обращении. watch_templates()
+периодически перечитывает изменённые файлы и подменяет каталог целиком.
+
+    python catalog.py index — пересобрать индекс после правки documents.jsonl
+    python catalog.py check — проверить все шаблоны
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import NamedTuple
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog")
+CATEGORIES_FILE = os.path.join(CATALOG_DIR, "categories.json")
+DOCUMENTS_FILE = os.path.join(CATALOG_DIR, "documents.jsonl")
+INDEX_FILE = os.path.join(CATALOG_DIR, "index.json")
+TEMPLATES_DIR = os.path.join(CATALOG_DIR, "templates")
+TEMPLATES_REFRESH_INTERVAL = 10     # секунд между проверками изменений
+# Сколько разобранных документов держать в памяти
+CATALOG_CACHE_SIZE = 32
+
+def template_version(template_text: str) -> str:
+    """Идентификатор версии шаблона — хэш его текста."""
+    return hashlib.sha256(template_text.encode("utf-8")).hexdigest()[:16]
+
+class IndexEntry(NamedTuple):
+    key: str
+    category: str
+    name: str
+    field_count: int
+    version: str
+    offset: int
+    length: int
+
+# ---------- Индекс ----------
+def _source_stamp(path: str) -> list:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def build_index(path: str = DOCUMENTS_FILE) -> dict:
+    """Проходит documents.jsonl и возвращает индекс со смещениями строк."""
+    entries = []
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                doc = json.loads(line)
+                entries.append([
+                    doc["key"], doc["category"], doc["name"], len(doc["fields"]),
+                    template_version(doc["template"]), offset, len(line),
+                ])
+            offset += len(line)
+    return {"source": _source_stamp(path), "documents": entries}
+
+def write_index(index: dict, path: str = INDEX_FILE):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+def load_index(path: str = DOCUMENTS_FILE, index_path: str = INDEX_FILE) -> dict:
+    """Индекс с диска; если documents.jsonl менялся после его сборки — пересобирается."""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("source") == _source_stamp(path):
+            return index
+    except (OSError, ValueError):
+        pass
+    logging.info("Индекс каталога устарел, пересобираю")
+    index = build_index(path)
+    try:
+        write_index(index, index_path)
+    except OSError as e:
+        logging.warning(f"Не удалось сохранить индекс каталога: {e}")
+    return index
+
+# ---------- Каталог ----------
+_OVERRIDE = -1                       # offset записи, взятой из catalog/templates
+
+class _Override(NamedTuple):
+    stamp: list
+    entry: IndexEntry
+    body: tuple
+
+def _validate(doc: dict):
+    # docgen импортирует каталог, поэтому импортируем его только при проверке
+    import docgen
+    docgen.CompiledTemplate(doc["template"], [field["name"] for field in doc["fields"]])
+
+def _read_override(path: str, stamp: list) -> _Override:
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    _validate(doc)
+    entry = IndexEntry(doc["key"], doc["category"], doc["name"], len(doc["fields"]),
+                       template_version(doc["template"]), _OVERRIDE, 0)
+    return _Override(stamp, entry, (doc["key"], doc["name"], doc["template"], doc["fields"]))
+
+class Catalog(Mapping):
+    """
+    Отображение doc_key -> (ключ, название, текст_шаблона, список_полей).
+    Метаданные берутся из индекса, тело документа читается лениво.
+    Новое состояние собирается отдельно и подменяется целиком в потоке
+    цикла событий, так что обработчики видят либо старый, либо новый каталог.
+    """
+
+    def __init__(self, path: str = DOCUMENTS_FILE, index_path: str = INDEX_FILE,
+                 templates_dir: str = TEMPLATES_DIR, cache_size: int = CATALOG_CACHE_SIZE):
+        self.path = path
+        self.index_path = index_path
+        self.templates_dir = templates_dir
+        self._source = None
+        self._base = {}              # doc_key -> IndexEntry из documents.jsonl
+        self._overrides = {}         # путь файла -> _Override
+        self._override_bodies = {}   # doc_key -> тело документа из catalog/templates
+        self._entries = {}           # итоговый каталог: doc_key -> IndexEntry
+        self._mmap = None
+        # Ключ кэша — запись индекса целиком: после подмены шаблона старое тело не вернётся
+        self._load = lru_cache(maxsize=cache_size)(self._read)
+        self.reload()
+
+    # ----- перечитывание -----
+    def _scan(self) -> tuple:
+        """Читает изменённые файлы; текущее состояние не трогает (можно звать из потока)."""
+        source, base = self._source, self._base
+        if source != _source_stamp(self.path):
+            index = load_index(self.path, self.index_path)
+            source = index["source"]
+            base = {row[0]: IndexEntry(*row) for row in index["documents"]}
+
+        overrides = {}
+        try:
+            names = sorted(name for name in os.listdir(self.templates_dir) if name.endswith(".json"))
+        except FileNotFoundError:
+            names = []
+        for name in names:
+            path = os.path.join(self.templates_dir, name)
+            try:
+                stamp = _source_stamp(path)
+            except FileNotFoundError:
+                continue
+            previous = self._overrides.get(path)
+            if previous is not None and previous.stamp == stamp:
+                overrides[path] = previous
+                continue
+            # Разбираем и проверяем только новые и изменённые файлы
+            try:
+                overrides[path] = _read_override(path, stamp)
+            except Exception as e:
+                logging.error(f"Шаблон {name} не загружен: {e}")
+                if previous is not None:
+                    overrides[path] = previous
+        return source, base, overrides
+
+    def _apply(self, scan: tuple) -> list:
+        """Подменяет каталог; возвращает ключи изменившихся документов."""
+        source, base, overrides = scan
+        entries = dict(base)
+        override_bodies = {}
+        for override in overrides.values():
+            entries[override.entry.key] = override.entry
+            override_bodies[override.entry.key] = override.body
+        changed = {
+            key for key in entries.keys() | self._entries.keys()
+            if entries.get(key) != self._entries.get(key)
+        }
+        # Правка только подсказок полей не меняет запись индекса
+        changed.update(override.entry.key for path, override in overrides.items()
+                       if self._overrides.get(path) is not override)
+        if source != self._source:
+            self._mmap = None        # новое отображение откроется при первом чтении
+        self._source, self._base, self._overrides = source, base, overrides
+        self._override_bodies, self._entries = override_bodies, entries
+        return sorted(changed)
+
+    def reload(self) -> list:
+        return self._apply(self._scan())
+
+    async def reload_async(self) -> list:
+        return self._apply(await asyncio.to_thread(self._scan))
+
+    # ----- чтение -----
+    def _read(self, entry: IndexEntry) -> tuple:
+        if self._mmap is None:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        doc = json.loads(self._mmap[entry.offset:entry.offset + entry.length])
+        return doc["key"], doc["name"], doc["template"], doc["fields"]
+
+    def __getitem__(self, doc_key: str) -> tuple:
+        entry = self._entries[doc_key]
+        if entry.offset == _OVERRIDE:
+            return self._override_bodies[doc_key]
+        return self._load(entry)
+
+    def __contains__(self, doc_key) -> bool:
+        return doc_key in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entry(self, doc_key: str) -> IndexEntry:
+        return self._entries[doc_key]
+
+    def is_override(self, doc_key: str) -> bool:
+        """Документ взят из catalog/templates, а не из documents.jsonl."""
+        return self._entries[doc_key].offset == _OVERRIDE
+
+    def by_category(self, category: str) -> list:
+        return [entry for entry in self._entries.values() if entry.category == category]
+
+    def cache_info(self):
+        return self._load.cache_info()
+
+def _load_categories(path: str = CATEGORIES_FILE) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+CATEGORIES = _load_categories()
+DOCUMENTS_BY_KEY = Catalog()
+
+async def watch_templates(interval: float = TEMPLATES_REFRESH_INTERVAL):
+    """Периодически подхватывает изменённые шаблоны; файловые операции идут в отдельном потоке."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            changed = await DOCUMENTS_BY_KEY.reload_async()
+        except Exception as e:
+            logging.error(f"Ошибка обновления каталога шаблонов: {e}")
+            continue
+        if changed:
+            logging.info(f"Шаблоны обновлены: {', '.join(changed)}")
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "index":
+        index = build_index()
+        write_index(index)
+        print(f"Индекс пересобран: документов {len(index['documents'])}")
+    elif command == "check":
+        import docgen
+        docgen.compile_documents(DOCUMENTS_BY_KEY)
+        print(f"Шаблонов без ошибок: {len(DOCUMENTS_BY_KEY)}")
+    else:
+        sys.exit(__doc__)
+
+if __name__ == "__main__":
+    main()
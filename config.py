@@ -7,4 +7,38 @@ BOT_TOKEN = os.getenv("BOT_TOKEN")
 LAWYER_GROUP_ID = os.getenv("LAWYER_GROUP_ID")  # ID группы/канала для юристов (целое число, начинается с -100)
 
 if not BOT_TOKEN:
-    raise ValueError("BOT_TOKEN не найден в .env файле")
\ No newline at end of file
+    raise ValueError("BOT_TOKEN не найден в .env файле")
+
+# ---------- Получение апдейтов ----------
+# polling — долгий опрос getUpdates; webhook — HTTP-сервер, на который Telegram присылает апдейты
+BOT_MODE = os.getenv("BOT_MODE", "polling")
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")                  # публичный адрес, например https://bot.example.com/webhook
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8080"))
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")            # заголовок X-Telegram-Bot-Api-Secret-Token
+WEBHOOK_MAX_CONCURRENT = int(os.getenv("WEBHOOK_MAX_CONCURRENT", "100"))  # апдейтов в обработке одновременно
+WEBHOOK_MAX_PENDING = int(os.getenv("WEBHOOK_MAX_PENDING", "1000"))       # сверх этого отвечаем 503, Telegram повторит
+# Адрес Bot API: свой сервер telegram-bot-api или локальная заглушка для проверок
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL")
+
+if BOT_MODE not in ("polling", "webhook"):
+    raise ValueError(f"BOT_MODE должен быть polling или webhook, а не {BOT_MODE!r}")
+if BOT_MODE == "webhook" and not (WEBHOOK_URL and WEBHOOK_SECRET):
+    raise ValueError("Для BOT_MODE=webhook в .env нужны WEBHOOK_URL и WEBHOOK_SECRET")
+
+# ---------- Ограничение частоты запросов ----------
+# Маркерные корзины: rate — сколько апдейтов в секунду восстанавливается, burst — запас на серию.
+# Общая корзина пользователя расходуется на любой апдейт, корзина обработчика — только на свой.
+THROTTLE_RATE = float(os.getenv("THROTTLE_RATE", "2"))
+THROTTLE_BURST = int(os.getenv("THROTTLE_BURST", "10"))
+THROTTLE_HANDLERS = {               # имя функции-обработчика -> (rate, burst)
+    "auth_login": (0.2, 3),
+    "process_login_password": (0.2, 5),
+    "process_secret_word": (0.1, 3),
+    "show_my_docs": (0.5, 3),
+    "show_my_document": (1, 5),
+    "export_my_docs": (0.05, 2),
+    "bulk_process_file": (0.1, 2),
+    "process_question": (0.1, 3),
+}
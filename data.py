@@ -1,1338 +0,0 @@
-# data.py
-
-# Категории документов
-CATEGORIES = {
-    "contracts": "📄 Договоры и соглашения",
-    "procedural": "⚖️ Процессуальные документы",
-    "corporate": "🏢 Локальные акты и корпоративные документы",
-    "prejudicial": "📬 Досудебные документы",
-    "other": "📎 Прочие правовые бумаги",
-}
-
-# Документы с полным описанием:
-# Каждый элемент кортежа: (ключ, название, текст_шаблона, список_полей)
-# Поле: {"name": "имя_переменной", "prompt": "текст запроса", "type": "str"}
-DOCUMENTS = {
-
-    # ---------- Договоры и соглашения ----------
-    "contracts": [
-        # 1. Договор купли-продажи (уже был в примере)
-        ("sale_purchase", "Договор купли-продажи",
-         """ДОГОВОР КУПЛИ-ПРОДАЖИ
-г. {city}                                   «{date}»
-
-{full_name_seller}, именуем__ в дальнейшем «Продавец», с одной стороны, и
-{full_name_buyer}, именуем__ в дальнейшем «Покупатель», с другой стороны,
-заключили настоящий договор о нижеследующем:
-
-1. ПРЕДМЕТ ДОГОВОРА
-1.1. Продавец обязуется передать в собственность Покупателя, а Покупатель обязуется принять и оплатить следующее имущество:
-{property_description}
-1.2. Имущество принадлежит Продавцу на праве собственности на основании {ownership_basis}.
-
-2. ЦЕНА И ПОРЯДОК РАСЧЕТОВ
-2.1. Цена имущества составляет {price} ({price_text}) рублей.
-2.2. Покупатель оплачивает цену в следующем порядке: {payment_order}.
-
-3. ПРАВА И ОБЯЗАННОСТИ СТОРОН
-3.1. Продавец обязан передать имущество в срок до {transfer_deadline}.
-3.2. Покупатель обязан принять имущество и уплатить цену.
-
-4. ОТВЕТСТВЕННОСТЬ СТОРОН
-4.1. За нарушение срока передачи имущества Продавец уплачивает пеню в размере 0,1% от цены за каждый день просрочки.
-
-5. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-5.1. Договор составлен в двух экземплярах, имеющих одинаковую юридическую силу.
-5.2. Споры разрешаются в суде по месту нахождения ответчика.
-
-ПОДПИСИ СТОРОН:
-Продавец: ____________________ /{seller_signature}/
-Покупатель: ____________________ /{buyer_signature}/""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату договора (например, 15 мая 2024 г.):", "type": "str"},
-             {"name": "full_name_seller", "prompt": "Введите ФИО продавца:", "type": "str"},
-             {"name": "full_name_buyer", "prompt": "Введите ФИО покупателя:", "type": "str"},
-             {"name": "property_description", "prompt": "Опишите имущество (наименование, характеристики):", "type": "str"},
-             {"name": "ownership_basis", "prompt": "На каком основании имущество принадлежит продавцу (например, договор купли-продажи от ...):", "type": "str"},
-             {"name": "price", "prompt": "Введите цену цифрами:", "type": "str"},
-             {"name": "price_text", "prompt": "Введите цену прописью:", "type": "str"},
-             {"name": "payment_order", "prompt": "Укажите порядок оплаты (например, единовременно, в рассрочку и т.д.):", "type": "str"},
-             {"name": "transfer_deadline", "prompt": "Введите срок передачи имущества (например, до 1 июня 2024 г.):", "type": "str"},
-             {"name": "seller_signature", "prompt": "Введите расшифровку подписи продавца (ФИО):", "type": "str"},
-             {"name": "buyer_signature", "prompt": "Введите расшифровку подписи покупателя (ФИО):", "type": "str"},
-         ]),
-
-        # 2. Договор аренды
-        ("lease", "Договор аренды",
-         """ДОГОВОР АРЕНДЫ
-г. {city}                                   «{date}»
-
-{landlord_name}, именуем__ в дальнейшем «Арендодатель», с одной стороны, и
-{tenant_name}, именуем__ в дальнейшем «Арендатор», с другой стороны,
-заключили настоящий договор о нижеследующем:
-
-1. ПРЕДМЕТ ДОГОВОРА
-1.1. Арендодатель обязуется предоставить Арендатору за плату во временное владение и пользование следующее имущество:
-{property_description}
-Расположенное по адресу: {property_address}.
-
-1.2. Имущество принадлежит Арендодателю на праве собственности на основании {ownership_basis}.
-
-2. СРОК АРЕНДЫ
-2.1. Договор заключен на срок с {start_date} по {end_date}.
-
-3. АРЕНДНАЯ ПЛАТА И РАСЧЕТЫ
-3.1. Арендная плата составляет {rent_amount} ({rent_text}) рублей в месяц.
-3.2. Арендатор вносит плату ежемесячно не позднее {payment_day} числа текущего месяца.
-
-4. ПРАВА И ОБЯЗАННОСТИ СТОРОН
-4.1. Арендодатель обязан передать имущество по акту приема-передачи в срок до {transfer_deadline}.
-4.2. Арендатор обязан использовать имущество по назначению, своевременно вносить арендную плату.
-
-5. ОТВЕТСТВЕННОСТЬ
-5.1. За просрочку внесения арендной платы Арендатор уплачивает пеню в размере {penalty}% от суммы долга за каждый день просрочки.
-
-6. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-6.1. Договор составлен в двух экземплярах.
-6.2. Споры разрешаются в суде по месту нахождения имущества.
-
-ПОДПИСИ СТОРОН:
-Арендодатель: ____________________ /{landlord_signature}/
-Арендатор: ____________________ /{tenant_signature}/""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату договора:", "type": "str"},
-             {"name": "landlord_name", "prompt": "Введите ФИО или наименование арендодателя:", "type": "str"},
-             {"name": "tenant_name", "prompt": "Введите ФИО или наименование арендатора:", "type": "str"},
-             {"name": "property_description", "prompt": "Опишите имущество (квартира, комната, нежилое помещение и т.д.):", "type": "str"},
-             {"name": "property_address", "prompt": "Введите адрес имущества:", "type": "str"},
-             {"name": "ownership_basis", "prompt": "На каком основании имущество принадлежит арендодателю?", "type": "str"},
-             {"name": "start_date", "prompt": "Введите дату начала аренды:", "type": "str"},
-             {"name": "end_date", "prompt": "Введите дату окончания аренды:", "type": "str"},
-             {"name": "rent_amount", "prompt": "Введите сумму арендной платы в месяц (цифрами):", "type": "str"},
-             {"name": "rent_text", "prompt": "Введите сумму арендной платы прописью:", "type": "str"},
-             {"name": "payment_day", "prompt": "Введите число месяца, до которого нужно вносить плату (например, 10):", "type": "str"},
-             {"name": "transfer_deadline", "prompt": "Введите срок передачи имущества по акту (например, до 1 июня 2024 г.):", "type": "str"},
-             {"name": "penalty", "prompt": "Введите размер пени за просрочку (в % от суммы долга в день):", "type": "str"},
-             {"name": "landlord_signature", "prompt": "Введите расшифровку подписи арендодателя:", "type": "str"},
-             {"name": "tenant_signature", "prompt": "Введите расшифровку подписи арендатора:", "type": "str"},
-         ]),
-
-        # 3. Договор подряда
-        ("work_contract", "Договор подряда",
-         """ДОГОВОР ПОДРЯДА
-г. {city}                                   «{date}»
-
-{client_name}, именуем__ в дальнейшем «Заказчик», с одной стороны, и
-{contractor_name}, именуем__ в дальнейшем «Подрядчик», с другой стороны,
-заключили настоящий договор о нижеследующем:
-
-1. ПРЕДМЕТ ДОГОВОРА
-1.1. Подрядчик обязуется выполнить по заданию Заказчика следующую работу: {work_description}.
-1.2. Работа выполняется из материалов Подрядчика/Заказчика (нужное подчеркнуть): {materials_provider}.
-
-2. СРОКИ ВЫПОЛНЕНИЯ РАБОТ
-2.1. Начало работ: {start_date}
-2.2. Окончание работ: {end_date}
-
-3. ЦЕНА И ПОРЯДОК ОПЛАТЫ
-3.1. Цена работ составляет {price} ({price_text}) рублей.
-3.2. Оплата производится в следующем порядке: {payment_order}.
-
-4. ПРАВА И ОБЯЗАННОСТИ СТОРОН
-4.1. Подрядчик обязан выполнить работу качественно и в срок.
-4.2. Заказчик обязан принять результат работы и оплатить его.
-
-5. ПРИЕМКА РАБОТ
-5.1. Приемка работ оформляется актом сдачи-приемки, подписываемым сторонами.
-
-6. ОТВЕТСТВЕННОСТЬ
-6.1. За нарушение срока выполнения работ Подрядчик уплачивает пеню в размере {penalty}% от цены за каждый день просрочки.
-
-7. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-7.1. Договор составлен в двух экземплярах.
-
-ПОДПИСИ СТОРОН:
-Заказчик: ____________________ /{client_signature}/
-Подрядчик: ____________________ /{contractor_signature}/""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату договора:", "type": "str"},
-             {"name": "client_name", "prompt": "Введите ФИО или наименование заказчика:", "type": "str"},
-             {"name": "contractor_name", "prompt": "Введите ФИО или наименование подрядчика:", "type": "str"},
-             {"name": "work_description", "prompt": "Опишите подробно, какую работу должен выполнить подрядчик:", "type": "str"},
-             {"name": "materials_provider", "prompt": "Кто предоставляет материалы? (Подрядчик/Заказчик):", "type": "str"},
-             {"name": "start_date", "prompt": "Введите дату начала работ:", "type": "str"},
-             {"name": "end_date", "prompt": "Введите дату окончания работ:", "type": "str"},
-             {"name": "price", "prompt": "Введите цену работ цифрами:", "type": "str"},
-             {"name": "price_text", "prompt": "Введите цену работ прописью:", "type": "str"},
-             {"name": "payment_order", "prompt": "Укажите порядок оплаты (аванс, по факту, поэтапно):", "type": "str"},
-             {"name": "penalty", "prompt": "Введите размер пени за просрочку (% в день):", "type": "str"},
-             {"name": "client_signature", "prompt": "Введите расшифровку подписи заказчика:", "type": "str"},
-             {"name": "contractor_signature", "prompt": "Введите расшифровку подписи подрядчика:", "type": "str"},
-         ]),
-
-        # 4. Договор оказания услуг
-        ("services", "Договор оказания услуг",
-         """ДОГОВОР ВОЗМЕЗДНОГО ОКАЗАНИЯ УСЛУГ
-г. {city}                                   «{date}»
-
-{customer_name}, именуем__ в дальнейшем «Заказчик», с одной стороны, и
-{executor_name}, именуем__ в дальнейшем «Исполнитель», с другой стороны,
-заключили настоящий договор о нижеследующем:
-
-1. ПРЕДМЕТ ДОГОВОРА
-1.1. Исполнитель обязуется по заданию Заказчика оказать услуги: {service_description}.
-1.2. Заказчик обязуется оплатить эти услуги.
-
-2. СРОКИ ОКАЗАНИЯ УСЛУГ
-2.1. Срок оказания услуг: с {start_date} по {end_date}.
-
-3. СТОИМОСТЬ УСЛУГ И ПОРЯДОК РАСЧЕТОВ
-3.1. Стоимость услуг составляет {price} ({price_text}) рублей.
-3.2. Оплата производится: {payment_order}.
-
-4. ПРАВА И ОБЯЗАННОСТИ СТОРОН
-4.1. Исполнитель обязан оказать услуги лично/с привлечением третьих лиц (нужное подчеркнуть): {personal_execution}.
-4.2. Заказчик обязан оплатить услуги в установленный срок.
-
-5. ПРИЕМКА УСЛУГ
-5.1. По окончании оказания услуг стороны подписывают акт сдачи-приемки.
-
-6. ОТВЕТСТВЕННОСТЬ
-6.1. За нарушение срока оказания услуг Исполнитель уплачивает пеню в размере {penalty}% от стоимости за каждый день просрочки.
-
-7. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-7.1. Договор составлен в двух экземплярах.
-
-ПОДПИСИ СТОРОН:
-Заказчик: ____________________ /{customer_signature}/
-Исполнитель: ____________________ /{executor_signature}/""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату договора:", "type": "str"},
-             {"name": "customer_name", "prompt": "Введите ФИО или наименование заказчика:", "type": "str"},
-             {"name": "executor_name", "prompt": "Введите ФИО или наименование исполнителя:", "type": "str"},
-             {"name": "service_description", "prompt": "Опишите, какие услуги должны быть оказаны:", "type": "str"},
-             {"name": "start_date", "prompt": "Введите дату начала оказания услуг:", "type": "str"},
-             {"name": "end_date", "prompt": "Введите дату окончания оказания услуг:", "type": "str"},
-             {"name": "price", "prompt": "Введите стоимость услуг цифрами:", "type": "str"},
-             {"name": "price_text", "prompt": "Введите стоимость услуг прописью:", "type": "str"},
-             {"name": "payment_order", "prompt": "Укажите порядок оплаты:", "type": "str"},
-             {"name": "personal_execution", "prompt": "Исполнитель оказывает услуги лично или может привлекать третьих лиц? (лично/с привлечением):", "type": "str"},
-             {"name": "penalty", "prompt": "Введите размер пени за просрочку (% в день):", "type": "str"},
-             {"name": "customer_signature", "prompt": "Введите расшифровку подписи заказчика:", "type": "str"},
-             {"name": "executor_signature", "prompt": "Введите расшифровку подписи исполнителя:", "type": "str"},
-         ]),
-
-        # 5. Трудовой договор
-        ("employment", "Трудовой договор",
-         """ТРУДОВОЙ ДОГОВОР
-г. {city}                                   «{date}»
-
-{employer_name} в лице {employer_rep}, действующего на основании {employer_basis}, именуем__ в дальнейшем «Работодатель», с одной стороны, и
-{employee_name}, паспорт: серия {passport_series} номер {passport_number}, выдан {passport_issuer} {passport_date}, зарегистрированный по адресу: {employee_address}, именуем__ в дальнейшем «Работник», с другой стороны,
-заключили настоящий договор о нижеследующем:
-
-1. ПРЕДМЕТ ДОГОВОРА
-1.1. Работник принимается на работу к Работодателю для выполнения трудовой функции по должности {position} в соответствии со штатным расписанием.
-1.2. Место работы: {workplace}.
-
-2. СРОК ДОГОВОРА
-2.1. Договор заключен на неопределенный срок / на определенный срок (нужное подчеркнуть): {contract_term}.
-2.2. Дата начала работы: {start_date}.
-
-3. УСЛОВИЯ ОПЛАТЫ ТРУДА
-3.1. Работнику устанавливается оклад в размере {salary} рублей в месяц.
-3.2. Районный коэффициент: {regional_coef} (если есть).
-3.3. Заработная плата выплачивается два раза в месяц: {payment_dates}.
-
-4. РЕЖИМ РАБОЧЕГО ВРЕМЕНИ И ВРЕМЕНИ ОТДЫХА
-4.1. Работнику устанавливается режим рабочего времени: {work_schedule}.
-4.2. Продолжительность ежегодного оплачиваемого отпуска: {vacation_days} календарных дней.
-
-5. ПРАВА И ОБЯЗАННОСТИ СТОРОН
-5.1. Работник обязан добросовестно исполнять свои трудовые обязанности, соблюдать правила внутреннего трудового распорядка.
-5.2. Работодатель обязан предоставить работу, выплачивать заработную плату, обеспечивать безопасные условия труда.
-
-6. ОТВЕТСТВЕННОСТЬ СТОРОН
-6.1. За неисполнение или ненадлежащее исполнение обязанностей стороны несут ответственность в соответствии с ТК РФ.
-
-7. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-7.1. Договор составлен в двух экземплярах.
-
-ПОДПИСИ СТОРОН:
-Работодатель: ____________________ /{employer_signature}/
-Работник: ____________________ /{employee_signature}/""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату заключения договора:", "type": "str"},
-             {"name": "employer_name", "prompt": "Введите наименование работодателя (организации):", "type": "str"},
-             {"name": "employer_rep", "prompt": "Введите должность и ФИО представителя работодателя:", "type": "str"},
-             {"name": "employer_basis", "prompt": "На основании чего действует представитель (Устав, доверенность и т.д.):", "type": "str"},
-             {"name": "employee_name", "prompt": "Введите ФИО работника полностью:", "type": "str"},
-             {"name": "passport_series", "prompt": "Введите серию паспорта работника (4 цифры):", "type": "str"},
-             {"name": "passport_number", "prompt": "Введите номер паспорта работника (6 цифр):", "type": "str"},
-             {"name": "passport_issuer", "prompt": "Кем выдан паспорт?", "type": "str"},
-             {"name": "passport_date", "prompt": "Когда выдан паспорт (дата):", "type": "str"},
-             {"name": "employee_address", "prompt": "Введите адрес регистрации работника:", "type": "str"},
-             {"name": "position", "prompt": "На какую должность принимается работник?", "type": "str"},
-             {"name": "workplace", "prompt": "Где находится рабочее место (адрес, подразделение)?", "type": "str"},
-             {"name": "contract_term", "prompt": "Укажите срок договора (бессрочно / на определенный срок с указанием даты окончания):", "type": "str"},
-             {"name": "start_date", "prompt": "С какого числа работник приступает к работе?", "type": "str"},
-             {"name": "salary", "prompt": "Введите оклад (цифрами):", "type": "str"},
-             {"name": "regional_coef", "prompt": "Введите районный коэффициент (если есть, иначе 1):", "type": "str"},
-             {"name": "payment_dates", "prompt": "Укажите даты выплаты зарплаты (например, 5 и 20 числа каждого месяца):", "type": "str"},
-             {"name": "work_schedule", "prompt": "Опишите режим работы (например, пятидневная рабочая неделя с 9:00 до 18:00):", "type": "str"},
-             {"name": "vacation_days", "prompt": "Сколько дней отпуска? (обычно 28):", "type": "str"},
-             {"name": "employer_signature", "prompt": "Введите расшифровку подписи работодателя:", "type": "str"},
-             {"name": "employee_signature", "prompt": "Введите расшифровку подписи работника:", "type": "str"},
-         ]),
-
-        # 6. Брачный договор
-        ("marriage_contract", "Брачный договор",
-         """БРАЧНЫЙ ДОГОВОР
-г. {city}                                   «{date}»
-
-Мы, нижеподписавшиеся: {spouse1_name}, паспорт: серия {spouse1_passport_series} номер {spouse1_passport_number}, выдан {spouse1_passport_issuer}, проживающий по адресу: {spouse1_address}, и {spouse2_name}, паспорт: серия {spouse2_passport_series} номер {spouse2_passport_number}, выдан {spouse2_passport_issuer}, проживающий по адресу: {spouse2_address}, состоящие в зарегистрированном браке с {marriage_date} (свидетельство о браке серия {marriage_cert_series} номер {marriage_cert_number}), именуемые в дальнейшем «Супруги», заключили настоящий договор о нижеследующем:
-
-1. ПРЕДМЕТ ДОГОВОРА
-1.1. Настоящим договором Супруги устанавливают правовой режим имущества, нажитого в браке, а также иные имущественные права и обязанности.
-
-2. ПРАВОВОЙ РЕЖИМ ИМУЩЕСТВА
-2.1. Имущество, нажитое супругами во время брака, является в период брака совместной собственностью супругов / раздельной собственностью того супруга, на имя которого оно оформлено (нужное подчеркнуть): {property_regime}.
-2.2. В отношении следующего имущества устанавливается особый режим: {special_property}.
-
-3. ПРАВА И ОБЯЗАННОСТИ ПО СОДЕРЖАНИЮ
-3.1. Супруги обязуются предоставлять содержание друг другу в следующих случаях и размерах: {maintenance_obligations}.
-
-4. РАЗДЕЛ ИМУЩЕСТВА В СЛУЧАЕ РАСТОРЖЕНИЯ БРАКА
-4.1. В случае расторжения брака имущество подлежит разделу в следующем порядке: {division_order}.
-
-5. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-5.1. Договор составлен в трех экземплярах: по одному для каждого из супругов и для органа нотариата.
-5.2. Настоящий договор подлежит нотариальному удостоверению.
-
-ПОДПИСИ СТОРОН:
-{spouse1_signature}
-{spouse2_signature}""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату заключения договора:", "type": "str"},
-             {"name": "spouse1_name", "prompt": "Введите ФИО первого супруга:", "type": "str"},
-             {"name": "spouse1_passport_series", "prompt": "Серия паспорта первого супруга:", "type": "str"},
-             {"name": "spouse1_passport_number", "prompt": "Номер паспорта первого супруга:", "type": "str"},
-             {"name": "spouse1_passport_issuer", "prompt": "Кем выдан паспорт первого супруга?", "type": "str"},
-             {"name": "spouse1_address", "prompt": "Адрес регистрации первого супруга:", "type": "str"},
-             {"name": "spouse2_name", "prompt": "Введите ФИО второго супруга:", "type": "str"},
-             {"name": "spouse2_passport_series", "prompt": "Серия паспорта второго супруга:", "type": "str"},
-             {"name": "spouse2_passport_number", "prompt": "Номер паспорта второго супруга:", "type": "str"},
-             {"name": "spouse2_passport_issuer", "prompt": "Кем выдан паспорт второго супруга?", "type": "str"},
-             {"name": "spouse2_address", "prompt": "Адрес регистрации второго супруга:", "type": "str"},
-             {"name": "marriage_date", "prompt": "Дата регистрации брака:", "type": "str"},
-             {"name": "marriage_cert_series", "prompt": "Серия свидетельства о браке:", "type": "str"},
-             {"name": "marriage_cert_number", "prompt": "Номер свидетельства о браке:", "type": "str"},
-             {"name": "property_regime", "prompt": "Режим имущества: совместная или раздельная собственность?", "type": "str"},
-             {"name": "special_property", "prompt": "Опишите имущество с особым режимом (если есть):", "type": "str"},
-             {"name": "maintenance_obligations", "prompt": "Опишите обязанности по содержанию (алименты) (если есть):", "type": "str"},
-             {"name": "division_order", "prompt": "Порядок раздела имущества при разводе:", "type": "str"},
-             {"name": "spouse1_signature", "prompt": "Введите расшифровку подписи первого супруга:", "type": "str"},
-             {"name": "spouse2_signature", "prompt": "Введите расшифровку подписи второго супруга:", "type": "str"},
-         ]),
-
-        # 7. Соглашение о разделе имущества
-        ("property_division", "Соглашение о разделе имущества",
-         """СОГЛАШЕНИЕ О РАЗДЕЛЕ ИМУЩЕСТВА
-г. {city}                                   «{date}»
-
-Мы, {spouse1_name}, паспорт: серия {spouse1_passport_series} номер {spouse1_passport_number}, выдан {spouse1_passport_issuer}, проживающий по адресу: {spouse1_address}, и {spouse2_name}, паспорт: серия {spouse2_passport_series} номер {spouse2_passport_number}, выдан {spouse2_passport_issuer}, проживающий по адресу: {spouse2_address}, состоявшие в зарегистрированном браке, расторгнутом {divorce_date} (свидетельство о расторжении брака серия {divorce_cert_series} номер {divorce_cert_number}), руководствуясь ст. 38 СК РФ, заключили настоящее соглашение о разделе общего имущества.
-
-1. ПРЕДМЕТ СОГЛАШЕНИЯ
-1.1. Стороны договорились произвести раздел имущества, нажитого ими в период брака, следующим образом:
-
-2. ИМУЩЕСТВО, ПЕРЕДАВАЕМОЕ {spouse1_name}
-2.1. {spouse1_name} получает в собственность:
-- {spouse1_property_list}
-
-3. ИМУЩЕСТВО, ПЕРЕДАВАЕМОЕ {spouse2_name}
-3.1. {spouse2_name} получает в собственность:
-- {spouse2_property_list}
-
-4. КОМПЕНСАЦИЯ
-4.1. В случае неравноценности разделенного имущества выплачивается компенсация: {compensation_details}.
-
-5. ПРАВО СОБСТВЕННОСТИ
-5.1. Право собственности на указанное имущество возникает у каждого из супругов с момента подписания настоящего соглашения (или с момента государственной регистрации, если требуется).
-
-6. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-6.1. Соглашение составлено в трех экземплярах.
-6.2. Соглашение может быть удостоверено нотариально.
-
-ПОДПИСИ СТОРОН:
-{spouse1_signature}
-{spouse2_signature}""",
-         [
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату соглашения:", "type": "str"},
-             {"name": "spouse1_name", "prompt": "ФИО первого супруга:", "type": "str"},
-             {"name": "spouse1_passport_series", "prompt": "Серия паспорта первого супруга:", "type": "str"},
-             {"name": "spouse1_passport_number", "prompt": "Номер паспорта первого супруга:", "type": "str"},
-             {"name": "spouse1_passport_issuer", "prompt": "Кем выдан паспорт первого супруга?", "type": "str"},
-             {"name": "spouse1_address", "prompt": "Адрес первого супруга:", "type": "str"},
-             {"name": "spouse2_name", "prompt": "ФИО второго супруга:", "type": "str"},
-             {"name": "spouse2_passport_series", "prompt": "Серия паспорта второго супруга:", "type": "str"},
-             {"name": "spouse2_passport_number", "prompt": "Номер паспорта второго супруга:", "type": "str"},
-             {"name": "spouse2_passport_issuer", "prompt": "Кем выдан паспорт второго супруга?", "type": "str"},
-             {"name": "spouse2_address", "prompt": "Адрес второго супруга:", "type": "str"},
-             {"name": "divorce_date", "prompt": "Дата расторжения брака:", "type": "str"},
-             {"name": "divorce_cert_series", "prompt": "Серия свидетельства о расторжении брака:", "type": "str"},
-             {"name": "divorce_cert_number", "prompt": "Номер свидетельства о расторжении брака:", "type": "str"},
-             {"name": "spouse1_property_list", "prompt": "Перечислите имущество, которое отходит первому супругу (с описанием):", "type": "str"},
-             {"name": "spouse2_property_list", "prompt": "Перечислите имущество, которое отходит второму супругу:", "type": "str"},
-             {"name": "compensation_details", "prompt": "Укажите, если предусмотрена компенсация (сумма, сроки):", "type": "str"},
-             {"name": "spouse1_signature", "prompt": "Расшифровка подписи первого супруга:", "type": "str"},
-             {"name": "spouse2_signature", "prompt": "Расшифровка подписи второго супруга:", "type": "str"},
-         ]),
-
-        # 8. Дополнительное соглашение
-        ("additional_agreement", "Дополнительное соглашение",
-         """ДОПОЛНИТЕЛЬНОЕ СОГЛАШЕНИЕ № {agreement_number}
-к договору {main_contract_name} от {main_contract_date}
-
-г. {city}                                   «{date}»
-
-Между {party1_name} и {party2_name}, заключившими указанный договор, заключено настоящее дополнительное соглашение о нижеследующем:
-
-1. Внести в договор следующие изменения/дополнения:
-{changes}
-
-2. Условия договора, не затронутые настоящим соглашением, остаются неизменными.
-
-3. Настоящее соглашение вступает в силу с момента его подписания и является неотъемлемой частью договора.
-
-4. Соглашение составлено в двух экземплярах.
-
-ПОДПИСИ СТОРОН:
-{party1_name}: ____________________ /{party1_signature}/
-{party2_name}: ____________________ /{party2_signature}/""",
-         [
-             {"name": "agreement_number", "prompt": "Введите номер дополнительного соглашения:", "type": "str"},
-             {"name": "main_contract_name", "prompt": "Введите название основного договора:", "type": "str"},
-             {"name": "main_contract_date", "prompt": "Введите дату основного договора:", "type": "str"},
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату подписания допсоглашения:", "type": "str"},
-             {"name": "party1_name", "prompt": "Введите наименование первой стороны:", "type": "str"},
-             {"name": "party2_name", "prompt": "Введите наименование второй стороны:", "type": "str"},
-             {"name": "changes", "prompt": "Опишите, какие изменения или дополнения вносятся в договор:", "type": "str"},
-             {"name": "party1_signature", "prompt": "Расшифровка подписи первой стороны:", "type": "str"},
-             {"name": "party2_signature", "prompt": "Расшифровка подписи второй стороны:", "type": "str"},
-         ]),
-    ],
-
-    # ---------- Процессуальные документы ----------
-    "procedural": [
-        # 1. Исковое заявление (общий пример)
-        ("statement_claim", "Исковое заявление (общее)",
-         """В {court_name}
-Истец: {plaintiff_name}
-Адрес: {plaintiff_address}
-Телефон: {plaintiff_phone}
-Ответчик: {defendant_name}
-Адрес: {defendant_address}
-Цена иска: {claim_amount} рублей
-
-ИСКОВОЕ ЗАЯВЛЕНИЕ
-о {claim_subject}
-
-«{date}» между мной и Ответчиком был заключен договор/возникли отношения: {relationship_description}.
-В соответствии с условиями я выполнил свои обязательства, что подтверждается {evidence}.
-Однако Ответчик до настоящего времени не исполнил свои обязательства, а именно: {violation_description}.
-Задолженность/ущерб составляет {claim_amount} рублей.
-
-На основании изложенного, руководствуясь ст. 309, 310 ГК РФ,
-
-ПРОШУ:
-1. Взыскать с Ответчика в мою пользу {claim_amount} рублей.
-2. Взыскать расходы по уплате госпошлины в размере {court_fee} рублей.
-
-Приложения:
-1. Копия договора (если есть).
-2. Расчет задолженности.
-3. Квитанция об уплате госпошлины.
-4. Копия искового заявления для ответчика.
-
-Дата: {filing_date}                                   Подпись: {plaintiff_signature}""",
-         [
-             {"name": "court_name", "prompt": "Введите наименование суда:", "type": "str"},
-             {"name": "plaintiff_name", "prompt": "Введите ФИО истца:", "type": "str"},
-             {"name": "plaintiff_address", "prompt": "Введите адрес истца:", "type": "str"},
-             {"name": "plaintiff_phone", "prompt": "Введите телефон истца:", "type": "str"},
-             {"name": "defendant_name", "prompt": "Введите наименование ответчика:", "type": "str"},
-             {"name": "defendant_address", "prompt": "Введите адрес ответчика:", "type": "str"},
-             {"name": "claim_amount", "prompt": "Введите цену иска (цифрами):", "type": "str"},
-             {"name": "claim_subject", "prompt": "Кратко укажите предмет иска (например, о взыскании задолженности по договору займа):", "type": "str"},
-             {"name": "date", "prompt": "Введите дату возникновения отношений (например, дату договора):", "type": "str"},
-             {"name": "relationship_description", "prompt": "Опишите суть отношений между сторонами (договор, обязательства):", "type": "str"},
-             {"name": "evidence", "prompt": "Что подтверждает выполнение ваших обязательств? (документы, расписки и т.п.):", "type": "str"},
-             {"name": "violation_description", "prompt": "В чем именно заключается нарушение со стороны ответчика?", "type": "str"},
-             {"name": "court_fee", "prompt": "Введите размер госпошлины (цифрами):", "type": "str"},
-             {"name": "filing_date", "prompt": "Введите дату подачи иска:", "type": "str"},
-             {"name": "plaintiff_signature", "prompt": "Введите расшифровку подписи истца:", "type": "str"},
-         ]),
-
-        # 2. Отзыв на иск
-        ("response_claim", "Отзыв на исковое заявление",
-         """В {court_name}
-От ответчика: {defendant_name}
-Адрес: {defendant_address}
-Дело № {case_number}
-
-ОТЗЫВ
-на исковое заявление {plaintiff_name} о {claim_subject}
-
-С предъявленными исковыми требованиями не согласен по следующим основаниям:
-{objections}
-
-Доводы истца о {claim_point} не соответствуют действительности, поскольку {rebuttal}.
-
-Прошу в удовлетворении исковых требований отказать полностью / частично (нужное подчеркнуть).
-
-Приложения:
-1. Документы, обосновывающие возражения.
-
-Дата: {response_date}                                   Подпись: {defendant_signature}""",
-         [
-             {"name": "court_name", "prompt": "Введите наименование суда:", "type": "str"},
-             {"name": "defendant_name", "prompt": "Введите ФИО или наименование ответчика:", "type": "str"},
-             {"name": "defendant_address", "prompt": "Введите адрес ответчика:", "type": "str"},
-             {"name": "case_number", "prompt": "Введите номер дела (если известен):", "type": "str"},
-             {"name": "plaintiff_name", "prompt": "Введите ФИО истца:", "type": "str"},
-             {"name": "claim_subject", "prompt": "Кратко укажите предмет иска:", "type": "str"},
-             {"name": "objections", "prompt": "Изложите свои возражения по существу иска:", "type": "str"},
-             {"name": "claim_point", "prompt": "Укажите конкретный пункт исковых требований, с которым не согласны:", "type": "str"},
-             {"name": "rebuttal", "prompt": "Почему доводы истца неверны? Приведите опровержения:", "type": "str"},
-             {"name": "response_date", "prompt": "Введите дату составления отзыва:", "type": "str"},
-             {"name": "defendant_signature", "prompt": "Расшифровка подписи ответчика:", "type": "str"},
-         ]),
-
-        # 3. Ходатайство (общее)
-        ("motion", "Ходатайство (общее)",
-         """В {court_name}
-От {applicant_name}
-По делу № {case_number}
-
-ХОДАТАЙСТВО
-о {motion_subject}
-
-В производстве суда находится дело № {case_number} по иску {plaintiff_name} к {defendant_name} о {claim_subject}.
-
-В связи с {motion_reason}, руководствуясь ст. 35, 166 ГПК РФ (или соответствующей статьей АПК РФ),
-
-ПРОШУ:
-{motion_request}
-
-Дата: {motion_date}                                   Подпись: {applicant_signature}""",
-         [
-             {"name": "court_name", "prompt": "Введите наименование суда:", "type": "str"},
-             {"name": "applicant_name", "prompt": "Введите ФИО заявителя (истца/ответчика):", "type": "str"},
-             {"name": "case_number", "prompt": "Введите номер дела:", "type": "str"},
-             {"name": "plaintiff_name", "prompt": "Введите ФИО истца:", "type": "str"},
-             {"name": "defendant_name", "prompt": "Введите ФИО ответчика:", "type": "str"},
-             {"name": "claim_subject", "prompt": "Предмет иска:", "type": "str"},
-             {"name": "motion_subject", "prompt": "Кратко укажите предмет ходатайства (например, о назначении экспертизы, об отложении дела, о приобщении документов):", "type": "str"},
-             {"name": "motion_reason", "prompt": "Изложите причины, по которым заявляется ходатайство:", "type": "str"},
-             {"name": "motion_request", "prompt": "Сформулируйте просительную часть (что именно просите суд сделать):", "type": "str"},
-             {"name": "motion_date", "prompt": "Введите дату:", "type": "str"},
-             {"name": "applicant_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-
-        # 4. Апелляционная жалоба
-        ("appeal", "Апелляционная жалоба",
-         """В {appeal_court_name}
-(наименование суда апелляционной инстанции)
-от {appellant_name}
-(ФИО, адрес, процессуальное положение по делу)
-Дело № {case_number}
-
-АПЕЛЛЯЦИОННАЯ ЖАЛОБА
-на решение {trial_court_name} от {decision_date}
-
-Решением {trial_court_name} от {decision_date} по делу № {case_number} в удовлетворении исковых требований {plaintiff_name} отказано / иск удовлетворён частично / полностью (нужное подчеркнуть).
-Считаю указанное решение незаконным и необоснованным по следующим основаниям:
-{grounds}
-
-В связи с изложенным, руководствуясь ст. 320, 322 ГПК РФ / ст. 257 АПК РФ,
-
-ПРОШУ:
-Решение {trial_court_name} от {decision_date} отменить и принять по делу новый судебный акт / направить дело на новое рассмотрение.
-
-Дата: {appeal_date}                                   Подпись: {appellant_signature}""",
-         [
-             {"name": "appeal_court_name", "prompt": "Введите наименование апелляционного суда:", "type": "str"},
-             {"name": "appellant_name", "prompt": "Введите ФИО подателя жалобы:", "type": "str"},
-             {"name": "case_number", "prompt": "Введите номер дела:", "type": "str"},
-             {"name": "trial_court_name", "prompt": "Введите наименование суда первой инстанции:", "type": "str"},
-             {"name": "decision_date", "prompt": "Введите дату обжалуемого решения:", "type": "str"},
-             {"name": "plaintiff_name", "prompt": "Введите ФИО истца:", "type": "str"},
-             {"name": "grounds", "prompt": "Подробно изложите, почему решение незаконно (со ссылками на нормы права):", "type": "str"},
-             {"name": "appeal_date", "prompt": "Введите дату подачи жалобы:", "type": "str"},
-             {"name": "appellant_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-
-        # 5. Кассационная жалоба
-        ("cassation", "Кассационная жалоба",
-         """В {cassation_court_name}
-(наименование кассационного суда)
-от {cassation_appellant_name}
-(ФИО, адрес)
-Дело № {case_number}
-
-КАССАЦИОННАЯ ЖАЛОБА
-на решение {trial_court_name} от {decision_date} и апелляционное определение {appeal_court_name} от {appeal_decision_date}
-
-Решением {trial_court_name} от {decision_date}, оставленным без изменения апелляционным определением {appeal_court_name} от {appeal_decision_date}, по делу № {case_number} отказано в удовлетворении моих требований / иск удовлетворен.
-Считаю указанные судебные акты незаконными, поскольку судами допущены существенные нарушения норм материального и процессуального права: {violations}.
-
-На основании изложенного, руководствуясь ст. 376, 378 ГПК РФ / ст. 273, 277 АПК РФ,
-
-ПРОШУ:
-Решение {trial_court_name} от {decision_date} и апелляционное определение {appeal_court_name} от {appeal_decision_date} отменить и направить дело на новое рассмотрение / принять новое решение.
-
-Дата: {cassation_date}                                   Подпись: {cassation_signature}""",
-         [
-             {"name": "cassation_court_name", "prompt": "Введите наименование кассационного суда:", "type": "str"},
-             {"name": "cassation_appellant_name", "prompt": "Введите ФИО подателя жалобы:", "type": "str"},
-             {"name": "case_number", "prompt": "Введите номер дела:", "type": "str"},
-             {"name": "trial_court_name", "prompt": "Введите наименование суда первой инстанции:", "type": "str"},
-             {"name": "decision_date", "prompt": "Введите дату решения первой инстанции:", "type": "str"},
-             {"name": "appeal_court_name", "prompt": "Введите наименование апелляционного суда:", "type": "str"},
-             {"name": "appeal_decision_date", "prompt": "Введите дату апелляционного определения:", "type": "str"},
-             {"name": "violations", "prompt": "Укажите, какие именно нарушения норм права допущены судами:", "type": "str"},
-             {"name": "cassation_date", "prompt": "Введите дату подачи кассационной жалобы:", "type": "str"},
-             {"name": "cassation_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-
-        # 6. Мировое соглашение
-        ("settlement", "Мировое соглашение",
-         """МИРОВОЕ СОГЛАШЕНИЕ
-по делу № {case_number}, рассматриваемому {court_name}
-
-г. {city}                                   «{date}»
-
-Мы, {plaintiff_name}, именуем__ в дальнейшем «Истец», с одной стороны, и {defendant_name}, именуем__ в дальнейшем «Ответчик», с другой стороны, являющиеся сторонами по делу № {case_number}, рассматриваемому {court_name}, заключили настоящее мировое соглашение о нижеследующем:
-
-1. Стороны договорились урегулировать спор путем заключения мирового соглашения на следующих условиях:
-{terms}
-
-2. Истец отказывается от исковых требований к Ответчику в полном объеме / в части {partial_refusal}.
-
-3. Судебные расходы распределяются следующим образом: {costs_distribution}.
-
-4. Последствия прекращения производства по делу, предусмотренные ст. 221 ГПК РФ / ст. 151 АПК РФ, сторонам разъяснены и понятны.
-
-5. Настоящее мировое соглашение составлено в трех экземплярах: по одному для каждой стороны и для суда.
-
-6. Просим суд утвердить настоящее мировое соглашение и прекратить производство по делу.
-
-ПОДПИСИ СТОРОН:
-Истец: ____________________ /{plaintiff_signature}/
-Ответчик: ____________________ /{defendant_signature}/""",
-         [
-             {"name": "case_number", "prompt": "Введите номер дела:", "type": "str"},
-             {"name": "court_name", "prompt": "Введите наименование суда:", "type": "str"},
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату:", "type": "str"},
-             {"name": "plaintiff_name", "prompt": "Введите ФИО истца:", "type": "str"},
-             {"name": "defendant_name", "prompt": "Введите ФИО ответчика:", "type": "str"},
-             {"name": "terms", "prompt": "Изложите условия мирового соглашения (например, ответчик обязуется выплатить сумму, истец отказывается от иска):", "type": "str"},
-             {"name": "partial_refusal", "prompt": "Если отказ частичный, укажите, от каких именно требований истец отказывается:", "type": "str"},
-             {"name": "costs_distribution", "prompt": "Как распределяются судебные расходы?", "type": "str"},
-             {"name": "plaintiff_signature", "prompt": "Расшифровка подписи истца:", "type": "str"},
-             {"name": "defendant_signature", "prompt": "Расшифровка подписи ответчика:", "type": "str"},
-         ]),
-    ],
-
-    # ---------- Локальные акты и корпоративные документы ----------
-    "corporate": [
-        # 1. Устав ООО (сокращенный вариант, но достаточно полный)
-        ("charter_llc", "Устав ООО (типовой)",
-         """УСТАВ
-Общества с ограниченной ответственностью «{company_name}»
-(новая редакция)
-
-г. {city}                                   «{date}»
-
-1. ОБЩИЕ ПОЛОЖЕНИЯ
-1.1. Общество с ограниченной ответственностью «{company_name}» (далее – Общество) создано в соответствии с Гражданским кодексом РФ и Федеральным законом «Об обществах с ограниченной ответственностью».
-1.2. Полное фирменное наименование Общества: Общество с ограниченной ответственностью «{company_name}». Сокращенное наименование: ООО «{company_name}».
-1.3. Место нахождения Общества: {company_address}.
-
-2. ЦЕЛИ И ПРЕДМЕТ ДЕЯТЕЛЬНОСТИ
-2.1. Основной целью деятельности Общества является извлечение прибыли.
-2.2. Общество вправе осуществлять любые виды деятельности, не запрещенные законом, в том числе: {activities}.
-
-3. УСТАВНЫЙ КАПИТАЛ
-3.1. Уставный капитал Общества составляет {authorized_capital} рублей.
-3.2. Участниками Общества являются: {participants_list}.
-
-4. ПРАВА И ОБЯЗАННОСТИ УЧАСТНИКОВ
-4.1. Участники имеют право: участвовать в управлении делами Общества, получать информацию о деятельности Общества, принимать участие в распределении прибыли.
-4.2. Участники обязаны: оплачивать доли в уставном капитале, не разглашать конфиденциальную информацию.
-
-5. УПРАВЛЕНИЕ ОБЩЕСТВОМ
-5.1. Высшим органом управления Общества является Общее собрание участников.
-5.2. Единоличным исполнительным органом Общества является Генеральный директор, избираемый сроком на {director_term}.
-
-6. РАСПРЕДЕЛЕНИЕ ПРИБЫЛИ
-6.1. Прибыль Общества, оставшаяся после уплаты налогов и иных обязательных платежей, распределяется между участниками пропорционально их долям в уставном капитале.
-
-7. РЕОРГАНИЗАЦИЯ И ЛИКВИДАЦИЯ
-7.1. Общество может быть реорганизовано или ликвидировано добровольно по решению общего собрания участников.
-
-УТВЕРЖДЕН:
-Решением единственного участника / Протоколом общего собрания № {protocol_number} от «{protocol_date}».""",
-         [
-             {"name": "company_name", "prompt": "Введите название ООО:", "type": "str"},
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату утверждения устава:", "type": "str"},
-             {"name": "company_address", "prompt": "Введите юридический адрес Общества:", "type": "str"},
-             {"name": "activities", "prompt": "Перечислите основные виды деятельности (можно перечислить через запятую):", "type": "str"},
-             {"name": "authorized_capital", "prompt": "Введите размер уставного капитала (цифрами):", "type": "str"},
-             {"name": "participants_list", "prompt": "Перечислите участников (ФИО или наименования) с указанием размера долей:", "type": "str"},
-             {"name": "director_term", "prompt": "На какой срок избирается генеральный директор? (например, 5 лет):", "type": "str"},
-             {"name": "protocol_number", "prompt": "Введите номер протокола собрания (или укажите, что решение единственного участника):", "type": "str"},
-             {"name": "protocol_date", "prompt": "Введите дату протокола:", "type": "str"},
-         ]),
-
-        # 2. Решение о создании ООО (единственного участника)
-        ("decision_create_llc", "Решение о создании ООО (единственный участник)",
-         """РЕШЕНИЕ № {decision_number}
-единственного учредителя (участника)
-о создании Общества с ограниченной ответственностью «{company_name}»
-
-г. {city}                                   «{date}»
-
-Я, {founder_name}, паспорт: серия {passport_series} номер {passport_number}, выдан {passport_issuer}, зарегистрированный по адресу: {founder_address}, принял(а) решение:
-
-1. Создать Общество с ограниченной ответственностью «{company_name}» (далее – Общество).
-2. Утвердить Устав Общества.
-3. Определить место нахождения Общества: {company_address}.
-4. Сформировать уставный капитал Общества в размере {authorized_capital} рублей. Уставный капитал оплачивается в срок не более 4 месяцев с момента государственной регистрации Общества.
-5. Назначить на должность Генерального директора Общества {director_name}.
-6. Произвести государственную регистрацию Общества в установленном законом порядке.
-
-Подпись: ____________________ /{founder_signature}/""",
-         [
-             {"name": "decision_number", "prompt": "Введите номер решения (например, 1):", "type": "str"},
-             {"name": "company_name", "prompt": "Введите название ООО:", "type": "str"},
-             {"name": "city", "prompt": "Введите город:", "type": "str"},
-             {"name": "date", "prompt": "Введите дату решения:", "type": "str"},
-             {"name": "founder_name", "prompt": "Введите ФИО учредителя:", "type": "str"},
-             {"name": "passport_series", "prompt": "Серия паспорта учредителя:", "type": "str"},
-             {"name": "passport_number", "prompt": "Номер паспорта учредителя:", "type": "str"},
-             {"name": "passport_issuer", "prompt": "Кем выдан паспорт?", "type": "str"},
-             {"name": "founder_address", "prompt": "Адрес регистрации учредителя:", "type": "str"},
-             {"name": "company_address", "prompt": "Юридический адрес Общества:", "type": "str"},
-             {"name": "authorized_capital", "prompt": "Размер уставного капитала (цифрами):", "type": "str"},
-             {"name": "director_name", "prompt": "ФИО назначаемого генерального директора:", "type": "str"},
-             {"name": "founder_signature", "prompt": "Расшифровка подписи учредителя:", "type": "str"},
-         ]),
-
-        # 3. Протокол общего собрания участников ООО
-        ("protocol_llc", "Протокол общего собрания участников ООО",
-         """ПРОТОКОЛ № {protocol_number}
-общего собрания участников
-Общества с ограниченной ответственностью «{company_name}»
-
-г. {city}                                   «{date}»
-
-Присутствовали:
-1. {participant1} – доля в уставном капитале {share1}%.
-2. {participant2} – доля в уставном капитале {share2}%.
-(иные участники: {other_participants})
-
-Кворум имеется. Собрание правомочно.
-
-ПОВЕСТКА ДНЯ:
-1. {agenda_item1}
-2. {agenda_item2}
-...
-
-СЛУШАЛИ:
-По первому вопросу выступил {speaker1} с предложением {proposal1}.
-
-ГОЛОСОВАЛИ:
-За – {votes_for1}, против – {votes_against1}, воздержались – {votes_abstain1}.
-
-РЕШИЛИ:
-{decision1}
-
-По второму вопросу...
-
-ПРЕДСЕДАТЕЛЬ СОБРАНИЯ: ____________________ /{chairman_signature}/
-СЕКРЕТАРЬ: ____________________ /{secretary_signature}/""",
-         [
-             {"name": "protocol_number", "prompt": "Введите номер протокола:", "type": "str"},
-             {"name": "company_name", "prompt": "Введите название ООО:", "type": "str"},
-             {"name": "city", "prompt": "Город:", "type": "str"},
-             {"name": "date", "prompt": "Дата собрания:", "type": "str"},
-             {"name": "participant1", "prompt": "ФИО первого участника:", "type": "str"},
-             {"name": "share1", "prompt": "Доля первого участника в %:", "type": "str"},
-             {"name": "participant2", "prompt": "ФИО второго участника:", "type": "str"},
-             {"name": "share2", "prompt": "Доля второго участника в %:", "type": "str"},
-             {"name": "other_participants", "prompt": "Другие участники (если есть, иначе укажите 'нет'):", "type": "str"},
-             {"name": "agenda_item1", "prompt": "Первый вопрос повестки дня:", "type": "str"},
-             {"name": "agenda_item2", "prompt": "Второй вопрос повестки дня (если есть, иначе поставьте прочерк):", "type": "str"},
-             {"name": "speaker1", "prompt": "Кто выступал по первому вопросу?", "type": "str"},
-             {"name": "proposal1", "prompt": "Что было предложено по первому вопросу?", "type": "str"},
-             {"name": "votes_for1", "prompt": "Голосов ЗА по первому вопросу:", "type": "str"},
-             {"name": "votes_against1", "prompt": "Голосов ПРОТИВ по первому вопросу:", "type": "str"},
-             {"name": "votes_abstain1", "prompt": "Голосов ВОЗДЕРЖАЛСЯ по первому вопросу:", "type": "str"},
-             {"name": "decision1", "prompt": "Принятое решение по первому вопросу:", "type": "str"},
-             {"name": "chairman_signature", "prompt": "Расшифровка подписи председателя:", "type": "str"},
-             {"name": "secretary_signature", "prompt": "Расшифровка подписи секретаря:", "type": "str"},
-         ]),
-
-        # 4. Должностная инструкция
-        ("job_description", "Должностная инструкция",
-         """ДОЛЖНОСТНАЯ ИНСТРУКЦИЯ
-{position}
-
-г. {city}                                   «{date}»
-
-1. ОБЩИЕ ПОЛОЖЕНИЯ
-1.1. Настоящая должностная инструкция определяет функциональные обязанности, права и ответственность {position} (далее – Сотрудник) в организации {company_name}.
-1.2. Сотрудник назначается на должность и освобождается от должности приказом Генерального директора.
-1.3. Сотрудник подчиняется непосредственно {supervisor}.
-
-2. КВАЛИФИКАЦИОННЫЕ ТРЕБОВАНИЯ
-2.1. На должность {position} назначается лицо, имеющее {education_requirements} и стаж работы {experience_requirements}.
-
-3. ДОЛЖНОСТНЫЕ ОБЯЗАННОСТИ
-Сотрудник обязан:
-{responsibilities}
-
-4. ПРАВА
-Сотрудник имеет право:
-{rights}
-
-5. ОТВЕТСТВЕННОСТЬ
-Сотрудник несет ответственность за неисполнение или ненадлежащее исполнение возложенных на него обязанностей в соответствии с трудовым законодательством.
-
-СОГЛАСОВАНО:
-Юрист: ____________________ /{lawyer_signature}/
-
-С инструкцией ознакомлен(а):
-____________________ /{employee_signature}/
-«___» __________ 20__ г.""",
-         [
-             {"name": "position", "prompt": "Введите наименование должности:", "type": "str"},
-             {"name": "city", "prompt": "Город:", "type": "str"},
-             {"name": "date", "prompt": "Дата утверждения инструкции:", "type": "str"},
-             {"name": "company_name", "prompt": "Название организации:", "type": "str"},
-             {"name": "supervisor", "prompt": "Кому непосредственно подчиняется сотрудник?", "type": "str"},
-             {"name": "education_requirements", "prompt": "Требования к образованию (например, высшее профессиональное):", "type": "str"},
-             {"name": "experience_requirements", "prompt": "Требования к стажу работы (например, не менее 3 лет):", "type": "str"},
-             {"name": "responsibilities", "prompt": "Перечислите должностные обязанности (каждую с новой строки):", "type": "str"},
-             {"name": "rights", "prompt": "Перечислите права сотрудника:", "type": "str"},
-             {"name": "lawyer_signature", "prompt": "Расшифровка подписи юриста:", "type": "str"},
-             {"name": "employee_signature", "prompt": "Расшифровка подписи сотрудника:", "type": "str"},
-         ]),
-
-        # 5. Приказ о приеме на работу
-        ("hiring_order", "Приказ о приеме на работу (форма Т-1)",
-         """Унифицированная форма № Т-1
-Утверждена Постановлением Госкомстата РФ от 05.01.2004 № 1
-
-                                                       ┌───────────────────┐
-                                                       │      Код          │
-                                                       ├───────────────────┤
-                                                       │    ОКУД 0301001   │
-ООО «{company_name}»                                   ├───────────────────┤
-────────────────────────────────                       │    ОКПО {okpo}    │
-наименование организации                               └───────────────────┘
-
-                                  ПРИКАЗ
-                     (распоряжение) о приеме работника на работу
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│                                   Дата составления: {order_date}                │
-│                                                                                 │
-│                                   Номер документа: {order_number}               │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-     Принять на работу:
-
-     Табельный номер: {personnel_number}
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│Фамилия, имя, отчество: {employee_name}                                          │
-├─────────────────────────────────────────────────────────────────────────────────┤
-│Структурное подразделение: {department}                                          │
-├─────────────────────────────────────────────────────────────────────────────────┤
-│Должность (специальность, профессия), разряд, класс (категория) квалификации:   │
-│{position}                                                                       │
-├─────────────────────────────────────────────────────────────────────────────────┤
-│Условия приема на работу, характер работы: {conditions}                          │
-├─────────────────────────────────────────────────────────────────────────────────┤
-│Тарифная ставка (оклад) {salary} руб.                                            │
-├─────────────────────────────────────────────────────────────────────────────────┤
-│Надбавка {bonus} руб.                                                            │
-├─────────────────────────────────────────────────────────────────────────────────┤
-│С испытанием на срок {probation_period} месяцев                                  │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-Основание:
-Трудовой договор от «{contract_date}» № {contract_number}
-
-Руководитель организации      _____________   ___________________
-                                (подпись)        (расшифровка подписи)
-
-С приказом (распоряжением) работник ознакомлен:
-«___» __________ 20__ г.       ___________________
-                                   (подпись)""",
-         [
-             {"name": "company_name", "prompt": "Название организации (ООО):", "type": "str"},
-             {"name": "okpo", "prompt": "Код ОКПО (если есть, иначе поставьте прочерк):", "type": "str"},
-             {"name": "order_date", "prompt": "Дата приказа:", "type": "str"},
-             {"name": "order_number", "prompt": "Номер приказа:", "type": "str"},
-             {"name": "personnel_number", "prompt": "Табельный номер:", "type": "str"},
-             {"name": "employee_name", "prompt": "ФИО работника:", "type": "str"},
-             {"name": "department", "prompt": "Структурное подразделение:", "type": "str"},
-             {"name": "position", "prompt": "Должность:", "type": "str"},
-             {"name": "conditions", "prompt": "Условия приема (например, по срочному трудовому договору, основное место работы):", "type": "str"},
-             {"name": "salary", "prompt": "Оклад (цифрами):", "type": "str"},
-             {"name": "bonus", "prompt": "Надбавка (если нет, укажите 0):", "type": "str"},
-             {"name": "probation_period", "prompt": "Испытательный срок в месяцах (если нет, укажите 0):", "type": "str"},
-             {"name": "contract_date", "prompt": "Дата трудового договора:", "type": "str"},
-             {"name": "contract_number", "prompt": "Номер трудового договора:", "type": "str"},
-         ]),
-
-        # 6. Положение о структурном подразделении
-        ("regulation_department", "Положение о структурном подразделении",
-         """УТВЕРЖДАЮ
-Генеральный директор ООО «{company_name}»
-____________________ /{director_signature}/
-«___» __________ 20__ г.
-
-ПОЛОЖЕНИЕ
-о {department_name}
-
-г. {city}                                   «{date}»
-
-1. ОБЩИЕ ПОЛОЖЕНИЯ
-1.1. Настоящее Положение определяет правовой статус, задачи, функции, права и ответственность {department_name} (далее – Подразделение) ООО «{company_name}».
-1.2. Подразделение создается и ликвидируется приказом Генерального директора.
-1.3. Подразделение возглавляет {head_position}, назначаемый на должность и освобождаемый от должности приказом Генерального директора.
-
-2. ОСНОВНЫЕ ЗАДАЧИ ПОДРАЗДЕЛЕНИЯ
-{main_tasks}
-
-3. ФУНКЦИИ ПОДРАЗДЕЛЕНИЯ
-{functions}
-
-4. ПРАВА ПОДРАЗДЕЛЕНИЯ
-Подразделение имеет право:
-{rights}
-
-5. ОТВЕТСТВЕННОСТЬ
-Руководитель Подразделения несет персональную ответственность за выполнение возложенных на Подразделение задач и функций.
-
-СОГЛАСОВАНО:
-Юрисконсульт: ____________________ /{lawyer_signature}/""",
-         [
-             {"name": "company_name", "prompt": "Название организации:", "type": "str"},
-             {"name": "director_signature", "prompt": "Расшифровка подписи ген. директора:", "type": "str"},
-             {"name": "department_name", "prompt": "Наименование подразделения (например, отдел кадров, бухгалтерия):", "type": "str"},
-             {"name": "city", "prompt": "Город:", "type": "str"},
-             {"name": "date", "prompt": "Дата утверждения:", "type": "str"},
-             {"name": "head_position", "prompt": "Должность руководителя подразделения:", "type": "str"},
-             {"name": "main_tasks", "prompt": "Перечислите основные задачи подразделения (каждую с новой строки):", "type": "str"},
-             {"name": "functions", "prompt": "Перечислите функции подразделения:", "type": "str"},
-             {"name": "rights", "prompt": "Перечислите права подразделения:", "type": "str"},
-             {"name": "lawyer_signature", "prompt": "Расшифровка подписи юриста:", "type": "str"},
-         ]),
-
-        # 7. Локальный нормативный акт (например, Правила внутреннего трудового распорядка)
-        ("lna", "Правила внутреннего трудового распорядка (образец)",
-         """УТВЕРЖДАЮ
-Генеральный директор ООО «{company_name}»
-____________________ /{director_signature}/
-«___» __________ 20__ г.
-
-ПРАВИЛА ВНУТРЕННЕГО ТРУДОВОГО РАСПОРЯДКА
-для работников ООО «{company_name}»
-
-г. {city}                                   «{date}»
-
-1. ОБЩИЕ ПОЛОЖЕНИЯ
-1.1. Настоящие Правила внутреннего трудового распорядка (далее – Правила) являются локальным нормативным актом ООО «{company_name}» (далее – Общество), разработанным в соответствии с Трудовым кодексом РФ и иными нормативными правовыми актами.
-1.2. Правила регулируют порядок приема и увольнения работников, основные права, обязанности и ответственность сторон трудового договора, режим работы, время отдыха, применяемые к работникам меры поощрения и взыскания, а также иные вопросы трудовых отношений в Обществе.
-
-2. ПОРЯДОК ПРИЕМА И УВОЛЬНЕНИЯ РАБОТНИКОВ
-2.1. Прием на работу осуществляется на основании заключенного трудового договора. При заключении трудового договора работник предъявляет документы, предусмотренные ст. 65 ТК РФ.
-2.2. Прекращение трудового договора происходит по основаниям, предусмотренным ТК РФ.
-
-3. ОСНОВНЫЕ ПРАВА И ОБЯЗАННОСТИ РАБОТНИКОВ
-3.1. Работник имеет право на:
-- предоставление работы, обусловленной трудовым договором;
-- своевременную и в полном объеме выплату заработной платы;
-- отдых, обеспечиваемый установлением нормальной продолжительности рабочего времени, выходных и нерабочих праздничных дней, оплачиваемых отпусков.
-3.2. Работник обязан:
-- добросовестно исполнять свои трудовые обязанности;
-- соблюдать Правила;
-- соблюдать трудовую дисциплину;
-- бережно относиться к имуществу Общества.
-
-4. ОСНОВНЫЕ ПРАВА И ОБЯЗАННОСТИ РАБОТОДАТЕЛЯ
-4.1. Работодатель имеет право:
-- заключать, изменять и расторгать трудовые договоры с работниками;
-- поощрять работников за добросовестный труд;
-- привлекать работников к дисциплинарной ответственности.
-4.2. Работодатель обязан:
-- соблюдать трудовое законодательство;
-- предоставлять работникам работу, обусловленную трудовым договором;
-- обеспечивать безопасность и условия труда;
-- выплачивать заработную плату в полном размере и в установленные сроки.
-
-5. РЕЖИМ РАБОЧЕГО ВРЕМЕНИ И ВРЕМЯ ОТДЫХА
-5.1. В Обществе устанавливается пятидневная рабочая неделя с двумя выходными днями (суббота, воскресенье) / иной режим: {work_schedule}.
-5.2. Время начала работы: {start_time}, окончания: {end_time}. Перерыв для отдыха и питания: с {break_start} до {break_end}.
-5.3. Работникам предоставляется ежегодный основной оплачиваемый отпуск продолжительностью 28 календарных дней.
-
-6. ОПЛАТА ТРУДА
-6.1. Заработная плата выплачивается два раза в месяц: {salary_dates}.
-
-7. ПООЩРЕНИЯ ЗА ТРУД И ДИСЦИПЛИНАРНЫЕ ВЗЫСКАНИЯ
-7.1. За образцовое выполнение трудовых обязанностей применяются поощрения: объявление благодарности, выдача премии, награждение ценным подарком.
-7.2. За совершение дисциплинарного проступка применяются взыскания: замечание, выговор, увольнение.
-
-8. ЗАКЛЮЧИТЕЛЬНЫЕ ПОЛОЖЕНИЯ
-8.1. Правила вступают в силу с даты их утверждения.
-8.2. С Правилами должны быть ознакомлены все работники под роспись.
-
-СОГЛАСОВАНО:
-Представитель работников (если есть): ____________________ /{employees_rep_signature}/""",
-         [
-             {"name": "company_name", "prompt": "Название организации:", "type": "str"},
-             {"name": "director_signature", "prompt": "Расшифровка подписи ген. директора:", "type": "str"},
-             {"name": "city", "prompt": "Город:", "type": "str"},
-             {"name": "date", "prompt": "Дата утверждения:", "type": "str"},
-             {"name": "work_schedule", "prompt": "Опишите режим работы (например, пятидневная неделя с 9:00 до 18:00, гибкий график):", "type": "str"},
-             {"name": "start_time", "prompt": "Время начала работы:", "type": "str"},
-             {"name": "end_time", "prompt": "Время окончания работы:", "type": "str"},
-             {"name": "break_start", "prompt": "Начало перерыва на обед:", "type": "str"},
-             {"name": "break_end", "prompt": "Окончание перерыва на обед:", "type": "str"},
-             {"name": "salary_dates", "prompt": "Даты выплаты зарплаты (например, 5 и 20 числа):", "type": "str"},
-             {"name": "employees_rep_signature", "prompt": "Расшифровка подписи представителя работников (если есть, иначе поставьте прочерк):", "type": "str"},
-         ]),
-    ],
-
-    # ---------- Досудебные документы ----------
-    "prejudicial": [
-        # 1. Претензия (общая)
-        ("claim", "Претензия (общая)",
-         """ПРЕТЕНЗИЯ
-Кому: {recipient_name}
-Адрес: {recipient_address}
-От кого: {sender_name}
-Адрес: {sender_address}
-Контактный телефон: {sender_phone}
-
-«{date}» между нами был заключен договор / возникли обязательства: {obligation_description}.
-В соответствии с договором я {sender_name} выполнил свои обязательства, что подтверждается {evidence}.
-Однако {recipient_name} до настоящего времени не исполнил(а) обязательства, а именно: {violation_details}.
-
-На основании ст. 309, 314 ГК РФ,
-
-ТРЕБУЮ:
-в срок до {deadline} исполнить обязательство: {demand_details}.
-
-В случае неисполнения требования я буду вынужден обратиться в суд с требованием о взыскании задолженности, неустойки и судебных расходов.
-
-Приложения:
-1. Копии документов, подтверждающих обстоятельства.
-
-Дата: {claim_date}                                   Подпись: {sender_signature}""",
-         [
-             {"name": "recipient_name", "prompt": "Кому адресована претензия (ФИО или наименование организации):", "type": "str"},
-             {"name": "recipient_address", "prompt": "Адрес получателя:", "type": "str"},
-             {"name": "sender_name", "prompt": "Ваше ФИО:", "type": "str"},
-             {"name": "sender_address", "prompt": "Ваш адрес:", "type": "str"},
-             {"name": "sender_phone", "prompt": "Ваш телефон:", "type": "str"},
-             {"name": "date", "prompt": "Дата договора или события:", "type": "str"},
-             {"name": "obligation_description", "prompt": "Опишите суть обязательства (что должны были сделать стороны):", "type": "str"},
-             {"name": "evidence", "prompt": "Что подтверждает выполнение вами обязательств?", "type": "str"},
-             {"name": "violation_details", "prompt": "В чем именно нарушение со стороны получателя?", "type": "str"},
-             {"name": "deadline", "prompt": "Срок для исполнения требования (например, до 10 июня 2024 г.):", "type": "str"},
-             {"name": "demand_details", "prompt": "Что именно вы требуете сделать?", "type": "str"},
-             {"name": "claim_date", "prompt": "Дата составления претензии:", "type": "str"},
-             {"name": "sender_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-
-        # 2. Ответ на претензию
-        ("response_to_claim", "Ответ на претензию",
-         """ОТВЕТ НА ПРЕТЕНЗИЮ
-от {response_date} № {response_number}
-
-Кому: {sender_name}
-Адрес: {sender_address}
-
-Рассмотрев Вашу претензию от {claim_date} о {claim_subject}, сообщаю следующее:
-
-{response_text}
-
-На основании изложенного,
-- признаем требования обоснованными и готовы удовлетворить в полном объеме / частично (указать) {satisfaction_details}
-- не признаем требования, поскольку {rejection_reasons}
-- предлагаем урегулировать спор следующим образом: {settlement_proposal}
-
-Приложения:
-{attachments}
-
-Подпись: ____________________ /{signature}/""",
-         [
-             {"name": "response_date", "prompt": "Дата ответа:", "type": "str"},
-             {"name": "response_number", "prompt": "Исходящий номер (если есть):", "type": "str"},
-             {"name": "sender_name", "prompt": "ФИО отправителя претензии:", "type": "str"},
-             {"name": "sender_address", "prompt": "Адрес отправителя:", "type": "str"},
-             {"name": "claim_date", "prompt": "Дата претензии:", "type": "str"},
-             {"name": "claim_subject", "prompt": "Кратко суть претензии:", "type": "str"},
-             {"name": "response_text", "prompt": "Текст ответа (объяснение позиции):", "type": "str"},
-             {"name": "satisfaction_details", "prompt": "Если требования признаются, укажите, какие и в каком объеме:", "type": "str"},
-             {"name": "rejection_reasons", "prompt": "Если не признаются, укажите причины отказа:", "type": "str"},
-             {"name": "settlement_proposal", "prompt": "Предложение по урегулированию (если есть):", "type": "str"},
-             {"name": "attachments", "prompt": "Приложения (перечислить):", "type": "str"},
-             {"name": "signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-
-        # 3. Требование (например, о возврате долга)
-        ("demand", "Требование (о возврате долга)",
-         """ТРЕБОВАНИЕ
-о возврате денежных средств
-
-Кому: {debtor_name}
-Адрес: {debtor_address}
-От кого: {creditor_name}
-Адрес: {creditor_address}
-
-«{loan_date}» я передал Вам в долг денежные средства в размере {debt_amount} ({debt_text}) рублей, что подтверждается распиской / договором займа от {loan_date}.
-Срок возврата был установлен до {repayment_date}.
-Однако до настоящего времени денежные средства не возвращены.
-
-На основании изложенного, руководствуясь ст. 807, 810 ГК РФ,
-
-ТРЕБУЮ:
-в срок до {final_deadline} возвратить сумму долга в размере {debt_amount} рублей.
-
-В случае невыполнения данного требования я буду вынужден обратиться в суд с исковым заявлением о взыскании долга, процентов за пользование чужими денежными средствами и судебных расходов.
-
-Дата: {demand_date}                                   Подпись: {creditor_signature}""",
-         [
-             {"name": "debtor_name", "prompt": "ФИО должника:", "type": "str"},
-             {"name": "debtor_address", "prompt": "Адрес должника:", "type": "str"},
-             {"name": "creditor_name", "prompt": "Ваше ФИО:", "type": "str"},
-             {"name": "creditor_address", "prompt": "Ваш адрес:", "type": "str"},
-             {"name": "loan_date", "prompt": "Дата передачи денег в долг:", "type": "str"},
-             {"name": "debt_amount", "prompt": "Сумма долга цифрами:", "type": "str"},
-             {"name": "debt_text", "prompt": "Сумма долга прописью:", "type": "str"},
-             {"name": "repayment_date", "prompt": "Срок возврата по договоренности:", "type": "str"},
-             {"name": "final_deadline", "prompt": "Крайний срок для возврата в требовании:", "type": "str"},
-             {"name": "demand_date", "prompt": "Дата составления требования:", "type": "str"},
-             {"name": "creditor_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-
-        # 4. Уведомление (например, о расторжении договора)
-        ("notice", "Уведомление (о расторжении договора)",
-         """УВЕДОМЛЕНИЕ
-о расторжении договора в одностороннем порядке
-
-Кому: {counterparty_name}
-Адрес: {counterparty_address}
-От кого: {sender_name}
-Адрес: {sender_address}
-
-Настоящим уведомляю Вас об одностороннем отказе от исполнения договора {contract_name} от {contract_date} № {contract_number} (далее – Договор) в связи с {termination_reason}.
-
-В соответствии с п. {contract_clause} Договора и ст. 450.1 ГК РФ договор считается расторгнутым с момента получения Вами настоящего уведомления / с {termination_date}.
-
-Прошу Вас в срок до {deadline} совершить действия по возврату полученного имущества / уплате задолженности / подписанию акта сверки.
-
-Приложения:
-(при необходимости)
-
-Дата: {notice_date}                                   Подпись: {sender_signature}""",
-         [
-             {"name": "counterparty_name", "prompt": "Наименование контрагента:", "type": "str"},
-             {"name": "counterparty_address", "prompt": "Адрес контрагента:", "type": "str"},
-             {"name": "sender_name", "prompt": "Ваше наименование:", "type": "str"},
-             {"name": "sender_address", "prompt": "Ваш адрес:", "type": "str"},
-             {"name": "contract_name", "prompt": "Название договора:", "type": "str"},
-             {"name": "contract_date", "prompt": "Дата договора:", "type": "str"},
-             {"name": "contract_number", "prompt": "Номер договора:", "type": "str"},
-             {"name": "termination_reason", "prompt": "Причина расторжения договора:", "type": "str"},
-             {"name": "contract_clause", "prompt": "Пункт договора, предусматривающий право на односторонний отказ (если есть):", "type": "str"},
-             {"name": "termination_date", "prompt": "Дата, с которой договор считается расторгнутым:", "type": "str"},
-             {"name": "deadline", "prompt": "Срок для выполнения требований после расторжения:", "type": "str"},
-             {"name": "notice_date", "prompt": "Дата уведомления:", "type": "str"},
-             {"name": "sender_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-    ],
-
-    # ---------- Прочие правовые бумаги ----------
-    "other": [
-        # 1. Доверенность (общая)
-        ("power_attorney_general", "Доверенность (общая)",
-         """ДОВЕРЕННОСТЬ
-г. {city}                                   «{date}»
-
-Я, {principal_name}, паспорт: серия {passport_series} номер {passport_number}, выдан {passport_issuer}, дата выдачи {passport_issue_date}, зарегистрированный по адресу: {principal_address},
-настоящей доверенностью уполномочиваю
-{agent_name}, паспорт: серия {agent_passport_series} номер {agent_passport_number}, выдан {agent_passport_issuer}, дата выдачи {agent_passport_issue_date}, зарегистрированного по адресу: {agent_address},
-
-представлять мои интересы во всех государственных и муниципальных органах, учреждениях, организациях, в том числе в судах, органах прокуратуры, полиции, ФНС, Росреестре, банках, перед физическими и юридическими лицами, со всеми правами, предоставленными законом истцу, ответчику, третьему лицу, в том числе с правом подписания и подачи исковых заявлений, предъявления их в суд, передачи спора на рассмотрение третейского суда, предъявления встречного иска, полного или частичного отказа от исковых требований, признания иска, изменения предмета или основания иска, заключения мирового соглашения, обжалования судебных актов, предъявления исполнительного документа ко взысканию, получения присужденного имущества или денег.
-
-Для выполнения настоящего поручения {agent_name} предоставляется право подавать заявления, справки, документы, получать необходимые документы и справки, расписываться за меня и совершать все действия, связанные с выполнением данного поручения.
-
-Доверенность выдана сроком на {validity_period} с правом передоверия / без права передоверия (нужное подчеркнуть).
-
-Подпись доверителя: ____________________ /{principal_signature}/
-
-Удостоверение подписи: (если требуется)""",
-         [
-             {"name": "city", "prompt": "Город:", "type": "str"},
-             {"name": "date", "prompt": "Дата выдачи доверенности:", "type": "str"},
-             {"name": "principal_name", "prompt": "Ваше ФИО (доверитель):", "type": "str"},
-             {"name": "passport_series", "prompt": "Серия паспорта доверителя:", "type": "str"},
-             {"name": "passport_number", "prompt": "Номер паспорта доверителя:", "type": "str"},
-             {"name": "passport_issuer", "prompt": "Кем выдан паспорт доверителя?", "type": "str"},
-             {"name": "passport_issue_date", "prompt": "Дата выдачи паспорта доверителя:", "type": "str"},
-             {"name": "principal_address", "prompt": "Адрес регистрации доверителя:", "type": "str"},
-             {"name": "agent_name", "prompt": "ФИО представителя (поверенного):", "type": "str"},
-             {"name": "agent_passport_series", "prompt": "Серия паспорта представителя:", "type": "str"},
-             {"name": "agent_passport_number", "prompt": "Номер паспорта представителя:", "type": "str"},
-             {"name": "agent_passport_issuer", "prompt": "Кем выдан паспорт представителя?", "type": "str"},
-             {"name": "agent_passport_issue_date", "prompt": "Дата выдачи паспорта представителя:", "type": "str"},
-             {"name": "agent_address", "prompt": "Адрес регистрации представителя:", "type": "str"},
-             {"name": "validity_period", "prompt": "Срок действия доверенности (например, 1 год, до 31.12.2025):", "type": "str"},
-             {"name": "principal_signature", "prompt": "Расшифровка подписи доверителя:", "type": "str"},
-         ]),
-
-        # 2. Юридическое заключение
-        ("legal_opinion", "Юридическое заключение",
-         """ЮРИДИЧЕСКОЕ ЗАКЛЮЧЕНИЕ
-по вопросу: {question}
-
-1. ВВОДНАЯ ЧАСТЬ
-Запрос от {request_date} от {client_name}.
-Представленные документы: {documents_list}.
-
-2. ОБСТОЯТЕЛЬСТВА ДЕЛА
-{circumstances}
-
-3. ПРАВОВОЙ АНАЛИЗ
-{legal_analysis}
-
-4. ВЫВОДЫ
-{conclusions}
-
-5. РЕКОМЕНДАЦИИ
-{recommendations}
-
-Юрист: ____________________ /{lawyer_name}/
-Дата: {opinion_date}""",
-         [
-             {"name": "question", "prompt": "Кратко сформулируйте вопрос, по которому требуется заключение:", "type": "str"},
-             {"name": "request_date", "prompt": "Дата запроса:", "type": "str"},
-             {"name": "client_name", "prompt": "Кто обратился за заключением?", "type": "str"},
-             {"name": "documents_list", "prompt": "Перечень документов, представленных для анализа:", "type": "str"},
-             {"name": "circumstances", "prompt": "Опишите обстоятельства дела:", "type": "str"},
-             {"name": "legal_analysis", "prompt": "Изложите правовой анализ ситуации со ссылками на нормы права:", "type": "str"},
-             {"name": "conclusions", "prompt": "Сформулируйте выводы по существу вопроса:", "type": "str"},
-             {"name": "recommendations", "prompt": "Дайте рекомендации:", "type": "str"},
-             {"name": "lawyer_name", "prompt": "ФИО юриста, составившего заключение:", "type": "str"},
-             {"name": "opinion_date", "prompt": "Дата заключения:", "type": "str"},
-         ]),
-
-        # 3. Адвокатский запрос
-        ("attorney_request", "Адвокатский запрос",
-         """АДВОКАТСКИЙ ЗАПРОС
-
-Кому: {recipient_organization}
-Адрес: {recipient_address}
-
-От адвоката {attorney_name}, регистрационный номер {attorney_reg_number} в реестре адвокатов {region}, удостоверение № {certificate_number} от {certificate_date},
-действующего в интересах доверителя {client_name} (ФИО) в рамках соглашения об оказании юридической помощи от {agreement_date}.
-
-На основании ст. 6.1 Федерального закона «Об адвокатской деятельности и адвокатуре в Российской Федерации»
-
-ПРОШУ:
-предоставить следующую информацию (документы, сведения):
-{request_details}
-
-Информация необходима для оказания юридической помощи доверителю по вопросу {case_description}.
-
-Ответ прошу направить по адресу: {attorney_address} или на электронную почту: {attorney_email}.
-
-Дата: {request_date}
-
-Адвокат: ____________________ /{attorney_signature}/
-М.П.""",
-         [
-             {"name": "recipient_organization", "prompt": "Наименование организации или ФИО должностного лица, куда направляется запрос:", "type": "str"},
-             {"name": "recipient_address", "prompt": "Адрес получателя:", "type": "str"},
-             {"name": "attorney_name", "prompt": "ФИО адвоката:", "type": "str"},
-             {"name": "attorney_reg_number", "prompt": "Регистрационный номер адвоката:", "type": "str"},
-             {"name": "region", "prompt": "Регион регистрации (например, Московская область):", "type": "str"},
-             {"name": "certificate_number", "prompt": "Номер удостоверения адвоката:", "type": "str"},
-             {"name": "certificate_date", "prompt": "Дата выдачи удостоверения:", "type": "str"},
-             {"name": "client_name", "prompt": "ФИО доверителя:", "type": "str"},
-             {"name": "agreement_date", "prompt": "Дата соглашения с доверителем:", "type": "str"},
-             {"name": "request_details", "prompt": "Что именно запрашивается (информация, документы)?", "type": "str"},
-             {"name": "case_description", "prompt": "По какому делу или вопросу требуется информация?", "type": "str"},
-             {"name": "attorney_address", "prompt": "Почтовый адрес для ответа:", "type": "str"},
-             {"name": "attorney_email", "prompt": "Email для ответа:", "type": "str"},
-             {"name": "request_date", "prompt": "Дата запроса:", "type": "str"},
-             {"name": "attorney_signature", "prompt": "Расшифровка подписи адвоката:", "type": "str"},
-         ]),
-
-        # 4. Заявление (общее)
-        ("application", "Заявление (общее)",
-         """ЗАЯВЛЕНИЕ
-
-Кому: {recipient}
-От кого: {applicant_name}
-Адрес: {applicant_address}
-Контактный телефон: {applicant_phone}
-
-ЗАЯВЛЕНИЕ
-
-Прошу {request_content}.
-
-Основание: {basis}.
-
-Приложения:
-{attachments}
-
-Дата: {application_date}                                   Подпись: {applicant_signature}""",
-         [
-             {"name": "recipient", "prompt": "Кому адресовано заявление (должность, ФИО, название организации):", "type": "str"},
-             {"name": "applicant_name", "prompt": "Ваше ФИО:", "type": "str"},
-             {"name": "applicant_address", "prompt": "Ваш адрес:", "type": "str"},
-             {"name": "applicant_phone", "prompt": "Ваш телефон:", "type": "str"},
-             {"name": "request_content", "prompt": "Изложите суть заявления (что просите):", "type": "str"},
-             {"name": "basis", "prompt": "На каком основании? (ссылка на закон, договор и т.д.):", "type": "str"},
-             {"name": "attachments", "prompt": "Перечень приложений (если есть):", "type": "str"},
-             {"name": "application_date", "prompt": "Дата подачи заявления:", "type": "str"},
-             {"name": "applicant_signature", "prompt": "Расшифровка подписи:", "type": "str"},
-         ]),
-    ],
-}
-
-# Для быстрого доступа к документу по его ключу (используется в хендлерах)
-DOCUMENTS_BY_KEY = {}
-for cat, docs in DOCUMENTS.items():
-    for doc in docs:
-        key = doc[0]
-        DOCUMENTS_BY_KEY[key] = doc
\ No newline at end of file
@@ -1,78 +1,618 @@
 import aiosqlite
-import hashlib
-import os
-from datetime import datetime
+import asyncio
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import passwords
 
 DB_PATH = "jurist_bot.db"
 
-def hash_password(password: str, salt: str = None) -> tuple:
-    if salt is None:
-        salt = os.urandom(16).hex()
-    hash_obj = hashlib.sha256((salt + password).encode())
-    return salt, hash_obj.hexdigest()
+# Количество соединений только для чтения (запись всегда идёт через одно соединение)
+READER_POOL_SIZE = 4
+# Размер кэша подготовленных выражений sqlite3 на каждое соединение
+STATEMENT_CACHE_SIZE = 256
 
-def verify_password(password: str, salt: str, hash_value: str) -> bool:
-    _, new_hash = hash_password(password, salt)
-    return new_hash == hash_value
+_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",        # ~8 МБ страничного кэша на соединение
+    "PRAGMA mmap_size = 67108864",      # 64 МБ
+    "PRAGMA busy_timeout = 5000",
+)
 
-async def init_db():
-    async with aiosqlite.connect(DB_PATH) as db:
+class ConnectionPool:
+    """
+    Долгоживущие соединения с базой: одно на запись и несколько на чтение.
+    База переводится в режим WAL, поэтому читатели не блокируются писателем.
+    """
+
+    def __init__(self, path: str, readers: int = READER_POOL_SIZE):
+        self.path = path
+        self.size = readers
+        self._writer = None
+        self._write_lock = asyncio.Lock()
+        self._readers = asyncio.Queue()
+        self._all_readers = []
+
+    async def _connect(self, read_only: bool = False):
+        conn = await aiosqlite.connect(self.path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = aiosqlite.Row
+        pragmas = _PRAGMAS + ("PRAGMA query_only = ON",) if read_only else _PRAGMAS
+        # executescript доводит каждую прагму до конца и не оставляет открытых курсоров
+        await conn.executescript(";\n".join(pragmas))
+        return conn
+
+    async def open(self):
+        self._writer = await self._connect()
+        await self._writer.executescript("PRAGMA journal_mode = WAL")
+        for _ in range(self.size):
+            conn = await self._connect(read_only=True)
+            self._all_readers.append(conn)
+            self._readers.put_nowait(conn)
+
+    async def close(self):
+        async with self._write_lock:
+            for conn in self._all_readers:
+                await conn.close()
+            self._all_readers.clear()
+            self._readers = asyncio.Queue()
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+
+    @asynccontextmanager
+    async def read(self):
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    @asynccontextmanager
+    async def write(self):
+        """Выдаёт соединение писателя; по выходу из блока фиксирует транзакцию."""
+        async with self._write_lock:
+            try:
+                yield self._writer
+                await self._writer.commit()
+            except BaseException:
+                await self._writer.rollback()
+                raise
+
+# ---------- Отложенная запись ----------
+# Некритичные записи (last_active, история документов) копятся в памяти
+# и сбрасываются одной транзакцией по размеру пачки или по таймеру.
+WRITE_BEHIND_BATCH_SIZE = 200
+WRITE_BEHIND_INTERVAL = 0.5         # секунд между сбросами
+WRITE_BEHIND_MAX_PENDING = 5000     # выше этого вызывающий ждёт сброса
+WRITE_BEHIND_MAX_ATTEMPTS = 3       # неудачных сбросов подряд, после которых пачка пишется по строке
+
+def _utc_timestamp() -> str:
+    # Тот же формат, что и у CURRENT_TIMESTAMP в SQLite
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+class WriteBehindQueue:
+    """
+    Фоновая очередь записи: повторные касания last_active одного пользователя
+    сливаются в одно, вставки документов уходят через executemany.
+    """
+
+    def __init__(self, pool: ConnectionPool, batch_size: int = WRITE_BEHIND_BATCH_SIZE,
+                 interval: float = WRITE_BEHIND_INTERVAL, max_pending: int = WRITE_BEHIND_MAX_PENDING):
+        self._pool = pool
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_pending = max_pending
+        self._touches = {}          # telegram_id -> время последнего касания
+        self._documents = []        # строки для INSERT INTO documents
+        self._document_owners = {}  # telegram_id -> число ожидающих документов
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = None
+        self._stopping = False
+        self._flushing_owners = {}  # владельцы документов пачки, которая сейчас записывается
+        self._failed_flushes = 0    # неудачных сбросов подряд
+        # Счётчики для мониторинга
+        self.flushes = 0
+        self.rows_written = 0
+        self.coalesced = 0
+        self.stalls = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._touches) + len(self._documents)
+
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            # Не отменяем задачу посреди сброса: она сама выходит из цикла
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            # Повторить сброс после остановки будет некому: сразу пишем по строке
+            logging.error(f"Ошибка отложенной записи при остановке: {e}")
+            self._failed_flushes = WRITE_BEHIND_MAX_ATTEMPTS
+            try:
+                await self.flush()
+            except Exception as e:
+                logging.error(f"При остановке не сохранено записей: {self.pending} ({e})")
+
+    async def touch(self, telegram_id: int):
+        if telegram_id in self._touches:
+            self.coalesced += 1
+        self._touches[telegram_id] = _utc_timestamp()
+        await self._after_enqueue()
+
+    async def add_document(self, row: tuple):
+        telegram_id = row[0]
+        self._documents.append(row)
+        self._document_owners[telegram_id] = self._document_owners.get(telegram_id, 0) + 1
+        await self._after_enqueue()
+
+    def has_documents_for(self, telegram_id: int) -> bool:
+        # Пачка в записи тоже считается: читатель дождётся её фиксации на _flush_lock
+        return telegram_id in self._document_owners or telegram_id in self._flushing_owners
+
+    def forget(self, telegram_id: int):
+        """Отбрасывает ожидающие записи пользователя (например, после удаления)."""
+        self._touches.pop(telegram_id, None)
+        if self._document_owners.pop(telegram_id, None):
+            self._documents = [row for row in self._documents if row[0] != telegram_id]
+
+    async def _after_enqueue(self):
+        if self.pending >= self.batch_size:
+            self._wakeup.set()
+        if self.pending >= self.max_pending:
+            # Запись не успевает: придерживаем вызывающего, пока очередь не сбросится
+            self.stalls += 1
+            try:
+                await self.flush()
+            except Exception as e:
+                # Ошибка пачки не относится к записи вызывающего: она осталась в очереди
+                logging.error(f"Ошибка отложенной записи в БД ({self.pending} в очереди): {e}")
+
+    def _requeue(self, touches: dict, documents: list):
+        # Возвращаем несохранённое в очередь, более свежие касания не затираем
+        for telegram_id, ts in touches.items():
+            self._touches.setdefault(telegram_id, ts)
+        self._documents[:0] = documents
+        for row in documents:
+            self._document_owners[row[0]] = self._document_owners.get(row[0], 0) + 1
+
+    async def _write(self, touches: dict, documents: list):
+        async with self._pool.write() as db:
+            if documents:
+                await db.executemany(
+                    "INSERT INTO documents (telegram_id, doc_key, doc_name, file_path, content_hash, file_id, "
+                    "inputs, template_version, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    documents
+                )
+            if touches:
+                await db.executemany(
+                    "UPDATE users SET last_active = ? WHERE telegram_id = ?",
+                    [(ts, telegram_id) for telegram_id, ts in touches.items()]
+                )
+
+    async def _write_by_row(self, touches: dict, documents: list) -> int:
+        """
+        Пишет пачку по строке, каждую своей транзакцией. Строка, на которой падает
+        запись, отбрасывается в лог; если недоступна сама база, остаток возвращается
+        в очередь. Возвращает число записанных строк.
+        """
+        rows = [({telegram_id: ts}, []) for telegram_id, ts in touches.items()]
+        rows += [({}, [row]) for row in documents]
+        written = 0
+        for index, (touch, document) in enumerate(rows):
+            try:
+                await self._write(touch, document)
+            except sqlite3.OperationalError:
+                # База занята или недоступна — строки тут ни при чём
+                rest = rows[index:]
+                self._requeue({k: v for t, _ in rest for k, v in t.items()}, [r for _, d in rest for r in d])
+                raise
+            except Exception as e:
+                self.dropped += 1
+                logging.error(f"Отложенная запись отброшена ({e}): {touch or document[0]}")
+            else:
+                written += 1
+        return written
+
+    async def flush(self):
+        # Отмена вызывающего (обработчика, читающего историю) не должна прервать
+        # запись пачки, уже вынутой из очереди: сброс доводится до конца отдельно
+        await asyncio.shield(self._flush())
+
+    async def _flush(self):
+        async with self._flush_lock:
+            touches, self._touches = self._touches, {}
+            documents, self._documents = self._documents, []
+            self._flushing_owners, self._document_owners = self._document_owners, {}
+            try:
+                await self._flush_batch(touches, documents)
+            finally:
+                self._flushing_owners = {}
+
+    async def _flush_batch(self, touches: dict, documents: list):
+        if not touches and not documents:
+            return
+        if self._failed_flushes >= WRITE_BEHIND_MAX_ATTEMPTS:
+            written = await self._write_by_row(touches, documents)
+        else:
+            try:
+                await self._write(touches, documents)
+            except Exception as e:
+                self._failed_flushes += 1
+                if self._failed_flushes < WRITE_BEHIND_MAX_ATTEMPTS:
+                    self._requeue(touches, documents)
+                    raise
+                # Пачка раз за разом не записывается — ищем строку, которая её ломает
+                logging.error(f"Пачка отложенной записи не сохраняется {self._failed_flushes} раз подряд "
+                              f"({e}), пишу по строке")
+                written = await self._write_by_row(touches, documents)
+            else:
+                written = len(touches) + len(documents)
+        self._failed_flushes = 0
+        self.flushes += 1
+        self.rows_written += written
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logging.error(f"Ошибка отложенной записи в БД ({self.pending} в очереди): {e}")
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "coalesced": self.coalesced,
+            "stalls": self.stalls,
+            "dropped": self.dropped,
+        }
+
+# ---------- Кэш пользователей ----------
+USER_CACHE_SIZE = 10000
+USER_CACHE_TTL = 300                # секунд
+
+class UserCache:
+    """
+    LRU-кэш строк users с ограниченным временем жизни.
+    Одновременные промахи по одному telegram_id делят одну загрузку.
+    """
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()     # telegram_id -> (истекает_в, строка или None)
+        self._loading = {}              # telegram_id -> Future текущей загрузки
+        self._generation = {}           # telegram_id -> счётчик инвалидаций
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, telegram_id: int, loader):
+        item = self._items.get(telegram_id)
+        if item is not None and item[0] > time.monotonic():
+            self._items.move_to_end(telegram_id)
+            self.hits += 1
+            return _copy_row(item[1])
+
+        future = self._loading.get(telegram_id)
+        if future is not None:
+            self.hits += 1
+            return _copy_row(await asyncio.shield(future))
+
+        self.misses += 1
+        generation = self._generation.get(telegram_id, 0)
+        future = asyncio.get_running_loop().create_future()
+        self._loading[telegram_id] = future
+        try:
+            row = await loader(telegram_id)
+        except BaseException as e:
+            future.set_exception(e)
+            # Исключение уже отдано вызывающему; ожидающие получат его через future
+            future.exception()
+            raise
+        else:
+            future.set_result(row)
+            # Если строку инвалидировали во время загрузки, результат в кэш не кладём
+            if self._generation.get(telegram_id, 0) == generation:
+                self._put(telegram_id, row)
+        finally:
+            if self._loading.get(telegram_id) is future:
+                del self._loading[telegram_id]
+        return _copy_row(row)
+
+    def _put(self, telegram_id: int, row):
+        self._items[telegram_id] = (time.monotonic() + self.ttl, row)
+        self._items.move_to_end(telegram_id)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def patch(self, telegram_id: int, **fields):
+        item = self._items.get(telegram_id)
+        if item is not None and item[1] is not None:
+            item[1].update(fields)
+
+    def invalidate(self, telegram_id: int):
+        self._items.pop(telegram_id, None)
+        self._loading.pop(telegram_id, None)
+        self._generation[telegram_id] = self._generation.get(telegram_id, 0) + 1
+        if len(self._generation) > self.maxsize:
+            self._generation.clear()
+
+    def clear(self):
+        self._items.clear()
+        self._loading.clear()
+        self._generation.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+def _copy_row(row):
+    return dict(row) if row is not None else None
+
+_user_cache = UserCache()
+
+_pool: ConnectionPool = None
+_write_behind: WriteBehindQueue = None
+
+def _get_pool() -> ConnectionPool:
+    if _pool is None:
+        raise RuntimeError("База данных не инициализирована: вызовите init_db()")
+    return _pool
+
+def _get_write_behind() -> WriteBehindQueue:
+    if _write_behind is None:
+        raise RuntimeError("База данных не инициализирована: вызовите init_db()")
+    return _write_behind
+
+# ---------- Миграции схемы ----------
+# Каждая миграция — (номер, список SQL-выражений). Номер последней применённой
+# миграции хранится в PRAGMA user_version. Миграции только дописываются в конец
+# списка; уже выпущенные не редактируются.
+MIGRATIONS = [
+    (1, [
         # Таблица users с полем secret_word
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                telegram_id INTEGER PRIMARY KEY,
-                user_type TEXT NOT NULL,
-                full_name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                inn TEXT,
-                secret_word TEXT NOT NULL,
-                password_salt TEXT NOT NULL,
-                password_hash TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            telegram_id INTEGER PRIMARY KEY,
+            user_type TEXT NOT NULL,
+            full_name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            inn TEXT,
+            secret_word TEXT NOT NULL,
+            password_salt TEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
         # Таблица документов
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS documents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                telegram_id INTEGER NOT NULL,
-                doc_key TEXT NOT NULL,
-                doc_name TEXT NOT NULL,
-                file_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (telegram_id) REFERENCES users (telegram_id) ON DELETE CASCADE
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            telegram_id INTEGER NOT NULL,
+            doc_key TEXT NOT NULL,
+            doc_name TEXT NOT NULL,
+            file_path TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (telegram_id) REFERENCES users (telegram_id) ON DELETE CASCADE
+        )
+        """,
         # Таблица вопросов
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS questions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                telegram_id INTEGER NOT NULL,
-                question TEXT NOT NULL,
-                answer TEXT,
-                status TEXT DEFAULT 'open',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                answered_at TIMESTAMP,
-                FOREIGN KEY (telegram_id) REFERENCES users (telegram_id) ON DELETE CASCADE
-            )
-        """)
-        await db.commit()
+        """
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            telegram_id INTEGER NOT NULL,
+            question TEXT NOT NULL,
+            answer TEXT,
+            status TEXT DEFAULT 'open',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            answered_at TIMESTAMP,
+            FOREIGN KEY (telegram_id) REFERENCES users (telegram_id) ON DELETE CASCADE
+        )
+        """,
+    ]),
+    (2, [
+        # Покрывающий индекс для «Мои документы»: список читается без обращения к таблице
+        "CREATE INDEX IF NOT EXISTS idx_documents_user_created ON documents (telegram_id, created_at DESC, doc_name)",
+        # Очередь вопросов для юристов
+        "CREATE INDEX IF NOT EXISTS idx_questions_status_created ON questions (status, created_at)",
+    ]),
+    (3, [
+        # Состояния FSM aiogram (см. storage.py); data — компактный JSON
+        """
+        CREATE TABLE IF NOT EXISTS fsm_sessions (
+            key TEXT PRIMARY KEY,
+            state TEXT,
+            data TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+        """,
+    ]),
+    (4, [
+        # file_id картинок, уже загруженных в Telegram (см. media.py)
+        """
+        CREATE TABLE IF NOT EXISTS media_file_ids (
+            cache_key TEXT PRIMARY KEY,
+            file_id TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+        """,
+    ]),
+    (5, [
+        # Сгенерированные файлы лежат в хранилище по хэшу содержимого (см. docstore.py)
+        "ALTER TABLE documents ADD COLUMN content_hash TEXT",
+        "ALTER TABLE documents ADD COLUMN file_id TEXT",
+        "CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents (content_hash)",
+    ]),
+    (6, [
+        # Вместо файла храним введённые значения и версию шаблона, по которой
+        # документ был выдан; файл пересобирается по запросу
+        "ALTER TABLE documents ADD COLUMN inputs TEXT",
+        "ALTER TABLE documents ADD COLUMN template_version TEXT",
+        """
+        CREATE TABLE IF NOT EXISTS template_versions (
+            version TEXT PRIMARY KEY,
+            doc_key TEXT NOT NULL,
+            template_text TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+        """,
+    ]),
+    (7, [
+        # Индекс упорядочен по (telegram_id, rowid): постраничный обход истории
+        # по id идёт без сортировки (выгрузка всех документов)
+        "CREATE INDEX IF NOT EXISTS idx_documents_user_id ON documents (telegram_id)",
+    ]),
+    (8, [
+        # Поля версии шаблона: сессия заполнения доводится до конца по той версии,
+        # с которой началась, даже если шаблон перезагрузили или бот перезапустили
+        "ALTER TABLE template_versions ADD COLUMN fields TEXT",
+    ]),
+    (9, [
+        # file_id одной и той же картинки может меняться; постоянен только file_unique_id
+        "ALTER TABLE media_file_ids ADD COLUMN file_unique_id TEXT",
+    ]),
+]
+
+# Горячие запросы и индексы, которыми они обязаны пользоваться.
+# Проверяются через EXPLAIN QUERY PLAN при каждом запуске.
+QUERY_PLAN_CHECKS = [
+    (
+        "SELECT id, doc_name, created_at FROM documents WHERE telegram_id = ? ORDER BY created_at DESC",
+        (0,),
+        "idx_documents_user_created",
+    ),
+    (
+        "SELECT id, doc_key, doc_name, created_at, content_hash, file_id, inputs, template_version "
+        "FROM documents WHERE telegram_id = ? AND id > ? ORDER BY id LIMIT ?",
+        (0, 0, 1),
+        "idx_documents_user_id",
+    ),
+    (
+        "SELECT file_id FROM documents WHERE content_hash = ? AND file_id IS NOT NULL LIMIT 1",
+        ("",),
+        "idx_documents_content_hash",
+    ),
+    (
+        "SELECT id, telegram_id, question, created_at FROM questions WHERE status = ? ORDER BY created_at LIMIT ?",
+        ("open", 1),
+        "idx_questions_status_created",
+    ),
+]
+
+async def get_schema_version() -> int:
+    async with _get_pool().read() as db:
+        async with db.execute("PRAGMA user_version") as cursor:
+            row = await cursor.fetchone()
+    return row[0]
+
+async def migrate():
+    """Применяет недостающие миграции; каждая выполняется в отдельной транзакции."""
+    current = await get_schema_version()
+    for version, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        async with _get_pool().write() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            for sql in statements:
+                await db.execute(sql)
+            # user_version меняется в той же транзакции, что и схема
+            await db.execute(f"PRAGMA user_version = {version:d}")
+        logging.info(f"Схема БД обновлена до версии {version}")
+
+async def explain_query_plan(sql: str, params: tuple = ()) -> list:
+    async with _get_pool().read() as db:
+        # EXPLAIN не сверяет версию схемы, поэтому сначала обновляем её обычным запросом
+        async with db.execute("SELECT count(*) FROM sqlite_master"):
+            pass
+        async with db.execute("EXPLAIN QUERY PLAN " + sql, params) as cursor:
+            rows = await cursor.fetchall()
+    return [row["detail"] for row in rows]
+
+async def check_query_plans() -> list:
+    """
+    Возвращает список проблем: запрос не использует ожидаемый индекс,
+    сканирует таблицу целиком или сортирует во временном B-дереве.
+    """
+    problems = []
+    for sql, params, index_name in QUERY_PLAN_CHECKS:
+        plan = await explain_query_plan(sql, params)
+        text = "; ".join(plan)
+        if index_name not in text or "SCAN " in text or "TEMP B-TREE" in text:
+            problems.append(f"{sql!r}: {text}")
+    return problems
+
+async def init_db():
+    global _pool, _write_behind
+    if _pool is None:
+        _pool = ConnectionPool(DB_PATH)
+        await _pool.open()
+    await migrate()
+    for problem in await check_query_plans():
+        logging.warning(f"Запрос выполняется без индекса: {problem}")
+    if _write_behind is None:
+        _write_behind = WriteBehindQueue(_pool)
+        _write_behind.start()
+
+async def close_db():
+    """Закрывает все соединения пула (вызывается при остановке бота)."""
+    global _pool, _write_behind
+    if _write_behind is not None:
+        await _write_behind.stop()
+        _write_behind = None
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+    _user_cache.clear()
 
 async def create_user(telegram_id: int, user_type: str, full_name: str, email: str, password: str, secret_word: str, inn: str = None):
-    salt, pwd_hash = hash_password(password)
-    async with aiosqlite.connect(DB_PATH) as db:
+    salt, pwd_hash = await passwords.hash_password(password)
+    async with _get_pool().write() as db:
         await db.execute(
             "INSERT INTO users (telegram_id, user_type, full_name, email, inn, secret_word, password_salt, password_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
             (telegram_id, user_type, full_name, email, inn, secret_word, salt, pwd_hash)
         )
-        await db.commit()
+    _user_cache.invalidate(telegram_id)
 
 async def get_user(telegram_id: int):
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM users WHERE telegram_id = ?", (telegram_id,))
-        row = await cursor.fetchone()
+    return await _user_cache.get(telegram_id, _load_user)
+
+def get_user_cache_stats() -> dict:
+    return _user_cache.stats()
+
+async def _load_user(telegram_id: int):
+    async with _get_pool().read() as db:
+        # Курсор обязательно закрываем: иначе соединение удерживает старый снимок WAL
+        async with db.execute("SELECT * FROM users WHERE telegram_id = ?", (telegram_id,)) as cursor:
+            row = await cursor.fetchone()
         return dict(row) if row else None
 
 async def check_password(telegram_id: int, password: str) -> bool:
@@ -81,7 +621,12 @@ async def check_password(telegram_id: int, password: str) -> bool:
         return False
     salt = user['password_salt']
     hash_value = user['password_hash']
-    return verify_password(password, salt, hash_value)
+    if not await passwords.verify_password(password, salt, hash_value):
+        return False
+    if passwords.needs_rehash(hash_value):
+        # Пароль верный, но хэш в устаревшем формате — переводим на текущий
+        await update_password(telegram_id, password)
+    return True
 
 async def check_secret_word(telegram_id: int, secret_word: str) -> bool:
     user = await get_user(telegram_id)
@@ -90,49 +635,163 @@ async def check_secret_word(telegram_id: int, secret_word: str) -> bool:
     return user['secret_word'] == secret_word
 
 async def update_password(telegram_id: int, new_password: str):
-    salt, pwd_hash = hash_password(new_password)
-    async with aiosqlite.connect(DB_PATH) as db:
+    salt, pwd_hash = await passwords.hash_password(new_password)
+    async with _get_pool().write() as db:
         await db.execute(
             "UPDATE users SET password_salt = ?, password_hash = ? WHERE telegram_id = ?",
             (salt, pwd_hash, telegram_id)
         )
-        await db.commit()
+    _user_cache.invalidate(telegram_id)
 
 async def update_last_active(telegram_id: int):
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "UPDATE users SET last_active = CURRENT_TIMESTAMP WHERE telegram_id = ?",
-            (telegram_id,)
-        )
-        await db.commit()
+    """Ставит отметку активности в очередь; запись в БД произойдёт в фоне."""
+    await _get_write_behind().touch(telegram_id)
+    _user_cache.patch(telegram_id, last_active=_utc_timestamp())
 
-async def add_document(telegram_id: int, doc_key: str, doc_name: str, file_path: str = None):
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "INSERT INTO documents (telegram_id, doc_key, doc_name, file_path) VALUES (?, ?, ?, ?)",
-            (telegram_id, doc_key, doc_name, file_path)
-        )
-        await db.commit()
+async def add_document(telegram_id: int, doc_key: str, doc_name: str, file_path: str = None,
+                       content_hash: str = None, file_id: str = None, inputs: str = None,
+                       template_version: str = None):
+    """Ставит документ в очередь истории; время создания фиксируется сразу."""
+    await _get_write_behind().add_document(
+        (telegram_id, doc_key, doc_name, file_path, content_hash, file_id, inputs, template_version, _utc_timestamp())
+    )
+
+async def get_document(doc_id: int, telegram_id: int):
+    """Документ из истории пользователя (чужие документы не возвращаются)."""
+    if _get_write_behind().has_documents_for(telegram_id):
+        await _write_behind.flush()
+    async with _get_pool().read() as db:
+        async with db.execute(
+            "SELECT * FROM documents WHERE id = ? AND telegram_id = ?",
+            (doc_id, telegram_id)
+        ) as cursor:
+            row = await cursor.fetchone()
+    return dict(row) if row else None
+
+async def get_file_id_by_hash(content_hash: str):
+    """file_id уже отправленного в Telegram файла с таким содержимым."""
+    async with _get_pool().read() as db:
+        async with db.execute(
+            "SELECT file_id FROM documents WHERE content_hash = ? AND file_id IS NOT NULL LIMIT 1",
+            (content_hash,)
+        ) as cursor:
+            row = await cursor.fetchone()
+    return row["file_id"] if row else None
+
+async def set_document_file_id(content_hash: str, file_id: str):
+    async with _get_pool().write() as db:
+        await db.execute("UPDATE documents SET file_id = ? WHERE content_hash = ?", (file_id, content_hash))
 
 async def get_user_documents(telegram_id: int):
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
+    # Пользователь должен видеть только что созданный документ
+    if _get_write_behind().has_documents_for(telegram_id):
+        await _write_behind.flush()
+    async with _get_pool().read() as db:
+        async with db.execute(
             "SELECT id, doc_name, created_at FROM documents WHERE telegram_id = ? ORDER BY created_at DESC",
             (telegram_id,)
-        )
-        rows = await cursor.fetchall()
+        ) as cursor:
+            rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
+async def iter_user_documents(telegram_id: int, page_size: int = 100):
+    """Вся история пользователя постранично (по id), без загрузки в память целиком."""
+    if _get_write_behind().has_documents_for(telegram_id):
+        await _write_behind.flush()
+    last_id = 0
+    while True:
+        async with _get_pool().read() as db:
+            async with db.execute(
+                "SELECT id, doc_key, doc_name, created_at, content_hash, file_id, inputs, template_version "
+                "FROM documents WHERE telegram_id = ? AND id > ? ORDER BY id LIMIT ?",
+                (telegram_id, last_id, page_size)
+            ) as cursor:
+                rows = [dict(row) for row in await cursor.fetchall()]
+        for row in rows:
+            yield row
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]["id"]
+
 async def add_question(telegram_id: int, question: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _get_pool().write() as db:
         await db.execute(
             "INSERT INTO questions (telegram_id, question) VALUES (?, ?)",
             (telegram_id, question)
         )
-        await db.commit()
+
+async def get_questions_by_status(status: str = "open", limit: int = 20):
+    async with _get_pool().read() as db:
+        async with db.execute(
+            "SELECT id, telegram_id, question, created_at FROM questions WHERE status = ? ORDER BY created_at LIMIT ?",
+            (status, limit)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+async def get_fsm_record(key: str):
+    """Возвращает (state, data_json) одним запросом или None, если сессии нет."""
+    async with _get_pool().read() as db:
+        async with db.execute("SELECT state, data FROM fsm_sessions WHERE key = ?", (key,)) as cursor:
+            row = await cursor.fetchone()
+    return (row["state"], row["data"]) if row else None
+
+async def save_fsm_record(key: str, state: str = None, data: str = None):
+    """Сохраняет состояние и данные сессии; пустая сессия удаляется."""
+    async with _get_pool().write() as db:
+        if state is None and data is None:
+            await db.execute("DELETE FROM fsm_sessions WHERE key = ?", (key,))
+        else:
+            await db.execute(
+                "INSERT INTO fsm_sessions (key, state, data, updated_at) VALUES (?, ?, ?, CURRENT_TIMESTAMP) "
+                "ON CONFLICT (key) DO UPDATE SET state = excluded.state, data = excluded.data, updated_at = excluded.updated_at",
+                (key, state, data)
+            )
+
+async def save_template_versions(rows: list):
+    """
+    rows: (version, doc_key, template_text, fields_json); текст известной версии
+    не перезаписывается, недостающие поля дописываются.
+    """
+    async with _get_pool().write() as db:
+        await db.executemany(
+            "INSERT INTO template_versions (version, doc_key, template_text, fields) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (version) DO UPDATE SET fields = excluded.fields WHERE fields IS NULL",
+            rows
+        )
+
+async def get_template_version(version: str):
+    """{"doc_key", "template_text", "fields"} или None; fields — JSON или None."""
+    async with _get_pool().read() as db:
+        async with db.execute(
+            "SELECT doc_key, template_text, fields FROM template_versions WHERE version = ?", (version,)
+        ) as cursor:
+            row = await cursor.fetchone()
+    return dict(row) if row else None
+
+async def get_media_file_ids() -> dict:
+    """cache_key -> (file_id, file_unique_id); file_unique_id пуст у записей до миграции 9."""
+    async with _get_pool().read() as db:
+        async with db.execute("SELECT cache_key, file_id, file_unique_id FROM media_file_ids") as cursor:
+            rows = await cursor.fetchall()
+    return {row["cache_key"]: (row["file_id"], row["file_unique_id"]) for row in rows}
+
+async def save_media_file_id(cache_key: str, file_id: str, file_unique_id: str = None):
+    async with _get_pool().write() as db:
+        await db.execute(
+            "INSERT INTO media_file_ids (cache_key, file_id, file_unique_id, updated_at) "
+            "VALUES (?, ?, ?, CURRENT_TIMESTAMP) "
+            "ON CONFLICT (cache_key) DO UPDATE SET file_id = excluded.file_id, "
+            "file_unique_id = excluded.file_unique_id, updated_at = excluded.updated_at",
+            (cache_key, file_id, file_unique_id)
+        )
+
+async def delete_media_file_id(cache_key: str):
+    async with _get_pool().write() as db:
+        await db.execute("DELETE FROM media_file_ids WHERE cache_key = ?", (cache_key,))
 
 async def delete_user(telegram_id: int):
-    async with aiosqlite.connect(DB_PATH) as db:
+    _get_write_behind().forget(telegram_id)
+    async with _get_pool().write() as db:
         await db.execute("DELETE FROM users WHERE telegram_id = ?", (telegram_id,))
-        await db.commit()
\ No newline at end of file
+    _user_cache.invalidate(telegram_id)
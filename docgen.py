@@ -1,33 +1,210 @@
+import re
+import zipfile
+from collections.abc import Mapping
+from functools import lru_cache
 from io import BytesIO
-from docx import Document
-from docx.shared import Pt
+from xml.sax.saxutils import escape as xml_escape
 
-def generate_docx_from_template(template_text: str, data: dict) -> BytesIO:
+from catalog import CATALOG_CACHE_SIZE, DOCUMENTS_BY_KEY, template_version
+
+# ---------- Компиляция шаблонов ----------
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+# Управляющие символы, недопустимые в XML документа Word
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+class TemplateError(ValueError):
+    pass
+
+class _Values(dict):
+    # Незаполненное поле остаётся в тексте как {имя}, как и раньше
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+def escape_value(value) -> str:
+    """Приводит введённое пользователем значение к виду, безопасному для документа."""
+    text = str(value).replace("\r\n", "\n").replace("\r", "\n")
+    return _INVALID_XML_CHARS.sub("", text)
+
+class CompiledTemplate:
+    """
+    Шаблон, разобранный один раз на литералы и подстановки.
+    Рендер выполняется за один проход (str.format_map), поэтому значение,
+    содержащее «{другое_поле}», повторно не подставляется.
+    """
+
+    __slots__ = ("placeholders", "version", "_format")
+
+    def __init__(self, template_text: str, field_names=None):
+        self.version = template_version(template_text)
+        parts = _PLACEHOLDER.split(template_text)
+        literals, names = parts[0::2], parts[1::2]
+        self.placeholders = tuple(dict.fromkeys(names))
+        if field_names is not None:
+            unknown = [name for name in self.placeholders if name not in field_names]
+            unused = [name for name in field_names if name not in self.placeholders]
+            if unknown or unused:
+                raise TemplateError(
+                    f"нет полей для подстановок {unknown}, поля без подстановок {unused}"
+                )
+        # Литеральные фигурные скобки экранируем, подстановки оставляем как {имя}
+        chunks = [literals[0].replace("{", "{{").replace("}", "}}")]
+        for name, literal in zip(names, literals[1:]):
+            chunks.append("{" + name + "}")
+            chunks.append(literal.replace("{", "{{").replace("}", "}}"))
+        self._format = "".join(chunks)
+
+    def render(self, data: dict) -> str:
+        return self._format.format_map(_Values(
+            (key, escape_value(value)) for key, value in data.items()
+        ))
+
+def compile_documents(documents_by_key: dict) -> dict:
+    """Компилирует все шаблоны каталога; ошибки собираются и выдаются разом."""
+    compiled, errors = {}, []
+    for doc_key, (_, _, template_text, fields) in documents_by_key.items():
+        try:
+            compiled[doc_key] = CompiledTemplate(template_text, [field["name"] for field in fields])
+        except TemplateError as e:
+            errors.append(f"{doc_key}: {e}")
+    if errors:
+        raise TemplateError("Ошибки в шаблонах документов:\n" + "\n".join(errors))
+    return compiled
+
+class LazyTemplates(Mapping):
+    """
+    Шаблоны каталога, скомпилированные при первом обращении.
+    Кэш ключуется версией шаблона: после перезагрузки каталога
+    перекомпилируются только изменившиеся шаблоны (полная проверка
+    каталога — python catalog.py check).
+    """
+
+    def __init__(self, documents, cache_size: int = CATALOG_CACHE_SIZE):
+        self._documents = documents
+        self._compile = lru_cache(maxsize=cache_size)(self._compile_one)
+
+    def _compile_one(self, doc_key: str, version: str) -> CompiledTemplate:
+        _, _, template_text, fields = self._documents[doc_key]
+        return CompiledTemplate(template_text, [field["name"] for field in fields])
+
+    def __getitem__(self, doc_key: str) -> CompiledTemplate:
+        return self._compile(doc_key, self._documents.entry(doc_key).version)
+
+    def __iter__(self):
+        return iter(self._documents)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+TEMPLATES = LazyTemplates(DOCUMENTS_BY_KEY)
+
+# ---------- Сборка документа ----------
+# Документ собирается напрямую из XML: неизменные части пакета .docx (типы,
+# связи, стили с Times New Roman 12 pt по умолчанию) упакованы один раз при
+# импорте, на каждый запрос формируется и сжимается только word/document.xml.
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:styles xmlns:w="{_W_NS}">'
+    '<w:docDefaults>'
+    '<w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" '
+    'w:eastAsia="Times New Roman" w:cs="Times New Roman"/>'
+    '<w:sz w:val="24"/><w:szCs w:val="24"/>'
+    '<w:lang w:val="ru-RU" w:eastAsia="en-US" w:bidi="ar-SA"/>'
+    '</w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+    '<w:name w:val="Normal"/><w:qFormat/>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+_DOCUMENT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:document xmlns:w="{_W_NS}"><w:body>'
+)
+# Параметры страницы как в шаблоне python-docx, которым документы собирались раньше
+_DOCUMENT_TAIL = (
+    '<w:sectPr>'
+    '<w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1800" w:bottom="1440" w:left="1800" '
+    'w:header="720" w:footer="720" w:gutter="0"/>'
+    '</w:sectPr>'
+    '</w:body></w:document>'
+)
+
+def _build_skeleton() -> bytes:
+    stream = BytesIO()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        package.writestr("_rels/.rels", _ROOT_RELS_XML)
+        package.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS_XML)
+        package.writestr("word/styles.xml", _STYLES_XML)
+    return stream.getvalue()
+
+_SKELETON = _build_skeleton()
+
+def _paragraph_xml(line: str) -> str:
+    line = line.strip()
+    if not line:
+        return "<w:p/>"  # пустая строка
+    text = xml_escape(line).replace("\t", '</w:t><w:tab/><w:t xml:space="preserve">')
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+def render_document_xml(text: str) -> bytes:
+    """Каждая строка текста становится абзацем, как и в прежней сборке через python-docx."""
+    body = "".join(_paragraph_xml(line) for line in text.split("\n"))
+    return (_DOCUMENT_HEAD + body + _DOCUMENT_TAIL).encode("utf-8")
+
+def generate_docx_from_template(template_text, data: dict) -> BytesIO:
     """
     Создаёт документ Word из текстового шаблона и словаря с данными.
-    Заменяет все вхождения {key} на соответствующие значения.
+    Шаблон может быть строкой или CompiledTemplate.
     Возвращает BytesIO с готовым файлом.
     """
-    # Подстановка данных
-    for key, value in data.items():
-        template_text = template_text.replace("{" + key + "}", value)
-
-    # Создаём новый документ
-    doc = Document()
-
-    # Разбиваем текст на строки и добавляем их как параграфы
-    for line in template_text.split('\n'):
-        if line.strip() == '':
-            doc.add_paragraph()  # пустая строка
-        else:
-            p = doc.add_paragraph(line.strip())
-            # Базовая настройка шрифта (можно убрать или настроить)
-            for run in p.runs:
-                run.font.name = 'Times New Roman'
-                run.font.size = Pt(12)
-
-    # Сохраняем в поток
-    file_stream = BytesIO()
-    doc.save(file_stream)
+    if not isinstance(template_text, CompiledTemplate):
+        template_text = CompiledTemplate(template_text)
+    document_xml = render_document_xml(template_text.render(data))
+
+    # Дописываем document.xml к готовому каркасу: остальные части уже сжаты
+    file_stream = BytesIO(_SKELETON)
+    with zipfile.ZipFile(file_stream, "a", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("word/document.xml", document_xml)
     file_stream.seek(0)
-    return file_stream
\ No newline at end of file
+    return file_stream
+
+def generate_document(doc_key: str, data: dict) -> BytesIO:
+    """Собирает документ каталога по его ключу."""
+    return generate_docx_from_template(TEMPLATES[doc_key], data)
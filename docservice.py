@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from catalog import DOCUMENTS_BY_KEY, template_version
+
+# ---------- Сборка документов в пуле процессов ----------
+# Обработчики не собирают .docx сами: задание кладётся в ограниченную очередь,
+# откуда его забирают процессы-сборщики. Цикл событий бота при этом свободен.
+DOCGEN_WORKERS = os.cpu_count() or 1
+DOCGEN_QUEUE_SIZE = 200             # заданий в очереди сверх выполняющихся
+DOCGEN_USER_LIMIT = 2               # одновременных заданий одного пользователя
+# Фоновые задачи (пакетная сборка, выгрузка) считаются отдельно: длинная очередь
+# из них не отнимает у пользователя места для документа, который он ждёт в чате
+DOCGEN_BACKGROUND_LIMIT = 2         # одновременных фоновых заданий одного пользователя
+
+class DocgenBusy(Exception):
+    """Очередь сборки переполнена — задание не принято."""
+
+class DocgenUserLimit(Exception):
+    """У пользователя уже собирается DOCGEN_USER_LIMIT (для фоновых — DOCGEN_BACKGROUND_LIMIT) документов."""
+
+class TemplateMismatch(Exception):
+    """В каталоге процесса-сборщика нет версии шаблона, которую ожидает бот."""
+
+@lru_cache(maxsize=64)
+def _compile(template_text: str):
+    import docgen
+    return docgen.CompiledTemplate(template_text)
+
+def _current_template(doc_key: str, version: str):
+    import docgen
+    template = docgen.TEMPLATES[doc_key]
+    if version is not None and template.version != version:
+        # Каталог перезагрузили в процессе бота: подтягиваем изменения здесь
+        docgen.DOCUMENTS_BY_KEY.reload()
+        template = docgen.TEMPLATES[doc_key]
+        if template.version != version:
+            raise TemplateMismatch(f"{doc_key}: нет версии шаблона {version}")
+    return template
+
+def _render_job(doc_key: str, values: dict, template_text: str = None, version: str = None) -> tuple:
+    # Выполняется в процессе-сборщике; docgen импортируется там один раз.
+    # template_text передаётся только для прежних версий шаблона.
+    import docgen
+    started = time.perf_counter()
+    if template_text is None:
+        template = _current_template(doc_key, version)
+    else:
+        template = _compile(template_text)
+    data = docgen.generate_docx_from_template(template, values).getvalue()
+    return data, time.perf_counter() - started
+
+class _Job:
+    __slots__ = ("telegram_id", "args", "future", "queued_at")
+
+    def __init__(self, telegram_id: int, args: tuple, future: asyncio.Future):
+        self.telegram_id = telegram_id
+        self.args = args
+        self.future = future
+        self.queued_at = time.perf_counter()
+
+class DocgenService:
+    def __init__(self, workers: int = DOCGEN_WORKERS, queue_size: int = DOCGEN_QUEUE_SIZE,
+                 user_limit: int = DOCGEN_USER_LIMIT, background_limit: int = DOCGEN_BACKGROUND_LIMIT):
+        self.workers = workers
+        self.user_limit = user_limit
+        self.background_limit = background_limit
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._in_flight = {}        # telegram_id -> число незавершённых заданий
+        self._background_in_flight = {}  # telegram_id -> число незавершённых фоновых заданий
+        self._busy_workers = 0
+        self._executor = None
+        self._tasks = []
+        # Метрики
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._render_times = deque(maxlen=1000)
+        self._wait_times = deque(maxlen=1000)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn: процессы-сборщики не наследуют потоки и соединения бота
+        return ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def start(self):
+        self._executor = self._new_executor()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            job.future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def saturated(self) -> bool:
+        """Новое задание не начнёт собираться сразу, а будет ждать в очереди."""
+        return self._busy_workers + self._queue.qsize() >= self.workers
+
+    def submit(self, telegram_id: int, doc_key: str, values: dict, template_text: str = None,
+               version: str = None, background: bool = False) -> asyncio.Future:
+        """
+        Ставит сборку в очередь; возвращает future с байтами .docx.
+        version — версия текущего шаблона каталога, которую ожидает вызывающий.
+        background — задание фоновой задачи, у него свой лимит на пользователя.
+        """
+        in_flight = self._background_in_flight if background else self._in_flight
+        limit = self.background_limit if background else self.user_limit
+        if in_flight.get(telegram_id, 0) >= limit:
+            self.rejected += 1
+            raise DocgenUserLimit()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(_Job(telegram_id, (doc_key, values, template_text, version), future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise DocgenBusy() from None
+        in_flight[telegram_id] = in_flight.get(telegram_id, 0) + 1
+        future.add_done_callback(lambda _: self._release(in_flight, telegram_id))
+        return future
+
+    @staticmethod
+    def _release(in_flight: dict, telegram_id: int):
+        count = in_flight.get(telegram_id, 0) - 1
+        if count > 0:
+            in_flight[telegram_id] = count
+        else:
+            in_flight.pop(telegram_id, None)
+
+    @staticmethod
+    async def _render(executor: ProcessPoolExecutor, args: tuple) -> tuple:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, _render_job, *args)
+        except TemplateMismatch:
+            # Каталог процесса разошёлся с каталогом бота: файл ещё не перечитан
+            # или правка на диске сломана, а бот держит прежнюю. Собираем по тексту бота.
+            doc_key, values, _, version = args
+            if doc_key not in DOCUMENTS_BY_KEY:
+                raise
+            template_text = DOCUMENTS_BY_KEY[doc_key][2]
+            if template_version(template_text) != version:
+                raise
+            return await loop.run_in_executor(executor, _render_job, doc_key, values, template_text, version)
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            if job.future.cancelled():
+                continue
+            self._wait_times.append(time.perf_counter() - job.queued_at)
+            self._busy_workers += 1
+            executor = self._executor
+            try:
+                data, render_time = await self._render(executor, job.args)
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except BrokenProcessPool as e:
+                # Процесс-сборщик упал: пересоздаём пул, задание считаем неудачным
+                self.failed += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+                if self._executor is executor:
+                    self._executor = self._new_executor()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    logging.error("Пул сборки документов пересоздан после падения процесса")
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"Ошибка сборки документа {job.args[0]}: {e}")
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                self.completed += 1
+                self._render_times.append(render_time)
+                if not job.future.done():
+                    job.future.set_result(data)
+            finally:
+                self._busy_workers -= 1
+
+    def stats(self) -> dict:
+        def ms(values, q):
+            if not values:
+                return 0.0
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "busy_workers": self._busy_workers,
+            "users_in_flight": len(self._in_flight),
+            "background_users_in_flight": len(self._background_in_flight),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "render_ms_p50": ms(self._render_times, 0.5),
+            "render_ms_p95": ms(self._render_times, 0.95),
+            "wait_ms_p50": ms(self._wait_times, 0.5),
+            "wait_ms_p95": ms(self._wait_times, 0.95),
+        }
+
+_service: DocgenService = None
+
+def start(workers: int = None):
+    global _service
+    if _service is None:
+        _service = DocgenService(workers or DOCGEN_WORKERS)
+        _service.start()
+
+async def stop():
+    global _service
+    if _service is not None:
+        await _service.stop()
+        _service = None
+
+def get_service() -> DocgenService:
+    if _service is None:
+        raise RuntimeError("Сервис сборки документов не запущен: вызовите docservice.start()")
+    return _service
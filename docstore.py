@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+
+import db
+import docservice
+from catalog import DOCUMENTS_BY_KEY
+
+# ---------- Документы по введённым данным ----------
+# Готовые файлы не хранятся: в истории лежат введённые значения и версия
+# шаблона, по которой документ был выдан. Файл пересобирается по запросу,
+# недавно собранные держатся в кэше с ограничением по объёму.
+RENDER_CACHE_BYTES = 32 * 2**20
+
+class TemplateVersionMissing(LookupError):
+    """Текст шаблона нужной версии не найден в базе."""
+
+class RenderCache:
+    """LRU собранных файлов по хэшу содержимого с бюджетом в байтах."""
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # content_hash -> bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, digest: str):
+        data = self._entries.get(digest)
+        if data is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return data
+
+    def put(self, digest: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        old = self._entries.pop(digest, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[digest] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+render_cache = RenderCache()
+_saved_versions = set()
+# Прежние версии шаблонов, прочитанные из базы: version -> (текст, поля)
+_old_versions = OrderedDict()
+OLD_VERSIONS_CACHE_SIZE = 64
+
+def current_version(doc_key: str) -> str:
+    # Версия берётся из индекса каталога, тело шаблона для этого не читается
+    return DOCUMENTS_BY_KEY.entry(doc_key).version
+
+def dump_inputs(values: dict) -> str:
+    return json.dumps(values, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+def load_inputs(text: str) -> dict:
+    return json.loads(text)
+
+def content_hash(doc_key: str, version: str, values: dict) -> str:
+    payload = json.dumps([doc_key, version, values], ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+async def save_version(doc_key: str, version: str):
+    """
+    Сохраняет текст и поля текущей версии шаблона при первом обращении к ней,
+    чтобы начатые сессии и старые документы собирались по своей версии.
+    """
+    if version in _saved_versions:
+        return
+    _, _, template_text, fields = DOCUMENTS_BY_KEY[doc_key]
+    await db.save_template_versions([
+        (version, doc_key, template_text, json.dumps(fields, ensure_ascii=False))
+    ])
+    _saved_versions.add(version)
+
+async def template_version(doc_key: str, version: str) -> tuple:
+    """
+    (текст_шаблона, список_полей) нужной версии: текущая берётся из каталога,
+    прежние — из таблицы template_versions.
+    """
+    if version is None or (doc_key in DOCUMENTS_BY_KEY and version == current_version(doc_key)):
+        _, _, template_text, fields = DOCUMENTS_BY_KEY[doc_key]
+        return template_text, fields
+    cached = _old_versions.get(version)
+    if cached is None:
+        row = await db.get_template_version(version)
+        if row is None:
+            raise TemplateVersionMissing(version)
+        cached = (row["template_text"], json.loads(row["fields"]) if row["fields"] else None)
+        _old_versions[version] = cached
+        if len(_old_versions) > OLD_VERSIONS_CACHE_SIZE:
+            _old_versions.popitem(last=False)
+    else:
+        _old_versions.move_to_end(version)
+    return cached
+
+async def submit(telegram_id: int, doc_key: str, version: str, values: dict, digest: str = None,
+                 background: bool = False) -> asyncio.Future:
+    """
+    Возвращает future с байтами документа: из кэша или из очереди сборки.
+    Исключения docservice (DocgenBusy, DocgenUserLimit) пробрасываются сразу.
+    """
+    digest = digest or content_hash(doc_key, version, values)
+    data = render_cache.get(digest)
+    if data is not None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(data)
+        return future
+
+    template_text = None
+    if doc_key not in DOCUMENTS_BY_KEY or version != current_version(doc_key):
+        template_text, _ = await template_version(doc_key, version)
+    elif DOCUMENTS_BY_KEY.is_override(doc_key):
+        # Правку из catalog/templates процесс-сборщик мог не прочитать; текст уже в памяти
+        template_text = DOCUMENTS_BY_KEY[doc_key][2]
+
+    future = docservice.get_service().submit(telegram_id, doc_key, values, template_text, version,
+                                                background=background)
+
+    def remember(done: asyncio.Future):
+        if not done.cancelled() and done.exception() is None:
+            render_cache.put(digest, done.result())
+
+    future.add_done_callback(remember)
+    return future
+
+async def render(telegram_id: int, doc_key: str, version: str, values: dict, digest: str = None,
+                 retries: int = 60) -> bytes:
+    """
+    Байты документа для фоновых задач (пакетная сборка, выгрузка истории):
+    при переполненной очереди ждёт и повторяет, а не отказывает сразу.
+    Задания идут по фоновому лимиту пользователя и не занимают места интерактивных.
+    """
+    for _ in range(retries):
+        try:
+            return await (await submit(telegram_id, doc_key, version, values, digest, background=True))
+        except (docservice.DocgenBusy, docservice.DocgenUserLimit):
+            await asyncio.sleep(1)
+    raise docservice.DocgenBusy()
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import os
+import tempfile
+import zipfile
+from collections import deque
+
+from aiogram import Bot
+from aiogram.types import FSInputFile
+
+import db
+import docservice
+import docstore
+
+# ---------- Выгрузка всей истории документов ----------
+# Документы читаются из базы постранично и собираются по одному (не больше
+# DOCGEN_BACKGROUND_LIMIT одновременно), архив пишется во временный файл. Когда часть
+# подходит к лимиту загрузки Telegram (50 МБ), она отправляется и начинается
+# следующая — память не зависит от длины истории.
+EXPORT_PART_BYTES = 45 * 2**20      # запас под служебные записи ZIP
+
+_tasks = {}                          # telegram_id -> фоновая задача выгрузки
+
+class _PartWriter:
+    """ZIP во временном файле, разбиваемый на части по EXPORT_PART_BYTES."""
+
+    def __init__(self, send_part, max_bytes: int = EXPORT_PART_BYTES):
+        self.send_part = send_part
+        self.max_bytes = max_bytes
+        self.parts = 0
+        self._path = None
+        self._archive = None
+        self._size = 0
+
+    async def add(self, name: str, data: bytes):
+        if self._archive is not None and self._size + len(data) > self.max_bytes:
+            await self.finish()
+        if self._archive is None:
+            fd, self._path = tempfile.mkstemp(suffix=".zip")
+            os.close(fd)
+            self._archive = zipfile.ZipFile(self._path, "w", zipfile.ZIP_STORED)
+            self._size = 0
+        self._archive.writestr(name, data)
+        self._size += len(data)
+
+    async def finish(self):
+        if self._archive is None:
+            return
+        self._archive.close()
+        self._archive = None
+        self.parts += 1
+        try:
+            await self.send_part(self._path, self.parts)
+        finally:
+            os.remove(self._path)
+            self._path = None
+
+    def discard(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+            os.remove(self._path)
+
+async def _load(bot: Bot, telegram_id: int, doc: dict) -> bytes:
+    # Пересобираем по сохранённым данным; документы до их появления скачиваем по file_id
+    if doc["inputs"]:
+        return await docstore.render(
+            telegram_id, doc["doc_key"], doc["template_version"],
+            docstore.load_inputs(doc["inputs"]), doc["content_hash"]
+        )
+    if doc["file_id"]:
+        return (await bot.download(doc["file_id"])).getvalue()
+    raise LookupError("нет данных для восстановления")
+
+async def export_documents(bot: Bot, telegram_id: int, send_part) -> tuple:
+    """
+    Пишет все документы пользователя в ZIP-части; send_part(path, part_no)
+    вызывается для каждой готовой части. Возвращает (документов, частей, пропущено).
+    """
+    writer = _PartWriter(send_part)
+    pending = deque()
+    exported = skipped = 0
+
+    async def write_one():
+        nonlocal exported, skipped
+        doc, task = pending.popleft()
+        try:
+            data = await task
+        except Exception as e:
+            logging.error(f"Выгрузка: документ {doc['id']} пропущен: {e}")
+            skipped += 1
+            return
+        await writer.add(f"{doc['created_at'][:10]}_{doc['doc_key']}_{doc['id']}.docx", data)
+        exported += 1
+
+    try:
+        async for doc in db.iter_user_documents(telegram_id):
+            pending.append((doc, asyncio.ensure_future(_load(bot, telegram_id, doc))))
+            if len(pending) >= docservice.DOCGEN_BACKGROUND_LIMIT:
+                await write_one()
+        while pending:
+            await write_one()
+        await writer.finish()
+    finally:
+        for _, task in pending:
+            task.cancel()
+        writer.discard()
+    return exported, writer.parts, skipped
+
+async def _run(bot: Bot, telegram_id: int, chat_id: int):
+    async def send_part(path: str, part_no: int):
+        await bot.send_document(chat_id, FSInputFile(path, filename=f"documents_{part_no}.zip"),
+                                caption=f"📦 Часть {part_no}")
+
+    try:
+        exported, parts, skipped = await export_documents(bot, telegram_id, send_part)
+        text = f"✅ Выгрузка завершена: документов {exported}, архивов {parts}."
+        if skipped:
+            text += f"\nНе удалось восстановить: {skipped}."
+        await bot.send_message(chat_id, text)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logging.error(f"Ошибка выгрузки документов пользователя {telegram_id}: {e}")
+        await bot.send_message(chat_id, "❌ Не удалось выгрузить документы, попробуйте позже.")
+    finally:
+        _tasks.pop(telegram_id, None)
+
+def start_export(bot: Bot, telegram_id: int, chat_id: int) -> bool:
+    """Запускает выгрузку в фоне; False, если у пользователя она уже идёт."""
+    if telegram_id in _tasks:
+        return False
+    _tasks[telegram_id] = asyncio.create_task(_run(bot, telegram_id, chat_id))
+    return True
+
+async def stop():
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
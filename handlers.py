@@ -1,11 +1,10 @@
 import re
 import logging
-import os
 from datetime import datetime
 from email_validator import validate_email, EmailNotValidError
 
 from aiogram import Router, F, Bot
-from aiogram.types import Message, CallbackQuery, BufferedInputFile, FSInputFile, InputMediaPhoto
+from aiogram.types import Message, CallbackQuery, BufferedInputFile, InputMediaPhoto
 from aiogram.filters import Command, CommandStart, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import default_state
@@ -13,53 +12,24 @@ from aiogram.exceptions import TelegramBadRequest
 
 import keyboards
 import db
+import media
 from config import LAWYER_GROUP_ID
-from data import CATEGORIES, DOCUMENTS_BY_KEY
-from states import Auth, Login, ResetPassword, Register, FillDocument, AskQuestion
-from docgen import generate_docx_from_template
-from aiogram.types import Message, CallbackQuery, BufferedInputFile, FSInputFile, ErrorEvent
+from catalog import CATEGORIES, DOCUMENTS_BY_KEY
+from states import Auth, Login, ResetPassword, Register, FillDocument, AskQuestion, BulkGenerate
+import docservice
+import docstore
+import bulk
+import export
+from aiogram.types import Message, CallbackQuery, BufferedInputFile, ErrorEvent
 router = Router()
 
-# ---------- Настройка изображений для разных типов сообщений ----------
-# Ключ - идентификатор типа сообщения, значение - относительный путь к файлу
-# Вы можете менять пути и добавлять новые типы по мере необходимости
-MESSAGE_IMAGES = {
-    "start": "./images/start.jpg",           # приветствие
-    "auth_login": "./images/login.jpg",      # экран входа (ввод пароля)
-    "forgot_password": "./images/forgot.jpg",# восстановление пароля
-    "register_type": "./images/register.jpg",# выбор типа пользователя
-    "register_fullname": "./images/register_name.jpg",
-    "register_email": "./images/register_email.jpg",
-    "register_inn": "./images/register_inn.jpg",
-    "register_secret": "./images/register_secret.jpg",
-    "register_password": "./images/register_password.jpg",
-    "main_menu": "./images/main_menu.jpg",   # главное меню
-    "profile": "./images/profile.jpg",       # профиль
-    "support": "./images/support.jpg",       # поддержка
-    "subscription": "./images/subscription.jpg",
-    "categories": "./images/categories.jpg", # список категорий документов
-    "documents_list": "./images/documents_list.jpg", # список документов в категории
-    "ask_question": "./images/ask.jpg",      # анонимный вопрос
-    "my_docs": "./images/my_docs.jpg",       # мои документы
-    "cancel": "./images/cancel.jpg",          # отмена действия
-    # Добавляйте свои типы по необходимости
-}
-
 async def send_photo_message(message: Message, text: str, msg_type: str = None, reply_markup=None):
     """
     Отправляет сообщение с картинкой, соответствующей типу msg_type.
     Если картинка не найдена или тип не указан, отправляет только текст.
     """
-    photo_path = MESSAGE_IMAGES.get(msg_type) if msg_type else None
     try:
-        if photo_path and os.path.exists(photo_path):
-            photo = FSInputFile(photo_path)
-            await message.answer_photo(
-                photo=photo,
-                caption=text,
-                reply_markup=reply_markup
-            )
-        else:
+        if not await media.send_photo(message, msg_type, text, reply_markup=reply_markup):
             await message.answer(text, reply_markup=reply_markup)
     except Exception as e:
         logging.error(f"Ошибка при отправке фото (тип {msg_type}): {e}")
@@ -67,26 +37,20 @@ async def send_photo_message(message: Message, text: str, msg_type: str = None,
 
 async def send_photo_callback(callback: CallbackQuery, text: str, msg_type: str = None, reply_markup=None):
     """
-    Удаляет старое сообщение и отправляет новое с картинкой, соответствующей типу msg_type.
+    Показывает новый экран с картинкой, соответствующей типу msg_type.
+    По возможности редактирует старое сообщение; если тип сообщения меняется
+    (фото <-> текст), удаляет его и отправляет новое.
     """
+    try:
+        if await media.edit_screen(callback.message, msg_type, text, reply_markup=reply_markup):
+            return
+    except Exception as e:
+        logging.error(f"Ошибка при редактировании экрана (тип {msg_type}): {e}")
     try:
         await callback.message.delete()
     except TelegramBadRequest:
         pass
-    photo_path = MESSAGE_IMAGES.get(msg_type) if msg_type else None
-    try:
-        if photo_path and os.path.exists(photo_path):
-            photo = FSInputFile(photo_path)
-            await callback.message.answer_photo(
-                photo=photo,
-                caption=text,
-                reply_markup=reply_markup
-            )
-        else:
-            await callback.message.answer(text, reply_markup=reply_markup)
-    except Exception as e:
-        logging.error(f"Ошибка при отправке фото (тип {msg_type}): {e}")
-        await callback.message.answer(text, reply_markup=reply_markup)
+    await send_photo_message(callback.message, text, msg_type=msg_type, reply_markup=reply_markup)
 
 # ---------- Старт ----------
 @router.message(CommandStart())
@@ -478,19 +442,19 @@ async def back_to_categories(callback: CallbackQuery):
 @router.callback_query(F.data.startswith("doc_"))
 async def start_fill_document(callback: CallbackQuery, state: FSMContext):
     doc_key = callback.data[4:]
-    doc_info = DOCUMENTS_BY_KEY.get(doc_key)
-    if not doc_info:
+    if doc_key not in DOCUMENTS_BY_KEY:
         await callback.answer("Документ не найден", show_alert=True)
         return
 
-    _, doc_name, template_text, fields = doc_info
-
+    # В сессии храним только ключ документа, версию шаблона, курсор и ответы;
+    # текст шаблона и список полей берутся из каталога (или из базы, если
+    # шаблон успели обновить) — сессия доводится по той версии, с которой началась
+    version = docstore.current_version(doc_key)
+    await docstore.save_version(doc_key, version)
     await state.set_state(FillDocument.waiting_for_field)
     await state.update_data(
         doc_key=doc_key,
-        doc_name=doc_name,
-        template=template_text,
-        fields=fields,
+        version=version,
         field_index=0,
         collected={}
     )
@@ -498,13 +462,14 @@ async def start_fill_document(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
     await ask_next_field(callback.message, state)
 
-async def ask_next_field(message: Message, state: FSMContext):
-    data = await state.get_data()
-    fields = data['fields']
+async def ask_next_field(message: Message, state: FSMContext, data: dict = None):
+    if data is None:
+        data = await state.get_data()
+    _, fields = await docstore.template_version(data['doc_key'], data.get('version'))
     idx = data['field_index']
 
     if idx >= len(fields):
-        await generate_and_send_document(message, state)
+        await generate_and_send_document(message, state, data)
         return
 
     field = fields[idx]
@@ -519,40 +484,90 @@ async def ask_next_field(message: Message, state: FSMContext):
 @router.message(StateFilter(FillDocument.waiting_for_field))
 async def process_field_input(message: Message, state: FSMContext):
     data = await state.get_data()
-    fields = data['fields']
+    try:
+        _, fields = await docstore.template_version(data['doc_key'], data.get('version'))
+    except (KeyError, docstore.TemplateVersionMissing):
+        fields = None
+    if not fields:
+        await state.clear()
+        await send_photo_message(message, "❌ Документ больше недоступен. Начните заново: /start", msg_type="cancel")
+        return
     idx = data['field_index']
     field = fields[idx]
 
     collected = data.get('collected', {})
     collected[field['name']] = message.text
-    await state.update_data(collected=collected, field_index=idx + 1)
+    data = await state.update_data(collected=collected, field_index=idx + 1)
 
-    await ask_next_field(message, state)
+    await ask_next_field(message, state, data)
 
-async def generate_and_send_document(message: Message, state: FSMContext):
-    data = await state.get_data()
+async def generate_and_send_document(message: Message, state: FSMContext, data: dict = None):
+    if data is None:
+        data = await state.get_data()
     doc_key = data['doc_key']
-    doc_name = data['doc_name']
-    template_text = data['template']
+    version = data.get('version')
+    if version is None:
+        # Сессия начата до появления версий в FSM — собираем по текущему шаблону
+        version = docstore.current_version(doc_key)
+        await docstore.save_version(doc_key, version)
+    _, fields = await docstore.template_version(doc_key, version)
+    doc_name = DOCUMENTS_BY_KEY.entry(doc_key).name if doc_key in DOCUMENTS_BY_KEY else doc_key
     collected = data['collected']
     telegram_id = message.from_user.id
+    filename = f"{doc_key}.docx"
+    caption = f"✅ Ваш документ «{doc_name}» готов!"
 
+    inputs = docstore.dump_inputs(collected)
+
+    # Такой же документ уже собирался — пересылаем по file_id без сборки и загрузки
+    digest = docstore.content_hash(doc_key, version, collected)
+    file_id = await db.get_file_id_by_hash(digest)
+    if file_id:
+        try:
+            await message.answer_document(file_id, caption=caption)
+        except TelegramBadRequest:
+            file_id = None
+        else:
+            await state.clear()
+            await db.add_document(telegram_id, doc_key, doc_name, None, digest, file_id, inputs, version)
+            user = await db.get_user(telegram_id)
+            await show_main_menu(message, user['user_type'])
+            return
+
+    # Документ собирается в пуле процессов; обработчик только ждёт результат.
+    # Загрузку пула смотрим до постановки, иначе своё же задание считается очередью
+    queued = docservice.get_service().saturated
     try:
-        file_stream = generate_docx_from_template(template_text, collected)
+        job = await docstore.submit(telegram_id, doc_key, version, collected, digest)
+    except (docservice.DocgenBusy, docservice.DocgenUserLimit) as e:
+        text = ("⏳ Дождитесь готовности предыдущих документов"
+                if isinstance(e, docservice.DocgenUserLimit) else "⏳ Сервис сейчас перегружен")
+        # Ответы сохраняем: повторная отправка последнего ответа снова запустит сборку
+        await state.update_data(field_index=len(fields) - 1)
+        await send_photo_message(
+            message,
+            f"{text}. Через минуту отправьте ответ на последний вопрос ещё раз.",
+            msg_type="documents_list",
+            reply_markup=keyboards.get_cancel_keyboard()
+        )
+        return
+    await state.clear()
+    if not job.done() and queued:
+        await message.answer("⏳ Документ поставлен в очередь и придёт в ближайшее время.")
+
+    try:
+        document = await job
     except Exception as e:
         await send_photo_message(message, f"❌ Ошибка при генерации документа: {e}", msg_type="cancel")
-        await state.clear()
         return
 
-    filename = f"{doc_key}.docx"
-    await message.answer_document(
-        BufferedInputFile(file_stream.read(), filename=filename),
-        caption=f"✅ Ваш документ «{doc_name}» готов!"
+    sent = await message.answer_document(
+        BufferedInputFile(document, filename=filename),
+        caption=caption
     )
 
-    await db.add_document(telegram_id, doc_key, doc_name)
+    await db.add_document(telegram_id, doc_key, doc_name, None, digest, sent.document.file_id, inputs, version)
 
-    await state.clear()
     user = await db.get_user(telegram_id)
     await show_main_menu(message, user['user_type'])
 
@@ -571,10 +586,129 @@ async def show_my_docs(callback: CallbackQuery):
         reply_markup=keyboards.get_my_docs_keyboard(docs)
     )
 
+@router.callback_query(F.data == "my_docs_export")
+async def export_my_docs(callback: CallbackQuery):
+    # Архив собирается в фоне и приходит частями; бот в это время отвечает как обычно
+    if not export.start_export(callback.bot, callback.from_user.id, callback.message.chat.id):
+        await callback.answer("Выгрузка уже идёт, дождитесь архива", show_alert=True)
+        return
+    await callback.answer("⏳ Собираю архив, он придёт отдельным сообщением", show_alert=True)
+
 @router.callback_query(F.data.startswith("my_doc_"))
 async def show_my_document(callback: CallbackQuery):
     doc_id = int(callback.data.split("_")[2])
-    await callback.answer("Просмотр документа временно недоступен", show_alert=True)
+    doc = await db.get_document(doc_id, callback.from_user.id)
+    if not doc:
+        await callback.answer("Документ не найден", show_alert=True)
+        return
+    caption = f"📄 {doc['doc_name']} ({doc['created_at'][:10]})"
+
+    # Сначала пробуем file_id: повторная отправка без загрузки файла
+    if doc['file_id']:
+        try:
+            await callback.message.answer_document(doc['file_id'], caption=caption)
+            await callback.answer()
+            return
+        except TelegramBadRequest:
+            pass
+    # Иначе пересобираем по сохранённым данным той версией шаблона, по которой документ выдан
+    if not doc['inputs']:
+        await callback.answer("Просмотр документа временно недоступен", show_alert=True)
+        return
+    try:
+        job = await docstore.submit(
+            callback.from_user.id, doc['doc_key'], doc['template_version'],
+            docstore.load_inputs(doc['inputs']), doc['content_hash']
+        )
+        document = await job
+    except (docservice.DocgenBusy, docservice.DocgenUserLimit):
+        await callback.answer("⏳ Сервис сейчас перегружен, попробуйте через минуту", show_alert=True)
+        return
+    except Exception as e:
+        logging.error(f"Не удалось пересобрать документ {doc_id}: {e}")
+        await callback.answer("Просмотр документа временно недоступен", show_alert=True)
+        return
+    sent = await callback.message.answer_document(
+        BufferedInputFile(document, filename=f"{doc['doc_key']}.docx"),
+        caption=caption
+    )
+    await callback.answer()
+    if doc['content_hash']:
+        await db.set_document_file_id(doc['content_hash'], sent.document.file_id)
+
+# ---------- Пакетное создание документов ----------
+@router.callback_query(F.data == "menu_bulk")
+async def bulk_start(callback: CallbackQuery, state: FSMContext):
+    user = await db.get_user(callback.from_user.id)
+    if not user or user['user_type'] != "legal":
+        await callback.answer("Доступно только юридическим лицам", show_alert=True)
+        return
+    if await state.get_state() is not None:
+        await callback.answer("Сначала завершите текущее действие.", show_alert=True)
+        return
+    await callback.answer()
+    await send_photo_callback(
+        callback,
+        "📦 Выберите документ для пакетного создания:",
+        msg_type="documents_list",
+        reply_markup=keyboards.get_bulk_documents_keyboard()
+    )
+
+@router.callback_query(F.data.startswith("bulk_doc_"))
+async def bulk_choose_document(callback: CallbackQuery, state: FSMContext):
+    # Кнопка может остаться в старом сообщении: права проверяем и здесь
+    user = await db.get_user(callback.from_user.id)
+    if not user or user['user_type'] != "legal":
+        await callback.answer("Доступно только юридическим лицам", show_alert=True)
+        return
+    doc_key = callback.data[9:]
+    if doc_key not in DOCUMENTS_BY_KEY:
+        await callback.answer("Документ не найден", show_alert=True)
+        return
+    await state.set_state(BulkGenerate.waiting_for_file)
+    await state.update_data(doc_key=doc_key)
+    await callback.answer()
+    await callback.message.answer_document(
+        BufferedInputFile(bulk.sample_csv(doc_key), filename=f"{doc_key}.csv"),
+        caption=(
+            f"Отправьте файл .csv или .jsonl: одна строка — один документ, "
+            f"колонки — имена полей, как в заготовке. До {bulk.BULK_MAX_ROWS} строк."
+        ),
+        reply_markup=keyboards.get_cancel_keyboard()
+    )
+
+@router.message(StateFilter(BulkGenerate.waiting_for_file), F.document)
+async def bulk_process_file(message: Message, state: FSMContext):
+    doc_key = (await state.get_data())['doc_key']
+    if message.document.file_size and message.document.file_size > bulk.BULK_MAX_FILE_BYTES:
+        await message.answer(f"❌ Файл больше {bulk.BULK_MAX_FILE_BYTES // 2**20} МБ.")
+        return
+    upload = await message.bot.download(message.document)
+    try:
+        rows = bulk.parse_upload(upload.getvalue(), message.document.file_name or "", doc_key)
+    except bulk.BulkError as e:
+        await message.answer(f"❌ Ошибка в файле: {e}. Исправьте и отправьте снова.",
+                             reply_markup=keyboards.get_cancel_keyboard())
+        return
+    # Сборка идёт в фоне: пользователь может пользоваться ботом и остановить её кнопкой
+    if not bulk.start_bulk(message.bot, message.from_user.id, message.chat.id, doc_key, rows):
+        await message.answer("⏳ Предыдущая пакетная сборка ещё идёт, дождитесь архива.")
+        return
+    await state.clear()
+    user = await db.get_user(message.from_user.id)
+    await show_main_menu(message, user['user_type'])
+
+@router.callback_query(F.data == "bulk_cancel")
+async def bulk_cancel(callback: CallbackQuery):
+    if not bulk.cancel_bulk(callback.from_user.id):
+        await callback.answer("Сборка уже завершена")
+        return
+    await callback.answer("Сборка остановлена")
+
+@router.message(StateFilter(BulkGenerate.waiting_for_file))
+async def bulk_expect_file(message: Message):
+    await message.answer("Отправьте файл .csv или .jsonl с данными документов.",
+                         reply_markup=keyboards.get_cancel_keyboard())
 
 @router.callback_query(F.data == "menu_ask")
 async def ask_question_start(callback: CallbackQuery, state: FSMContext):
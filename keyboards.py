@@ -1,6 +1,6 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from data import CATEGORIES, DOCUMENTS
+from catalog import CATEGORIES, DOCUMENTS_BY_KEY
 
 def get_auth_keyboard() -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
@@ -51,6 +51,7 @@ def get_main_keyboard(user_type: str) -> InlineKeyboardMarkup:
         builder.add(
             InlineKeyboardButton(text="📄 Создать документ", callback_data="menu_create_doc"),
             InlineKeyboardButton(text="📁 Мои документы", callback_data="menu_my_docs"),
+            InlineKeyboardButton(text="📦 Пакетное создание", callback_data="menu_bulk"),
             InlineKeyboardButton(text="🔍 Проверить контрагента", callback_data="menu_check_org"),
             InlineKeyboardButton(text="🆘 Поддержка", callback_data="menu_support"),
             InlineKeyboardButton(text="👤 Профиль", callback_data="menu_profile"),
@@ -80,13 +81,27 @@ def get_categories_keyboard() -> InlineKeyboardMarkup:
 
 def get_category_keyboard(cat_id: str) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
-    documents = DOCUMENTS.get(cat_id, [])
-    for doc_key, doc_name, _, _ in documents:
-        builder.add(InlineKeyboardButton(text=doc_name, callback_data=f"doc_{doc_key}"))
+    # Кнопки строятся по индексу каталога, тексты шаблонов не читаются
+    for entry in DOCUMENTS_BY_KEY.by_category(cat_id):
+        builder.add(InlineKeyboardButton(text=entry.name, callback_data=f"doc_{entry.key}"))
     builder.add(InlineKeyboardButton(text="🔙 К категориям", callback_data="back_to_categories"))
     builder.adjust(1)
     return builder.as_markup()
 
+def get_bulk_documents_keyboard() -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    for doc_key in DOCUMENTS_BY_KEY:
+        entry = DOCUMENTS_BY_KEY.entry(doc_key)
+        builder.add(InlineKeyboardButton(text=entry.name, callback_data=f"bulk_doc_{doc_key}"))
+    builder.add(InlineKeyboardButton(text="🔙 Назад в меню", callback_data="back_to_main"))
+    builder.adjust(1)
+    return builder.as_markup()
+
+def get_bulk_cancel_keyboard() -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    builder.add(InlineKeyboardButton(text="❌ Остановить сборку", callback_data="bulk_cancel"))
+    return builder.as_markup()
+
 def get_my_docs_keyboard(docs_list: list) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     for doc in docs_list:
@@ -94,6 +109,7 @@ def get_my_docs_keyboard(docs_list: list) -> InlineKeyboardMarkup:
             text=f"{doc['doc_name']} ({doc['created_at'][:10]})",
             callback_data=f"my_doc_{doc['id']}"
         ))
+    builder.add(InlineKeyboardButton(text="📦 Скачать все", callback_data="my_docs_export"))
     builder.add(InlineKeyboardButton(text="🔙 Назад в меню", callback_data="back_to_main"))
     builder.adjust(1)
     return builder.as_markup()
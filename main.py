@@ -1,27 +1,113 @@
 import asyncio
+import json
 import logging
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
 
-from config import BOT_TOKEN
+from config import BOT_MODE, BOT_TOKEN, TELEGRAM_API_URL
+import bulk
+import catalog
 import db
+import docservice
+import docstore
+import export
 import handlers
+import media
+import middlewares
+import outbox
+import passwords
+import webhook
+from storage import SQLiteStorage
 
 logging.basicConfig(level=logging.INFO)
 
-async def main():
-    # Инициализация базы данных
-    await db.init_db()
+STATS_INTERVAL = 60                 # секунд между записями статистики в лог
+
+def create_bot(scheduler: outbox.SendScheduler = None) -> Bot:
+    if TELEGRAM_API_URL:
+        session = AiohttpSession(api=TelegramAPIServer.from_base(TELEGRAM_API_URL))
+    else:
+        session = AiohttpSession()
+    # Все отправки сообщений идут через очередь с лимитами Telegram
+    session.middleware(scheduler or outbox.SendScheduler())
+    return Bot(token=BOT_TOKEN, session=session, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
 
-    bot = Bot(token=BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)
+def create_dispatcher() -> Dispatcher:
+    dp = Dispatcher(storage=SQLiteStorage())
+    # После UserContextMiddleware aiogram, чтобы был известен event_from_user.
+    # Общий лимит пользователя проверяется до его очереди апдейтов,
+    # лимиты обработчиков — после фильтров, когда обработчик известен
+    dp.update.outer_middleware(middlewares.throttle)
+    dp.update.outer_middleware(middlewares.user_order)
+    dp.message.middleware(middlewares.throttle)
+    dp.callback_query.middleware(middlewares.throttle)
     dp.include_router(handlers.router)
+    return dp
+
+def collect_stats(dp: Dispatcher, scheduler: outbox.SendScheduler) -> dict:
+    """Метрики процесса: сборка документов, кэши, навигация, очередь апдейтов, лимиты, отправка."""
+    return {
+        "docgen": docservice.get_service().stats(),
+        "user_cache": db.get_user_cache_stats(),
+        "render_cache": docstore.render_cache.stats(),
+        "fsm": dp.storage.stats(),
+        "navigation": media.navigation_stats(),
+        "user_order": middlewares.user_order.stats(),
+        "throttle": middlewares.throttle.stats(),
+        "outbox": scheduler.stats(),
+    }
+
+async def report_stats(stats, interval: float = STATS_INTERVAL):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            logging.info(f"Статистика: {json.dumps(stats(), ensure_ascii=False)}")
+        except Exception as e:
+            logging.error(f"Ошибка сбора статистики: {e}")
+
+async def start_services(docgen_workers: int = None, stats=None) -> list:
+    """
+    Поднимает базу, кэши и фоновые сервисы; возвращает задачи для stop_services.
+    stats — функция, возвращающая метрики; они пишутся в лог каждые STATS_INTERVAL секунд.
+    """
+    await db.init_db()
+    await media.load_file_ids()
+    media.build_manifest()
+    watchers = [
+        asyncio.create_task(media.watch_images()),
+        asyncio.create_task(catalog.watch_templates()),
+    ]
+    docservice.start(docgen_workers)
+    if stats is not None:
+        watchers.append(asyncio.create_task(report_stats(stats)))
+    return watchers
+
+async def stop_services(watchers: list):
+    for task in watchers:
+        task.cancel()
+    await export.stop()
+    await bulk.stop()
+    await docservice.stop()
+    await db.close_db()
+    passwords.shutdown()
+
+async def main():
+    scheduler = outbox.SendScheduler()
+    bot = create_bot(scheduler)
+    dp = create_dispatcher()
+    watchers = await start_services(stats=lambda: collect_stats(dp, scheduler))
 
-    await dp.start_polling(bot)
+    try:
+        if BOT_MODE == "webhook":
+            await webhook.run(dp, bot)
+        else:
+            await dp.start_polling(bot)
+    finally:
+        await stop_services(watchers)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,260 @@
+import asyncio
+import hashlib
+import logging
+import os
+from io import BytesIO
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import BufferedInputFile, InputMediaPhoto, Message, PhotoSize
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow не обязателен: без него картинки отправляются как есть
+    Image = None
+
+import db
+
+# ---------- Настройка изображений для разных типов сообщений ----------
+# Ключ - идентификатор типа сообщения, значение - относительный путь к файлу
+# Вы можете менять пути и добавлять новые типы по мере необходимости
+MESSAGE_IMAGES = {
+    "start": "./images/start.jpg",           # приветствие
+    "auth_login": "./images/login.jpg",      # экран входа (ввод пароля)
+    "forgot_password": "./images/forgot.jpg",# восстановление пароля
+    "register_type": "./images/register.jpg",# выбор типа пользователя
+    "register_fullname": "./images/register_name.jpg",
+    "register_email": "./images/register_email.jpg",
+    "register_inn": "./images/register_inn.jpg",
+    "register_secret": "./images/register_secret.jpg",
+    "register_password": "./images/register_password.jpg",
+    "main_menu": "./images/main_menu.jpg",   # главное меню
+    "profile": "./images/profile.jpg",       # профиль
+    "support": "./images/support.jpg",       # поддержка
+    "subscription": "./images/subscription.jpg",
+    "categories": "./images/categories.jpg", # список категорий документов
+    "documents_list": "./images/documents_list.jpg", # список документов в категории
+    "ask_question": "./images/ask.jpg",      # анонимный вопрос
+    "my_docs": "./images/my_docs.jpg",       # мои документы
+    "cancel": "./images/cancel.jpg",          # отмена действия
+    # Добавляйте свои типы по необходимости
+}
+
+# ---------- Манифест картинок ----------
+# Картинки читаются с диска при старте и держатся в памяти, так что отправка
+# экрана не обращается к файловой системе. Фоновая задача watch_images()
+# перечитывает изменившиеся файлы.
+IMAGE_MAX_SIDE = 1280               # Telegram всё равно ужимает фото до 1280 по большей стороне
+IMAGE_JPEG_QUALITY = 87
+IMAGE_REFRESH_INTERVAL = 30         # секунд между проверками файлов
+
+class ImageEntry:
+    __slots__ = ("path", "filename", "data", "cache_key", "signature")
+
+    def __init__(self, path: str, data: bytes, signature: tuple):
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.data = data
+        # Ключ кэша file_id по содержимому: одинаковые картинки делят один file_id
+        self.cache_key = "sha1:" + hashlib.sha1(data).hexdigest()
+        self.signature = signature
+
+    def input_file(self) -> BufferedInputFile:
+        return BufferedInputFile(self.data, filename=self.filename)
+
+_manifest = {}          # путь -> ImageEntry (только существующие файлы)
+
+def _signature(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def _prepare_image(data: bytes) -> bytes:
+    """Уменьшает картинку до размеров, которые Telegram всё равно отдаст клиентам."""
+    if Image is None:
+        return data
+    try:
+        with Image.open(BytesIO(data)) as img:
+            if max(img.size) <= IMAGE_MAX_SIDE:
+                return data
+            img.thumbnail((IMAGE_MAX_SIDE, IMAGE_MAX_SIDE))
+            out = BytesIO()
+            img.convert("RGB").save(out, format="JPEG", quality=IMAGE_JPEG_QUALITY, optimize=True)
+    except Exception as e:
+        logging.warning(f"Не удалось пережать картинку: {e}")
+        return data
+    return out.getvalue() if out.tell() < len(data) else data
+
+def _scan_images() -> dict:
+    """Читает изменившиеся картинки; возвращает новый манифест (блокирующая функция)."""
+    manifest = {}
+    for path in set(MESSAGE_IMAGES.values()):
+        signature = _signature(path)
+        if signature is None:
+            continue
+        entry = _manifest.get(path)
+        if entry is None or entry.signature != signature:
+            with open(path, "rb") as f:
+                entry = ImageEntry(path, _prepare_image(f.read()), signature)
+        manifest[path] = entry
+    return manifest
+
+def build_manifest():
+    """Строит манифест картинок (вызывается при старте бота)."""
+    global _manifest
+    _manifest = _scan_images()
+    missing = sorted(msg_type for msg_type, path in MESSAGE_IMAGES.items() if path not in _manifest)
+    logging.info(f"Картинок загружено: {len(_manifest)}; без картинки: {', '.join(missing) or 'нет'}")
+
+async def watch_images(interval: float = IMAGE_REFRESH_INTERVAL):
+    """Периодически обновляет манифест; файловые операции идут в отдельном потоке."""
+    global _manifest
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            _manifest = await asyncio.to_thread(_scan_images)
+        except Exception as e:
+            logging.error(f"Ошибка обновления манифеста картинок: {e}")
+
+def get_image(msg_type: str):
+    photo_path = MESSAGE_IMAGES.get(msg_type) if msg_type else None
+    return _manifest.get(photo_path) if photo_path else None
+
+# ---------- Кэш file_id ----------
+# Каждая картинка загружается в Telegram один раз; дальше отправляется по file_id.
+_file_ids = {}          # ключ кэша -> file_id
+_file_unique_ids = {}   # ключ кэша -> file_unique_id: file_id одной картинки может меняться, он — нет
+_upload_locks = {}      # ключ кэша -> asyncio.Lock, чтобы не грузить одно и то же параллельно
+
+# Фрагменты ответов Bot API, означающие, что file_id больше не действителен
+_BAD_FILE_ID_ERRORS = (
+    "wrong file identifier",
+    "wrong remote file identifier",
+    "file reference expired",
+    "file_id_invalid",
+    "wrong type of the web page content",
+)
+
+async def load_file_ids():
+    """Загружает сохранённые file_id из БД (вызывается при старте бота)."""
+    for cache_key, (file_id, file_unique_id) in (await db.get_media_file_ids()).items():
+        _file_ids[cache_key] = file_id
+        if file_unique_id:
+            _file_unique_ids[cache_key] = file_unique_id
+
+def _is_bad_file_id(error: TelegramBadRequest) -> bool:
+    text = error.message.lower()
+    return any(fragment in text for fragment in _BAD_FILE_ID_ERRORS)
+
+async def _remember(cache_key: str, photo: PhotoSize):
+    _file_ids[cache_key] = photo.file_id
+    _file_unique_ids[cache_key] = photo.file_unique_id
+    await db.save_media_file_id(cache_key, photo.file_id, photo.file_unique_id)
+
+async def _forget(cache_key: str):
+    _file_ids.pop(cache_key, None)
+    _file_unique_ids.pop(cache_key, None)
+    await db.delete_media_file_id(cache_key)
+
+async def send_photo(message: Message, msg_type: str, caption: str, reply_markup=None) -> bool:
+    """
+    Отправляет в чат message картинку типа msg_type с подписью.
+    Возвращает False, если для msg_type картинки нет (вызывающий отправит текст).
+    """
+    image = get_image(msg_type)
+    if image is None:
+        return False
+    cache_key = image.cache_key
+
+    file_id = _file_ids.get(cache_key)
+    if file_id:
+        try:
+            sent = await message.answer_photo(photo=file_id, caption=caption, reply_markup=reply_markup)
+            if cache_key not in _file_unique_ids:
+                # Запись сохранена до появления file_unique_id — дополняем её
+                await _remember(cache_key, sent.photo[-1])
+            return True
+        except TelegramBadRequest as e:
+            if not _is_bad_file_id(e):
+                raise
+            logging.info(f"file_id картинки {image.path} устарел, загружаем заново")
+            await _forget(cache_key)
+
+    lock = _upload_locks.setdefault(cache_key, asyncio.Lock())
+    async with lock:
+        file_id = _file_ids.get(cache_key)
+        if file_id:
+            # Пока ждали, картинку уже загрузил другой запрос
+            await message.answer_photo(photo=file_id, caption=caption, reply_markup=reply_markup)
+            return True
+        sent = await message.answer_photo(photo=image.input_file(), caption=caption, reply_markup=reply_markup)
+        await _remember(cache_key, sent.photo[-1])
+    return True
+
+# ---------- Навигация редактированием ----------
+# Переход между экранами по кнопке: если тип сообщения не меняется (фото -> фото,
+# текст -> текст), старое сообщение редактируется одним вызовом API вместо
+# пары delete + send.
+_nav_stats = {"edited": 0, "replaced": 0}
+
+def _is_not_modified(error: TelegramBadRequest) -> bool:
+    return "message is not modified" in error.message.lower()
+
+async def _edit_photo(message: Message, image: ImageEntry, caption: str, reply_markup) -> None:
+    cache_key = image.cache_key
+    file_id = _file_ids.get(cache_key)
+    # Одинаковость картинки определяем по file_unique_id: file_id может быть другим
+    unique_id = _file_unique_ids.get(cache_key)
+    if unique_id and unique_id == message.photo[-1].file_unique_id:
+        # Картинка та же самая — достаточно сменить подпись
+        await message.edit_caption(caption=caption, reply_markup=reply_markup)
+        return
+    try:
+        edited = await message.edit_media(
+            InputMediaPhoto(media=file_id or image.input_file(), caption=caption),
+            reply_markup=reply_markup
+        )
+    except TelegramBadRequest as e:
+        if file_id and _is_bad_file_id(e):
+            await _forget(cache_key)
+        raise
+    if (not file_id or not unique_id) and isinstance(edited, Message) and edited.photo:
+        await _remember(cache_key, edited.photo[-1])
+
+async def edit_screen(message: Message, msg_type: str, text: str, reply_markup=None) -> bool:
+    """
+    Превращает сообщение бота message в новый экран, редактируя его на месте.
+    Возвращает False, если тип сообщения меняется (фото <-> текст) или Telegram
+    отказал в редактировании — тогда вызывающий удаляет сообщение и шлёт новое.
+    """
+    image = get_image(msg_type)
+    wants_photo = image is not None
+    has_photo = bool(getattr(message, "photo", None))
+    has_text = getattr(message, "text", None) is not None
+    try:
+        if wants_photo and has_photo:
+            await _edit_photo(message, image, text, reply_markup)
+        elif not wants_photo and has_text:
+            await message.edit_text(text, reply_markup=reply_markup)
+        else:
+            _nav_stats["replaced"] += 1
+            return False
+    except TelegramBadRequest as e:
+        if not _is_not_modified(e):
+            logging.info(f"Не удалось отредактировать экран {msg_type}: {e.message}")
+            _nav_stats["replaced"] += 1
+            return False
+    _nav_stats["edited"] += 1
+    return True
+
+def navigation_stats() -> dict:
+    """Каждое редактирование экономит один вызов API по сравнению с delete + send."""
+    edited, replaced = _nav_stats["edited"], _nav_stats["replaced"]
+    total = edited + replaced
+    return {
+        "edited": edited,
+        "replaced": replaced,
+        "api_calls_saved": edited,
+        "api_calls_per_interaction": (edited + 2 * replaced) / total if total else 0.0,
+    }
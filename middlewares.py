@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import math
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, Message, TelegramObject, Update
+
+from config import THROTTLE_BURST, THROTTLE_HANDLERS, THROTTLE_RATE
+
+# ---------- Порядок апдейтов одного пользователя ----------
+# Апдейты одного пользователя выполняются строго по очереди (asyncio.Lock
+# пропускает ожидающих в порядке прихода), апдейты разных пользователей —
+# параллельно. Очередь существует, только пока у пользователя есть апдейты
+# в работе, поэтому память растёт с числом активных пользователей, а не всех.
+# Повторное нажатие кнопки отбрасывается, только пока такое же нажатие на том же
+# сообщении ещё ждёт или выполняется: навигация редактирует сообщение на месте,
+# и быстрый переход A→B→A должен отработать целиком.
+USER_QUEUE_CONCURRENCY = 200        # апдейтов разных пользователей в обработке одновременно
+
+class _UserQueue:
+    __slots__ = ("lock", "pending")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.pending = 0            # апдейтов в очереди и в работе
+
+class UserOrderMiddleware(BaseMiddleware):
+    """Внешний middleware для dp.update: очередь на пользователя и схлопывание двойных нажатий."""
+
+    def __init__(self, concurrency: int = USER_QUEUE_CONCURRENCY):
+        self._queues = {}           # telegram_id -> _UserQueue
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._pending_callbacks = {}  # (telegram_id, message_id) -> (data, id нажатия) последнего принятого нажатия
+        # Метрики
+        self.processed = 0
+        self.collapsed = 0
+        self.max_depth = 0
+
+    @staticmethod
+    def _callback_key(telegram_id: int, callback: CallbackQuery) -> tuple:
+        message_id = callback.message.message_id if callback.message else callback.inline_message_id
+        return telegram_id, message_id
+
+    async def __call__(
+        self,
+        handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any],
+    ) -> Any:
+        user = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+
+        callback = event.callback_query
+        callback_key = None
+        if callback is not None:
+            callback_key = self._callback_key(user.id, callback)
+            pending = self._pending_callbacks.get(callback_key)
+            if pending is not None and pending[0] == callback.data:
+                self.collapsed += 1
+                try:
+                    await callback.answer()     # убираем «часики» на кнопке
+                except TelegramBadRequest as e:
+                    logging.debug(f"Не удалось ответить на повторное нажатие: {e}")
+                return None
+            # Другое нажатие на том же сообщении вытесняет прежнее
+            self._pending_callbacks[callback_key] = (callback.data, callback.id)
+
+        queue = self._queues.get(user.id)
+        if queue is None:
+            queue = self._queues[user.id] = _UserQueue()
+        queue.pending += 1
+        self.max_depth = max(self.max_depth, queue.pending)
+        try:
+            async with queue.lock:
+                # Общий лимит берём только после своей очереди, чтобы ожидающий
+                # пользователь не занимал место других
+                async with self._semaphore:
+                    self.processed += 1
+                    return await handler(event, data)
+        finally:
+            queue.pending -= 1
+            if queue.pending == 0:
+                del self._queues[user.id]
+            if callback_key is not None and self._pending_callbacks.get(callback_key, (None, None))[1] == callback.id:
+                del self._pending_callbacks[callback_key]
+
+    def stats(self) -> dict:
+        return {
+            "active_users": len(self._queues),
+            "processed": self.processed,
+            "collapsed": self.collapsed,
+            "max_depth": self.max_depth,
+            "pending_callbacks": len(self._pending_callbacks),
+        }
+
+# ---------- Ограничение частоты ----------
+# Один объект регистрируется дважды. Внешним middleware для dp.update, до очереди
+# апдейтов пользователя, он расходует общую корзину пользователя: лишние апдейты
+# отсекаются сразу, не ожидая в очереди и не занимая общий лимит обработки.
+# Внутренним для dp.message и dp.callback_query он расходует корзину обработчика:
+# к этому моменту фильтры уже выбрали обработчик. Корзина, простоявшая дольше полного восстановления, снова полна, и её можно
+# забыть без потери точности — так память держится только под активных пользователей.
+class _Bucket:
+    __slots__ = ("tokens", "updated", "warned")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+        self.warned = False          # пользователь уже получил «подождите» в этой серии
+
+class ThrottleMiddleware(BaseMiddleware):
+    """Маркерные корзины на пользователя (внешний слой) и на пару пользователь+обработчик (внутренний)."""
+
+    def __init__(self, rate: float = THROTTLE_RATE, burst: int = THROTTLE_BURST,
+                 handler_limits: dict = THROTTLE_HANDLERS):
+        self.limits = {None: (rate, burst), **handler_limits}   # None — общая корзина пользователя
+        self.idle_after = max(burst / rate for rate, burst in self.limits.values())
+        self._buckets = OrderedDict()    # (telegram_id, обработчик|None) -> _Bucket, по давности обращения
+        # Метрики
+        self.passed = 0
+        self.throttled = 0
+        self.throttled_by = Counter()    # обработчик -> сколько апдейтов отклонено
+
+    def _evict(self, now: float):
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket.updated < self.idle_after:
+                break
+            del self._buckets[key]
+
+    def _bucket(self, key: tuple, now: float) -> _Bucket:
+        rate, burst = self.limits[key[1]]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(burst, now)
+        else:
+            bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+        if isinstance(event, Update):
+            # Внешний слой: общая корзина пользователя
+            target, name = event.event, None
+            if not isinstance(target, (Message, CallbackQuery)):
+                return await handler(event, data)
+        else:
+            # Внутренний слой: корзина обработчика, если для него задан лимит
+            target, handler_object = event, data.get("handler")
+            name = handler_object.callback.__name__ if handler_object is not None else None
+            if name is None or name not in self.limits:
+                self.passed += 1
+                return await handler(event, data)
+
+        now = time.monotonic()
+        self._evict(now)
+        bucket = self._bucket((user.id, name), now)
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            bucket.warned = False
+            if name is not None:
+                self.passed += 1
+            return await handler(event, data)
+
+        self.throttled += 1
+        self.throttled_by[name] += 1
+        wait = (1 - bucket.tokens) / self.limits[name][0]
+        warned, bucket.warned = bucket.warned, True
+        await self._slow_down(target, math.ceil(wait), warned)
+        return None
+
+    @staticmethod
+    async def _slow_down(event: TelegramObject, wait: int, warned: bool):
+        text = f"⏳ Слишком много запросов, подождите {wait} с."
+        try:
+            # На нажатие отвечаем всегда, иначе кнопка «зависнет»; сообщение — раз за серию
+            if isinstance(event, CallbackQuery):
+                await event.answer(text)
+            elif isinstance(event, Message) and not warned:
+                await event.answer(text)
+        except TelegramBadRequest as e:
+            logging.debug(f"Не удалось предупредить о лимите: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "passed": self.passed,
+            "throttled": self.throttled,
+            "throttled_by": {name or "*": count for name, count in self.throttled_by.items()},
+            "buckets": len(self._buckets),
+        }
+
+user_order = UserOrderMiddleware()
+throttle = ThrottleMiddleware()
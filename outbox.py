@@ -0,0 +1,150 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter, TelegramServerError
+from aiogram.methods import Response, SendDocument, SendMediaGroup, SendPhoto, TelegramMethod
+
+# ---------- Очередь исходящих сообщений ----------
+# Middleware сессии бота: каждый запрос, отправляющий или меняющий сообщение,
+# сначала ждёт места в своём чате, затем встаёт в общую очередь с приоритетом.
+# Очередь выпускает не больше SEND_GLOBAL_RATE запросов в секунду: документы
+# раньше экранов меню, экраны раньше картинок без кнопок. Ответ 429 ставит
+# очередь на паузу на retry_after, ошибки сервера Telegram повторяются с паузой.
+SEND_GLOBAL_RATE = 30               # сообщений в секунду на бота
+SEND_PRIVATE_RATE = 1               # сообщений в секунду в личный чат
+SEND_GROUP_RATE = 20 / 60           # сообщений в секунду в группу
+SEND_CHAT_BURST = 3                 # столько сообщений в чат уходит подряд без ожидания
+SEND_RETRIES = 5                    # повторов одного запроса
+SEND_BACKOFF_MAX = 30               # секунд, потолок паузы между повторами
+
+PRIORITY_DOCUMENT = 0
+PRIORITY_SCREEN = 1
+PRIORITY_PHOTO = 2
+PRIORITY_NAMES = {PRIORITY_DOCUMENT: "document", PRIORITY_SCREEN: "screen", PRIORITY_PHOTO: "photo"}
+
+def send_priority(method: TelegramMethod) -> int:
+    """Приоритет запроса в очереди; None — запрос не шлёт сообщений и идёт напрямую."""
+    name = type(method).__name__
+    if isinstance(method, (SendDocument, SendMediaGroup)):
+        return PRIORITY_DOCUMENT
+    if isinstance(method, SendPhoto):
+        # Картинка с кнопками — экран меню, без кнопок — оформление ответа
+        return PRIORITY_SCREEN if method.reply_markup is not None else PRIORITY_PHOTO
+    if name.startswith(("Send", "Edit", "Copy", "Forward")) and name != "SendChatAction":
+        return PRIORITY_SCREEN
+    return None
+
+class SendScheduler(BaseRequestMiddleware):
+    def __init__(self, rate: float = SEND_GLOBAL_RATE):
+        self.interval = 1 / rate
+        self._queue = []                 # куча (приоритет, номер, future)
+        self._seq = itertools.count()
+        self._pump = None
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._chat_slots = OrderedDict()  # chat_id -> время, с которого чат снова свободен
+        # Метрики
+        self.sent = dict.fromkeys(PRIORITY_NAMES.values(), 0)
+        self.retried = 0
+        self.retry_after = 0
+        self.max_depth = 0
+        self._wait_times = deque(maxlen=1000)
+
+    # ----- лимит чата -----
+    def _reserve_chat(self, chat_id, now: float) -> float:
+        """Бронирует место в чате; возвращает, сколько секунд подождать."""
+        # Освободившиеся чаты забываем: их запись ничего не ограничивает
+        while self._chat_slots:
+            key, free_at = next(iter(self._chat_slots.items()))
+            if free_at > now:
+                break
+            del self._chat_slots[key]
+        is_group = isinstance(chat_id, str) or chat_id < 0
+        interval = 1 / (SEND_GROUP_RATE if is_group else SEND_PRIVATE_RATE)
+        free_at = max(self._chat_slots.pop(chat_id, now), now)
+        self._chat_slots[chat_id] = free_at + interval
+        return max(0.0, free_at - (SEND_CHAT_BURST - 1) * interval - now)
+
+    # ----- общая очередь -----
+    async def _acquire(self, priority: int, chat_id):
+        queued_at = time.monotonic()
+        if chat_id is not None:
+            wait = self._reserve_chat(chat_id, queued_at)
+            if wait:
+                await asyncio.sleep(wait)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), future))
+        self.max_depth = max(self.max_depth, len(self._queue))
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._run())
+        try:
+            await future
+        except asyncio.CancelledError:
+            future.cancel()              # очередь пропустит отменённый запрос
+            raise
+        self._wait_times.append(time.monotonic() - queued_at)
+
+    async def _run(self):
+        while self._queue:
+            now = time.monotonic()
+            delay = max(self._next_slot, self._paused_until) - now
+            if delay > 0:
+                # Пока ждём, в очередь может встать запрос важнее — выбираем после паузы
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._queue)
+            if future.done():
+                continue
+            self._next_slot = now + self.interval
+            future.set_result(None)
+
+    async def __call__(self, make_request: NextRequestMiddlewareType, bot: Bot, method: TelegramMethod) -> Response:
+        priority = send_priority(method)
+        if priority is None:
+            return await make_request(bot, method)
+        chat_id = getattr(method, "chat_id", None)
+        attempt = 0
+        while True:
+            await self._acquire(priority, chat_id)
+            try:
+                response = await make_request(bot, method)
+                self.sent[PRIORITY_NAMES[priority]] += 1
+                return response
+            except TelegramRetryAfter as e:
+                if attempt >= SEND_RETRIES:
+                    raise
+                # По ответу не понять, чат это или весь бот: останавливаем всю очередь
+                self.retry_after += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + e.retry_after)
+                logging.warning(f"Telegram просит подождать {e.retry_after} с ({type(method).__name__})")
+            except TelegramServerError as e:
+                if attempt >= SEND_RETRIES:
+                    raise
+                delay = min(SEND_BACKOFF_MAX, 2 ** attempt) * random.uniform(0.5, 1)
+                logging.warning(f"Ошибка сервера Telegram ({type(method).__name__}): {e}, повтор через {delay:.1f} с")
+                await asyncio.sleep(delay)
+            attempt += 1
+            self.retried += 1
+
+    def stats(self) -> dict:
+        waits = sorted(self._wait_times)
+
+        def percentile(q: float) -> float:
+            return waits[min(len(waits) - 1, int(q * len(waits)))] * 1000 if waits else 0.0
+
+        return {
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "sent": dict(self.sent),
+            "retried": self.retried,
+            "retry_after": self.retry_after,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p95": percentile(0.95),
+        }
@@ -0,0 +1,67 @@
+import asyncio
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# ---------- Хэширование паролей ----------
+# Пароли хэшируются scrypt; расчёт идёт в отдельном пуле потоков (hashlib.scrypt
+# отпускает GIL), чтобы вход одного пользователя не останавливал обработку
+# остальных. Формат password_hash: "scrypt$<n>$<r>$<p>$<hex>", соль — в password_salt.
+# Старые записи (голый sha256(salt + password) в hex) проверяются как раньше
+# и при успешном входе перехэшируются в текущий формат.
+SCRYPT_N = 2 ** 14                  # ~16 МБ памяти на один расчёт
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+HASH_WORKERS = min(4, os.cpu_count() or 1)
+# Сколько расчётов одновременно может ждать пул; остальные ждут в очереди семафора
+HASH_CONCURRENCY = HASH_WORKERS * 2
+
+_executor: ThreadPoolExecutor = None
+_semaphore: asyncio.Semaphore = None
+
+def _scrypt(password: str, salt: str, n: int, r: int, p: int) -> str:
+    digest = hashlib.scrypt(
+        password.encode(), salt=bytes.fromhex(salt), n=n, r=r, p=p,
+        maxmem=256 * n * r, dklen=SCRYPT_DKLEN
+    )
+    return f"scrypt${n}${r}${p}${digest.hex()}"
+
+def _legacy_sha256(password: str, salt: str) -> str:
+    return hashlib.sha256((salt + password).encode()).hexdigest()
+
+def needs_rehash(hash_value: str) -> bool:
+    return not hash_value.startswith(f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
+
+def _verify_sync(password: str, salt: str, hash_value: str) -> bool:
+    if hash_value.startswith("scrypt$"):
+        _, n, r, p, _ = hash_value.split("$")
+        candidate = _scrypt(password, salt, int(n), int(r), int(p))
+    else:
+        candidate = _legacy_sha256(password, salt)
+    return hmac.compare_digest(candidate, hash_value)
+
+async def _run(func, *args):
+    global _executor, _semaphore
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="passwords")
+        _semaphore = asyncio.Semaphore(HASH_CONCURRENCY)
+    async with _semaphore:
+        return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+
+async def hash_password(password: str) -> tuple:
+    """Возвращает (salt, password_hash) в текущем формате."""
+    salt = os.urandom(16).hex()
+    return salt, await _run(_scrypt, password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+async def verify_password(password: str, salt: str, hash_value: str) -> bool:
+    return await _run(_verify_sync, password, salt, hash_value)
+
+def shutdown():
+    global _executor, _semaphore
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _semaphore = None
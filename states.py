@@ -23,5 +23,8 @@ class Register(StatesGroup):
 class FillDocument(StatesGroup):
     waiting_for_field = State()
 
+class BulkGenerate(StatesGroup):
+    waiting_for_file = State()
+
 class AskQuestion(StatesGroup):
     waiting_for_question = State()
\ No newline at end of file
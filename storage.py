@@ -0,0 +1,75 @@
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, KeyBuilder, StateType, StorageKey
+
+import db
+
+# Сколько последних сессий держать в памяти, чтобы повторные get_data() не ходили в БД
+FSM_CACHE_SIZE = 5000
+
+class SQLiteStorage(BaseStorage):
+    """
+    Хранилище FSM в базе бота (таблица fsm_sessions).
+    Состояние и данные читаются одним запросом, данные хранятся компактным JSON.
+    Недавние сессии лежат в LRU-кэше; запись идёт сразу в БД (write-through),
+    поэтому после перезапуска бота незавершённые сценарии продолжаются.
+    """
+
+    def __init__(self, key_builder: Optional[KeyBuilder] = None, cache_size: int = FSM_CACHE_SIZE):
+        self.key_builder = key_builder or DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()     # ключ -> (state, data_json)
+        self.hits = 0
+        self.misses = 0
+
+    async def _load(self, key: str) -> tuple:
+        record = self._cache.get(key)
+        if record is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return record
+        self.misses += 1
+        record = await db.get_fsm_record(key) or (None, None)
+        self._remember(key, record)
+        return record
+
+    def _remember(self, key: str, record: tuple):
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _save(self, key: str, state: Optional[str], data: Optional[str]):
+        if self._cache.get(key) == (state, data):
+            return
+        await db.save_fsm_record(key, state, data)
+        self._remember(key, (state, data))
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        storage_key = self.key_builder.build(key)
+        _, data = await self._load(storage_key)
+        await self._save(storage_key, state.state if isinstance(state, State) else state, data)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        state, _ = await self._load(self.key_builder.build(key))
+        return state
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        storage_key = self.key_builder.build(key)
+        state, _ = await self._load(storage_key)
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")) if data else None
+        await self._save(storage_key, state, payload)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        _, data = await self._load(self.key_builder.build(key))
+        # Каждый раз разбираем JSON заново: вызывающий получает независимую копию
+        return json.loads(data) if data else {}
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {"cached": len(self._cache), "hits": self.hits, "misses": self.misses}
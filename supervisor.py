@@ -0,0 +1,348 @@
+"""
+Запуск бота в нескольких процессах.
+
+    python supervisor.py [--workers N]
+
+Апдейты получает один процесс-диспетчер (long polling или webhook — как задано
+в config.py) и передаёт каждый процессу-обработчику по telegram_id: пользователь
+всегда попадает в один и тот же процесс, поэтому его FSM-сессия, кэши и порядок
+апдейтов остаются внутри процесса. Связь — Unix-сокет, по строке JSON на апдейт.
+Упавший обработчик перезапускается, апдейты для него копятся в буфере.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import secrets
+import signal
+import sys
+import tempfile
+import time
+from collections import deque
+
+import aiohttp
+from aiohttp import web
+
+import db
+from config import BOT_MODE, WEBHOOK_HOST, WEBHOOK_PATH, WEBHOOK_PORT, WEBHOOK_SECRET, WEBHOOK_URL
+from outbox import SEND_GLOBAL_RATE
+
+logging.basicConfig(level=logging.INFO)
+
+SUPERVISOR_WORKERS = os.cpu_count() or 1
+WORKER_BUFFER = 1000                # апдейтов на обработчик, пока он перезапускается
+STATS_INTERVAL = 30                 # секунд между отчётами обработчиков
+RESTART_BACKOFF_MAX = 30            # секунд, потолок паузы перед перезапуском
+STABLE_RUN = 60                     # после стольких секунд работы пауза сбрасывается
+POLL_TIMEOUT = 30
+
+def route_key(update: dict) -> int:
+    """telegram_id отправителя апдейта (или id чата), по которому выбирается обработчик."""
+    for kind, event in update.items():
+        if not isinstance(event, dict):
+            continue
+        user = event.get("from") or event.get("user")
+        if user:
+            return user["id"]
+        chat = event.get("chat") or (event.get("message") or {}).get("chat")
+        if chat:
+            return chat["id"]
+    return update.get("update_id", 0)
+
+# Доли нельзя складывать: после сложения счётчиков они считаются заново
+RATIO_STATS = {
+    "hit_rate": lambda s: s["hits"] / (s["hits"] + s["misses"]),
+    "api_calls_per_interaction": lambda s: (s["edited"] + 2 * s["replaced"]) / (s["edited"] + s["replaced"]),
+}
+
+def _is_peak(key: str) -> bool:
+    # Пики, пределы и задержки (max_…, …_ms…) берутся по худшему обработчику
+    return key.startswith("max_") or "_ms" in key
+
+def merge_stats(items: list) -> dict:
+    """Складывает счётчики обработчиков; пики и задержки — максимум, доли пересчитываются."""
+    merged = {}
+    for item in items:
+        for key, value in item.items():
+            if isinstance(value, dict):
+                merged[key] = merge_stats([merged.get(key, {}), value])
+            elif key in RATIO_STATS:
+                continue
+            elif isinstance(value, (int, float)):
+                merged[key] = max(merged.get(key, 0), value) if _is_peak(key) else merged.get(key, 0) + value
+    for key, ratio in RATIO_STATS.items():
+        if any(key in item for item in items):
+            try:
+                merged[key] = ratio(merged)
+            except (KeyError, ZeroDivisionError):
+                merged[key] = 0.0
+    return merged
+
+# ---------- Диспетчер ----------
+class WorkerLink:
+    """Канал к одному процессу-обработчику."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.restarts = 0
+        self.stats = {}
+        self._writer = None
+        self._buffer = deque(maxlen=WORKER_BUFFER)
+        self.routed = 0
+        self.dropped = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def send(self, line: bytes):
+        self.routed += 1
+        if self._writer is None:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(line)
+            return
+        try:
+            self._writer.write(line)
+            await self._writer.drain()
+        except ConnectionError:
+            self.detach()
+            self._buffer.append(line)
+
+    def attach(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+        while self._buffer:
+            writer.write(self._buffer.popleft())
+
+    def detach(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+class Supervisor:
+    def __init__(self, workers: int = SUPERVISOR_WORKERS):
+        self.links = [WorkerLink(index) for index in range(workers)]
+        self.socket_path = os.path.join(tempfile.gettempdir(), f"jurist_bot_{os.getpid()}.sock")
+        self._server = None
+        self._tasks = []
+        self._stopping = False
+
+    async def start(self):
+        self._server = await asyncio.start_unix_server(self._on_connect, path=self.socket_path)
+        self._tasks = [asyncio.create_task(self._keep_alive(link)) for link in self.links]
+        self._tasks.append(asyncio.create_task(self._report()))
+
+    async def stop(self):
+        self._stopping = True
+        for link in self.links:
+            if link.process is not None and link.process.returncode is None:
+                link.process.terminate()
+        for link in self.links:
+            if link.process is None:
+                continue
+            try:
+                await asyncio.wait_for(link.process.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                link.process.kill()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._server.close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    async def route(self, update: dict):
+        link = self.links[route_key(update) % len(self.links)]
+        await link.send(json.dumps(update, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    async def _keep_alive(self, link: WorkerLink):
+        # Обработчику достаётся своя доля процессов сборки документов
+        docgen_workers = max(1, (os.cpu_count() or 1) // len(self.links))
+        # Лимит Telegram общий на бота, поэтому делится между обработчиками
+        send_rate = SEND_GLOBAL_RATE / len(self.links)
+        backoff = 1
+        while not self._stopping:
+            started = time.monotonic()
+            link.process = await asyncio.create_subprocess_exec(
+                sys.executable, os.path.abspath(__file__), "--worker", str(link.index),
+                "--socket", self.socket_path, "--docgen-workers", str(docgen_workers),
+                "--send-rate", str(send_rate),
+                # Ctrl+C получает только диспетчер; обработчиков он останавливает сам
+                start_new_session=True,
+            )
+            code = await link.process.wait()
+            link.detach()
+            if self._stopping:
+                return
+            link.restarts += 1
+            if time.monotonic() - started > STABLE_RUN:
+                backoff = 1
+            logging.error(f"Обработчик {link.index} завершился с кодом {code}, перезапуск через {backoff} с")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RESTART_BACKOFF_MAX)
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        link = None
+        try:
+            hello = json.loads(await reader.readline())
+            link = self.links[hello["worker"]]
+            link.attach(writer)
+            logging.info(f"Обработчик {link.index} подключён (pid {hello['pid']})")
+            while line := await reader.readline():
+                link.stats = json.loads(line)
+        except (ConnectionError, asyncio.CancelledError):
+            # При остановке asyncio отменяет задачи соединений: это штатное завершение.
+            # Отмену не пробрасываем, иначе asyncio запишет её в лог как ошибку
+            pass
+        if link is not None and link._writer is writer:
+            link.detach()
+        else:
+            writer.close()
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self.links),
+            "connected": sum(link.connected for link in self.links),
+            "restarts": sum(link.restarts for link in self.links),
+            "routed": sum(link.routed for link in self.links),
+            "buffered": sum(len(link._buffer) for link in self.links),
+            "dropped": sum(link.dropped for link in self.links),
+            "totals": merge_stats([link.stats for link in self.links]),
+        }
+
+    async def _report(self):
+        while True:
+            await asyncio.sleep(STATS_INTERVAL)
+            logging.info(f"Статистика обработчиков: {json.dumps(self.stats(), ensure_ascii=False)}")
+
+# ---------- Получение апдейтов ----------
+async def _poll_updates(supervisor: Supervisor, bot, allowed_updates: list):
+    # Апдейты берём как есть, без разбора в объекты aiogram: диспетчеру нужен только telegram_id
+    url = bot.session.api.api_url(bot.token, "getUpdates")
+    offset = None
+    async with aiohttp.ClientSession() as http:
+        while True:
+            payload = {"timeout": POLL_TIMEOUT, "allowed_updates": allowed_updates}
+            if offset is not None:
+                payload["offset"] = offset
+            try:
+                async with http.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=POLL_TIMEOUT + 10)) as resp:
+                    body = await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logging.error(f"Ошибка getUpdates: {e}")
+                await asyncio.sleep(1)
+                continue
+            if not body.get("ok"):
+                logging.error(f"getUpdates: {body.get('description')}")
+                await asyncio.sleep(body.get("parameters", {}).get("retry_after", 1))
+                continue
+            for update in body["result"]:
+                offset = update["update_id"] + 1
+                await supervisor.route(update)
+
+async def _serve_webhook(supervisor: Supervisor, bot, allowed_updates: list):
+    async def handle(request: web.Request) -> web.Response:
+        token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+        if not secrets.compare_digest(token, WEBHOOK_SECRET):
+            return web.Response(body="Unauthorized", status=401)
+        await supervisor.route(await request.json())
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_route("POST", WEBHOOK_PATH, handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, WEBHOOK_HOST, WEBHOOK_PORT).start()
+        await bot.set_webhook(WEBHOOK_URL, secret_token=WEBHOOK_SECRET, allowed_updates=allowed_updates)
+        logging.info(f"Webhook слушает {WEBHOOK_HOST}:{WEBHOOK_PORT}{WEBHOOK_PATH}")
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+async def run_supervisor(workers: int):
+    import main
+
+    # Миграции применяем один раз, до запуска обработчиков
+    await db.init_db()
+    await db.close_db()
+
+    bot = main.create_bot()
+    allowed_updates = main.create_dispatcher().resolve_used_update_types()
+    supervisor = Supervisor(workers)
+    await supervisor.start()
+    logging.info(f"Запущено обработчиков: {workers}")
+    try:
+        if BOT_MODE == "webhook":
+            await _serve_webhook(supervisor, bot, allowed_updates)
+        else:
+            await _poll_updates(supervisor, bot, allowed_updates)
+    finally:
+        await supervisor.stop()
+        await bot.session.close()
+
+# ---------- Обработчик ----------
+async def run_worker(index: int, socket_path: str, docgen_workers: int, send_rate: float):
+    import main
+    import outbox
+
+    # Остановка по SIGTERM от диспетчера — как по Ctrl+C
+    current = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, current.cancel)
+
+    watchers = await main.start_services(docgen_workers)
+    scheduler = outbox.SendScheduler(send_rate)
+    bot = main.create_bot(scheduler)
+    dp = main.create_dispatcher()
+    await dp.emit_startup(bot=bot)
+    tasks = set()
+    handled = 0
+
+    def stats() -> dict:
+        # Статистику в лог пишет диспетчер, сложив отчёты всех обработчиков
+        return {"handled": handled, "in_flight": len(tasks), **main.collect_stats(dp, scheduler)}
+
+    async def report(writer):
+        while True:
+            await asyncio.sleep(STATS_INTERVAL)
+            writer.write(json.dumps(stats()).encode("utf-8") + b"\n")
+
+    reader, writer = await asyncio.open_unix_connection(socket_path, limit=2**22)
+    writer.write(json.dumps({"worker": index, "pid": os.getpid()}).encode("utf-8") + b"\n")
+    reporter = asyncio.create_task(report(writer))
+    try:
+        # Диспетчер закрыл сокет — значит, он остановился, завершаемся и мы
+        while line := await reader.readline():
+            task = asyncio.create_task(dp.feed_raw_update(bot, json.loads(line)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            handled += 1
+    finally:
+        reporter.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=30)
+        writer.close()
+        await dp.emit_shutdown(bot=bot)
+        await bot.session.close()
+        await main.stop_services(watchers)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=SUPERVISOR_WORKERS)
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--socket", help=argparse.SUPPRESS)
+    parser.add_argument("--docgen-workers", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--send-rate", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    try:
+        if args.worker is not None:
+            asyncio.run(run_worker(args.worker, args.socket, args.docgen_workers, args.send_rate))
+        else:
+            asyncio.run(run_supervisor(args.workers))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+import db
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+
+def _run_with_db(scenario):
+    async def wrapper():
+        await db.init_db()
+        try:
+            await scenario()
+        finally:
+            await db.close_db()
+
+    asyncio.run(wrapper())
+
+def _slow_writes(monkeypatch, started: asyncio.Event):
+    # Пачка задерживается внутри записи, как при занятой базе
+    write = db.WriteBehindQueue._write
+
+    async def slow_write(self, touches, documents):
+        started.set()
+        await asyncio.sleep(0.2)
+        await write(self, touches, documents)
+
+    monkeypatch.setattr(db.WriteBehindQueue, "_write", slow_write)
+
+async def _document_names(telegram_id: int) -> list:
+    return [row["doc_name"] for row in await db.get_user_documents(telegram_id)]
+
+def test_stop_keeps_batch_in_flight(temp_db, monkeypatch):
+    async def scenario():
+        started = asyncio.Event()
+        _slow_writes(monkeypatch, started)
+        await db.add_document(1, "doc", "n1")
+        db._write_behind._wakeup.set()
+        await started.wait()
+        await db._write_behind.stop()
+        db._write_behind.start()
+        assert await _document_names(1) == ["n1"]
+
+    _run_with_db(scenario)
+
+def test_reader_sees_document_while_flush_in_flight(temp_db, monkeypatch):
+    async def scenario():
+        started = asyncio.Event()
+        _slow_writes(monkeypatch, started)
+        await db.add_document(1, "doc", "n1")
+        db._write_behind._wakeup.set()
+        await started.wait()
+        assert await _document_names(1) == ["n1"]
+
+    _run_with_db(scenario)
+
+def test_cancelled_reader_does_not_lose_batch(temp_db, monkeypatch):
+    async def scenario():
+        started = asyncio.Event()
+        _slow_writes(monkeypatch, started)
+        await db.add_document(1, "doc", "n1")
+        reader = asyncio.create_task(db.get_user_documents(1))
+        await started.wait()
+        reader.cancel()
+        assert await _document_names(1) == ["n1"]
+
+    _run_with_db(scenario)
+
+def test_query_plans_use_indexes(temp_db):
+    # Миграции на чистой базе создают все индексы, на которые рассчитаны горячие запросы
+    async def scenario():
+        assert await db.check_query_plans() == []
+
+    _run_with_db(scenario)
@@ -0,0 +1,29 @@
+import asyncio
+
+import docservice
+
+def test_idle_pool_is_not_saturated():
+    async def scenario():
+        service = docservice.DocgenService(workers=1)
+        assert not service.saturated
+        # Задание ждёт свободный процесс — следующее уже встанет в очередь
+        service.submit(1, "doc", {})
+        assert service.saturated
+
+    asyncio.run(scenario())
+
+def test_background_jobs_leave_interactive_slots():
+    async def scenario():
+        service = docservice.DocgenService(workers=1, user_limit=1, background_limit=2)
+        service.submit(1, "doc", {}, background=True)
+        service.submit(1, "doc", {}, background=True)
+        try:
+            service.submit(1, "doc", {}, background=True)
+        except docservice.DocgenUserLimit:
+            pass
+        else:
+            raise AssertionError("фоновый лимит не сработал")
+        # Пакетная сборка заняла свой лимит, документ из чата всё равно принимается
+        service.submit(1, "doc", {})
+
+    asyncio.run(scenario())
@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from aiogram import Dispatcher, Router
+from aiogram.types import Update
+
+import middlewares
+
+def _callback(update_id: int, data: str, user_id: int = 1, message_id: int = 7) -> Update:
+    user = {"id": user_id, "is_bot": False, "first_name": "test"}
+    return Update.model_validate({
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id), "chat_instance": "chat", "data": data, "from": user,
+            "message": {"message_id": message_id, "date": 0, "text": "menu",
+                        "chat": {"id": user_id, "type": "private"}},
+        },
+    })
+
+def _dispatcher(order: middlewares.UserOrderMiddleware, handled: list) -> Dispatcher:
+    dp = Dispatcher()
+    dp.update.outer_middleware(order)
+    router = Router()
+
+    @router.callback_query()
+    async def on_callback(callback):
+        await asyncio.sleep(0.01)
+        handled.append(callback.data)
+
+    dp.include_router(router)
+    return dp
+
+def test_navigation_back_and_forth_is_not_collapsed():
+    async def scenario():
+        order = middlewares.UserOrderMiddleware()
+        handled = []
+        dp = _dispatcher(order, handled)
+        with patch("aiogram.types.CallbackQuery.answer", AsyncMock()):
+            await asyncio.gather(*(
+                dp.feed_update(AsyncMock(), _callback(i, data))
+                for i, data in enumerate(["menu_profile", "back_to_main", "menu_profile"])
+            ))
+        assert handled == ["menu_profile", "back_to_main", "menu_profile"]
+        assert order.stats()["collapsed"] == 0
+        assert order.stats()["pending_callbacks"] == 0
+
+    asyncio.run(scenario())
+
+def test_double_tap_in_flight_is_collapsed():
+    async def scenario():
+        order = middlewares.UserOrderMiddleware()
+        handled = []
+        dp = _dispatcher(order, handled)
+        with patch("aiogram.types.CallbackQuery.answer", AsyncMock()) as answer:
+            await asyncio.gather(*(dp.feed_update(AsyncMock(), _callback(i, "doc_a")) for i in range(2)))
+            # После обработки то же нажатие снова принимается
+            await dp.feed_update(AsyncMock(), _callback(2, "doc_a"))
+        assert handled == ["doc_a", "doc_a"]
+        assert order.stats()["collapsed"] == 1
+        assert answer.await_count == 1
+
+    asyncio.run(scenario())
+
+def _message(update_id: int, user_id: int = 1) -> Update:
+    user = {"id": user_id, "is_bot": False, "first_name": "test"}
+    return Update.model_validate({
+        "update_id": update_id,
+        "message": {"message_id": update_id, "date": 0, "text": "text", "from": user,
+                    "chat": {"id": user_id, "type": "private"}},
+    })
+
+def test_flood_is_throttled_before_user_queue():
+    async def scenario():
+        order = middlewares.UserOrderMiddleware()
+        throttle = middlewares.ThrottleMiddleware(rate=0.1, burst=3, handler_limits={})
+        dp = Dispatcher()
+        dp.update.outer_middleware(throttle)
+        dp.update.outer_middleware(order)
+        dp.message.middleware(throttle)
+        router = Router()
+        handled = []
+
+        @router.message()
+        async def on_message(message):
+            await asyncio.sleep(0.05)
+            handled.append(message.message_id)
+
+        dp.include_router(router)
+        with patch("aiogram.types.Message.answer", AsyncMock()) as answer:
+            await asyncio.gather(*(dp.feed_update(AsyncMock(), _message(i)) for i in range(10)))
+        assert handled == [0, 1, 2]
+        # Отклонённые апдейты не вставали в очередь пользователя
+        assert order.stats()["max_depth"] == 3
+        assert throttle.stats()["throttled"] == 7
+        assert answer.await_count == 1
+
+    asyncio.run(scenario())
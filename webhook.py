@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+from collections import deque
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+from config import (WEBHOOK_HOST, WEBHOOK_MAX_CONCURRENT, WEBHOOK_MAX_PENDING, WEBHOOK_PATH,
+                    WEBHOOK_PORT, WEBHOOK_SECRET, WEBHOOK_URL)
+
+# ---------- Приём апдейтов через webhook ----------
+# Telegram получает ответ сразу, апдейт обрабатывается в фоновой задаче.
+# Одновременно обрабатывается не больше WEBHOOK_MAX_CONCURRENT апдейтов;
+# если в очереди больше WEBHOOK_MAX_PENDING, отвечаем 503 и Telegram повторит доставку.
+WEBHOOK_DRAIN_TIMEOUT = 30          # секунд на завершение начатых апдейтов при остановке
+
+class WebhookHandler(SimpleRequestHandler):
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, secret_token: str = WEBHOOK_SECRET,
+                 max_concurrent: int = WEBHOOK_MAX_CONCURRENT, max_pending: int = WEBHOOK_MAX_PENDING, **data):
+        super().__init__(dispatcher, bot, handle_in_background=True, secret_token=secret_token, **data)
+        self.max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        # Метрики
+        self.accepted = 0
+        self.rejected = 0
+        self._wait_times = deque(maxlen=1000)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if not self.verify_secret(request.headers.get("X-Telegram-Bot-Api-Secret-Token", ""), self.bot):
+            self.rejected += 1
+            return web.Response(body="Unauthorized", status=401)
+        if len(self._background_feed_update_tasks) >= self.max_pending:
+            self.rejected += 1
+            return web.Response(status=503)
+        self.accepted += 1
+        return await self._handle_request_background(bot=self.bot, request=request)
+
+    async def _background_feed_update(self, bot: Bot, update: dict) -> None:
+        queued_at = time.perf_counter()
+        async with self._semaphore:
+            self._wait_times.append(time.perf_counter() - queued_at)
+            self._active += 1
+            try:
+                await super()._background_feed_update(bot, update)
+            except Exception as e:
+                logging.error(f"Ошибка обработки апдейта {update.get('update_id')}: {e}")
+            finally:
+                self._active -= 1
+
+    async def close(self) -> None:
+        # Даём начатым апдейтам завершиться, затем закрываем сессию бота
+        tasks = list(self._background_feed_update_tasks)
+        if tasks:
+            logging.info(f"Webhook: ожидание {len(tasks)} апдейтов перед остановкой")
+            await asyncio.wait(tasks, timeout=WEBHOOK_DRAIN_TIMEOUT)
+        await super().close()
+
+    def stats(self) -> dict:
+        waits = sorted(self._wait_times)
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "pending": len(self._background_feed_update_tasks),
+            "active": self._active,
+            "wait_ms_p95": waits[min(len(waits) - 1, int(0.95 * len(waits)))] * 1000 if waits else 0.0,
+        }
+
+def create_app(dispatcher: Dispatcher, bot: Bot, **handler_kwargs) -> tuple:
+    """aiohttp-приложение с обработчиком webhook; возвращает (app, handler)."""
+    app = web.Application()
+    handler = WebhookHandler(dispatcher, bot, **handler_kwargs)
+    handler.register(app, path=WEBHOOK_PATH)
+    setup_application(app, dispatcher, bot=bot)
+    return app, handler
+
+async def run(dispatcher: Dispatcher, bot: Bot):
+    """Запускает HTTP-сервер, регистрирует webhook в Telegram и работает до отмены."""
+    app, _ = create_app(dispatcher, bot)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        site = web.TCPSite(runner, WEBHOOK_HOST, WEBHOOK_PORT)
+        await site.start()
+        await bot.set_webhook(
+            WEBHOOK_URL,
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=dispatcher.resolve_used_update_types(),
+            max_connections=min(100, WEBHOOK_MAX_CONCURRENT),
+        )
+        logging.info(f"Webhook слушает {WEBHOOK_HOST}:{WEBHOOK_PORT}{WEBHOOK_PATH}")
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()